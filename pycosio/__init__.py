@@ -22,7 +22,7 @@ __licence__ = "Apache 2.0"
 
 # Adds names to public interface
 # Shadowing "open" built-in name is done to provides "pycosio.open" function
-from pycosio._core.functions_io import cos_open as open
+from pycosio._core.functions_io import cos_open as open, cos_mmap as mmap
 from pycosio._core.functions_os import (
     listdir, lstat, makedirs, mkdir, remove, rmdir, scandir, stat, unlink)
 from pycosio._core.functions_os_path import (
@@ -35,6 +35,9 @@ __all__ = list(sorted((
     # Standard library "io"
     'open',
 
+    # Standard library "mmap"
+    'mmap',
+
     # Standard library "os"
     'listdir', 'lstat', 'makedirs', 'mkdir', 'remove', 'rmdir', 'scandir',
     'stat', 'unlink',
@@ -54,4 +57,6 @@ for _name in __all__:
     locals()[_name].__module__ = __name__
 locals()['open'].__qualname__ = 'open'
 locals()['open'].__name__ = 'open'
+locals()['mmap'].__qualname__ = 'mmap'
+locals()['mmap'].__name__ = 'mmap'
 del _name
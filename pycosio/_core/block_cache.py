@@ -0,0 +1,102 @@
+# coding=utf-8
+"""LRU cache of buffered streams read buffers"""
+from collections import OrderedDict
+from threading import Lock
+
+
+class BlockCache:
+    """
+    Least recently used cache of read buffers.
+
+    A cache can be used by a single stream, or shared between many streams.
+
+    Args:
+        capacity (int): Maximum size in bytes of cached buffers.
+    """
+
+    def __init__(self, capacity):
+        self._capacity = capacity
+        self._size = 0
+        self._blocks = OrderedDict()
+        self._lock = Lock()
+
+    @property
+    def capacity(self):
+        """
+        Maximum size of cached buffers.
+
+        Returns:
+            int: Size in bytes.
+        """
+        return self._capacity
+
+    @property
+    def size(self):
+        """
+        Size of currently cached buffers.
+
+        Returns:
+            int: Size in bytes.
+        """
+        return self._size
+
+    def __contains__(self, key):
+        return key in self._blocks
+
+    def __len__(self):
+        return len(self._blocks)
+
+    def get(self, key):
+        """
+        Get a buffer from the cache.
+
+        Args:
+            key (hashable): Buffer key.
+
+        Returns:
+            bytes: Buffer, or None if not cached.
+        """
+        with self._lock:
+            try:
+                block = self._blocks.pop(key)
+            except KeyError:
+                return None
+
+            # Mark as most recently used
+            self._blocks[key] = block
+            return block
+
+    def put(self, key, block):
+        """
+        Put a buffer in the cache.
+
+        Least recently used buffers are evicted if capacity is exceeded.
+
+        Args:
+            key (hashable): Buffer key.
+            block (bytes): Buffer.
+        """
+        block_size = len(block)
+        if block_size > self._capacity:
+            return
+
+        with self._lock:
+            blocks = self._blocks
+            try:
+                self._size -= len(blocks.pop(key))
+            except KeyError:
+                pass
+
+            while self._size + block_size > self._capacity:
+                self._size -= len(blocks.popitem(last=False)[1])
+
+            blocks[key] = block
+            self._size += block_size
+
+    def clear(self):
+        """
+        Remove all buffers from the cache.
+        """
+        with self._lock:
+            self._blocks.clear()
+            self._size = 0
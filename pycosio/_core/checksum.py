@@ -0,0 +1,124 @@
+# coding=utf-8
+"""Data integrity checksums"""
+from base64 import b64decode, b64encode
+from binascii import hexlify, Error as _BinasciiError
+from hashlib import md5
+from re import compile
+
+from pycosio._core.exceptions import ObjectIntegrityError
+
+#: Pattern of an MD5 hex digest
+_MD5_HEX = compile(r'^[0-9a-fA-F]{32}$')
+
+
+def content_md5(buffer):
+    """
+    Returns the "Content-MD5" HTTP header value of a buffer.
+
+    Args:
+        buffer (bytes-like object): Buffer.
+
+    Returns:
+        str: Base64 encoded MD5 digest.
+    """
+    return b64encode(md5(buffer).digest()).decode()
+
+
+def md5_from_content_md5(value):
+    """
+    Returns the MD5 hex digest from a "Content-MD5" HTTP header value.
+
+    Args:
+        value (str): Base64 encoded MD5 digest.
+
+    Returns:
+        str: MD5 hex digest, or None if the value is not a valid MD5.
+    """
+    try:
+        digest = b64decode(value)
+    except (_BinasciiError, TypeError, ValueError):
+        return None
+    if len(digest) != 16:
+        return None
+    return hexlify(digest).decode()
+
+
+def md5_from_etag(value):
+    """
+    Returns the MD5 hex digest from an ETag.
+
+    Only ETags of objects uploaded in a single part are MD5 digests.
+
+    Args:
+        value (str): ETag, quoted or not.
+
+    Returns:
+        str: MD5 hex digest, or None if the ETag is not a MD5.
+    """
+    value = value.strip('"')
+    if _MD5_HEX.match(value):
+        return value.lower()
+    return None
+
+
+class StreamingMD5:
+    """
+    MD5 of an object computed incrementally while its content is read
+    sequentially.
+
+    Verification is abandoned if the content is not read sequentially from
+    its start.
+
+    Args:
+        expected (str): Expected MD5 hex digest of the object.
+        size (int): Object size.
+        name (str): Object name used in errors.
+    """
+
+    def __init__(self, expected, size, name):
+        self._expected = expected.lower()
+        self._size = size
+        self._name = name
+        self._hash = md5()
+        self._seek = 0
+
+    @property
+    def active(self):
+        """
+        Returns True if verification is still in progress.
+
+        Returns:
+            bool: True if active.
+        """
+        return self._hash is not None
+
+    def update(self, start, data):
+        """
+        Update the MD5 with a part of the object content.
+
+        Args:
+            start (int): Position of the data in the object.
+            data (bytes-like object): Data.
+
+        Raises:
+            pycosio._core.exceptions.ObjectIntegrityError: The MD5 of the full
+                object content does not match the expected one.
+        """
+        if self._hash is None:
+            return
+        elif start != self._seek:
+            # Not sequential: Can't verify
+            self._hash = None
+            return
+
+        self._hash.update(data)
+        self._seek += len(data)
+        if self._seek < self._size:
+            return
+
+        digest = self._hash.hexdigest()
+        self._hash = None
+        if digest != self._expected:
+            raise ObjectIntegrityError(
+                'MD5 mismatch for "%s": %s != %s' % (
+                    self._name, digest, self._expected))
@@ -0,0 +1,221 @@
+# coding=utf-8
+"""Persistent cache of objects chunks on local disk"""
+from hashlib import sha256
+from os import rename, utime
+from os.path import join
+from threading import Lock
+from uuid import uuid4
+
+from pycosio._core.compat import fsdecode, makedirs, remove, scandir
+
+
+class DiskCache:
+    """
+    Persistent cache of objects chunks on local disk.
+
+    Chunks are identified by object storage, path, size and version (ETag or
+    modification time), and are evicted by least recent use once the cache
+    size exceeds its maximum size.
+
+    The cache directory can be safely used by many threads and processes at
+    once.
+
+    Args:
+        path (path-like object): Cache directory.
+        max_size (int): Maximum size in bytes of cached chunks.
+        chunk_size (int): Size in bytes of cached chunks.
+    """
+
+    #: Default max_size value in bytes (Default to 10GB)
+    DEFAULT_MAX_SIZE = 10737418240
+
+    #: Default chunk_size value in bytes (Default to 8MB)
+    DEFAULT_CHUNK_SIZE = 8388608
+
+    def __init__(self, path, max_size=None, chunk_size=None):
+        self._path = fsdecode(path)
+        self._max_size = max_size or self.DEFAULT_MAX_SIZE
+        self._chunk_size = chunk_size or self.DEFAULT_CHUNK_SIZE
+        makedirs(self._path, exist_ok=True)
+
+        # Size of chunks written since last eviction check.
+        # Initialized to check eviction on first write.
+        self._evict_lock = Lock()
+        self._evict_threshold = self._max_size // 10
+        self._written = self._evict_threshold
+
+    @property
+    def path(self):
+        """
+        Cache directory.
+
+        Returns:
+            str: Path.
+        """
+        return self._path
+
+    def read_range(self, read_range, key, size, start, end=0):
+        """
+        Read a range of bytes of an object using the cache.
+
+        Args:
+            read_range (callable): Function used to read a range of bytes of
+                the object on cache miss, with the same signature as
+                "ObjectRawIOBase._read_range".
+            key (tuple of str): Object identity.
+            size (int): Object size.
+            start (int): Start stream position.
+            end (int): End stream position.
+                0 To not specify end.
+
+        Returns:
+            bytes: bytes read
+        """
+        if not end or end > size:
+            end = size
+        if start >= end:
+            return bytes()
+
+        chunk_size = self._chunk_size
+        first_index = start // chunk_size
+        chunks = [self._get_chunk(read_range, key, size, index)
+                  for index in range(first_index, (end - 1) // chunk_size + 1)]
+        data = chunks[0] if len(chunks) == 1 else b''.join(chunks)
+
+        offset = first_index * chunk_size
+        return data[start - offset:end - offset]
+
+    def _get_chunk(self, read_range, key, size, index):
+        """
+        Get a chunk from the cache, or read and cache it.
+
+        Args:
+            read_range (callable): Function used to read a range of bytes.
+            key (tuple of str): Object identity.
+            size (int): Object size.
+            index (int): Chunk index.
+
+        Returns:
+            bytes: Chunk content.
+        """
+        start = index * self._chunk_size
+        chunk_size = min(start + self._chunk_size, size) - start
+        path = self._chunk_path(key, index)
+
+        # Get chunk from cache
+        try:
+            with open(path, 'rb') as chunk_file:
+                chunk = chunk_file.read()
+        except (IOError, OSError):
+            chunk = None
+
+        if chunk is not None and len(chunk) == chunk_size:
+            # Mark as recently used
+            try:
+                utime(path, None)
+            except OSError:
+                # Evicted by another process in the meantime
+                pass
+            return chunk
+
+        # Read chunk and put it in cache
+        chunk = read_range(start, start + chunk_size)
+        if len(chunk) == chunk_size:
+            self._put_chunk(path, chunk)
+        return chunk
+
+    def _put_chunk(self, path, chunk):
+        """
+        Write a chunk in the cache.
+
+        The chunk is written in a temporary file, then atomically moved to its
+        final path to never expose partially written chunks.
+
+        Args:
+            path (str): Chunk path.
+            chunk (bytes): Chunk content.
+        """
+        tmp_path = '%s.%s.tmp' % (path, uuid4().hex)
+        try:
+            makedirs(path.rsplit('/', 1)[0], exist_ok=True)
+            with open(tmp_path, 'wb') as chunk_file:
+                chunk_file.write(chunk)
+            rename(tmp_path, path)
+
+        except (IOError, OSError):
+            # Cache is best effort: Chunk may be already cached by another
+            # process, or disk may be full.
+            try:
+                remove(tmp_path)
+            except OSError:
+                pass
+            return
+
+        with self._evict_lock:
+            self._written += len(chunk)
+            if self._written < self._evict_threshold:
+                return
+            self._written = 0
+        self.evict()
+
+    def _chunk_path(self, key, index):
+        """
+        Returns the path of a chunk in the cache.
+
+        Args:
+            key (tuple of str): Object identity.
+            index (int): Chunk index.
+
+        Returns:
+            str: Chunk path.
+        """
+        key_hash = sha256(repr(key).encode('utf-8')).hexdigest()
+        return '/'.join((self._path, key_hash[:2], '%s.%d.%d' % (
+            key_hash, self._chunk_size, index)))
+
+    def _list_chunks(self):
+        """
+        List cached chunks.
+
+        Returns:
+            generator of tuple: last access time float, size int, path str
+        """
+        for directory in scandir(self._path):
+            if not directory.is_dir():
+                continue
+            for entry in scandir(directory.path):
+                if entry.name.endswith('.tmp'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                yield stat.st_mtime, stat.st_size, join(
+                    directory.path, entry.name)
+
+    def evict(self):
+        """
+        Remove least recently used chunks until the cache size is lower than
+        its maximum size.
+        """
+        chunks = sorted(self._list_chunks())
+        size = sum(chunk[1] for chunk in chunks)
+        for _, chunk_size, path in chunks:
+            if size <= self._max_size:
+                break
+            try:
+                remove(path)
+            except OSError:
+                # Already removed by another process
+                pass
+            size -= chunk_size
+
+    def clear(self):
+        """
+        Remove all chunks from the cache.
+        """
+        for _, _, path in self._list_chunks():
+            try:
+                remove(path)
+            except OSError:
+                continue
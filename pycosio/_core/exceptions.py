@@ -26,6 +26,10 @@ class ObjectExistsError(ObjectException):
     """Reraised as "FileExistsError" by handle_os_exceptions"""
 
 
+class ObjectIntegrityError(ObjectException):
+    """Reraised as "OSError" by handle_os_exceptions"""
+
+
 _OS_EXCEPTIONS = {
     ObjectNotFoundError: file_not_found_error,
     ObjectPermissionError: permission_error,
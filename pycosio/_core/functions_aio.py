@@ -0,0 +1,370 @@
+# coding=utf-8
+"""Cloud object compatibles asyncio functions
+
+Requires Python 3.5 or more."""
+from asyncio import wrap_future
+from atexit import register
+from io import open as io_open
+from os import SEEK_SET
+
+from pycosio._core.compat import fsdecode
+from pycosio._core.functions_core import is_storage
+from pycosio._core.functions_os import listdir as cos_listdir
+from pycosio._core.functions_os import scandir as cos_scandir
+from pycosio._core.functions_os import stat as cos_stat
+from pycosio._core.storage_manager import get_instance
+from pycosio._core.workers import SharedPoolExecutor, SharedWorkerPool
+
+#: Pool running blocking operations of asyncio functions. Separated from the
+#: shared worker pool, so parallel transfers started by these operations run
+#: on the shared worker pool instead of its smaller nested tasks pool.
+_POOL = SharedWorkerPool(nested=False)
+register(_POOL.shutdown)
+
+#: Executor running blocking operations, shared by all asyncio functions
+_EXECUTOR = SharedPoolExecutor(pool=_POOL)
+
+
+def set_max_workers(max_workers):
+    """
+    Set the maximum number of blocking operations running concurrently for
+    all asyncio functions.
+
+    Each running operation uses a thread of the asyncio pool, other operations
+    wait for a completed one.
+
+    Args:
+        max_workers (int): Maximum number of operations. None to use the
+            default value: "PYCOSIO_MAX_WORKERS" environment variable value if
+            defined, or 5 times the number of CPU.
+    """
+    _POOL.set_max_workers(max_workers)
+    _EXECUTOR.set_max_workers(max_workers)
+
+
+def _run(function, *args, **kwargs):
+    """
+    Run a blocking function on the asyncio pool.
+
+    Args:
+        function (callable): Function.
+        args, kwargs: Function arguments.
+
+    Returns:
+        asyncio.Future: Function result future.
+    """
+    return wrap_future(_EXECUTOR.submit(function, *args, **kwargs))
+
+
+def cos_open(file, mode='rb', storage=None, storage_parameters=None,
+             unsecure=None, **kwargs):
+    """
+    Open file and return a corresponding asynchronous file object.
+
+    Asynchronous equivalent to "pycosio.open" in binary mode, to use with
+    "async with". Blocking operations run on the asyncio pool, so many
+    files can be read or written concurrently with a bounded number of
+    threads. Parallel transfers of each operation run on the shared worker
+    pool.
+
+    Args:
+        file (path-like object): File path or object URL.
+        mode (str): mode in which the file is opened (default to 'rb').
+            Only binary modes are supported.
+        storage (str): Storage name.
+        storage_parameters (dict): Storage configuration parameters.
+            Generally, client configuration and credentials.
+        unsecure (bool): If True, disables TLS/SSL to improves
+            transfer performance. But makes connection unsecure.
+            Default to False.
+        kwargs: Other arguments to pass to opened object.
+            Note that theses arguments may not be compatible with
+            all kind of file and storage.
+
+    Returns:
+        AsyncObjectIO: opened file.
+    """
+    if 't' in mode:
+        raise ValueError('Text mode not supported')
+    mode = mode.replace('b', '')
+    return AsyncObjectIO(
+        fsdecode(file).replace('\\', '/'), mode=mode, storage=storage,
+        storage_parameters=storage_parameters, unsecure=unsecure, **kwargs)
+
+
+class AsyncObjectIO:
+    """
+    Asynchronous binary file object.
+
+    The file is opened when entering the "async with" statement.
+
+    Args:
+        name (str): File path or object URL.
+        mode (str): The mode can be 'r', 'w', 'a', 'x'
+            for reading (default), writing or appending
+        storage (str): Storage name.
+        storage_parameters (dict): Storage configuration parameters.
+            Generally, client configuration and credentials.
+        unsecure (bool): If True, disables TLS/SSL to improves
+            transfer performance. But makes connection unsecure.
+        kwargs: Other arguments to pass to opened object.
+    """
+
+    def __init__(self, name, mode='r', storage=None, storage_parameters=None,
+                 unsecure=None, **kwargs):
+        self._name = name
+        self._mode = mode
+        self._open_kwargs = dict(
+            storage=storage, storage_parameters=storage_parameters,
+            unsecure=unsecure, **kwargs)
+        self._stream = None
+
+    async def __aenter__(self):
+        self._stream = await _run(self._open)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def _open(self):
+        """
+        Open the underlying blocking stream.
+
+        Returns:
+            file-like object: Raw stream for objects, or local file.
+        """
+        kwargs = self._open_kwargs
+        if is_storage(self._name, kwargs['storage']):
+            return get_instance(
+                name=self._name, cls='raw', mode=self._mode, **kwargs)
+
+        kwargs = {key: value for key, value in kwargs.items()
+                  if key not in ('storage', 'storage_parameters', 'unsecure')}
+        return io_open(self._name, self._mode + 'b', **kwargs)
+
+    @property
+    def name(self):
+        """
+        The file name.
+
+        Returns:
+            str: Name.
+        """
+        return self._name
+
+    @property
+    def mode(self):
+        """
+        The mode.
+
+        Returns:
+            str: Mode.
+        """
+        return self._mode
+
+    @property
+    def closed(self):
+        """
+        True if the stream is closed.
+
+        Returns:
+            bool: True if closed.
+        """
+        return self._stream is None or self._stream.closed
+
+    @property
+    def raw(self):
+        """
+        The underlying blocking stream.
+
+        Returns:
+            file-like object: Stream.
+        """
+        return self._stream
+
+    def _get_stream(self):
+        """
+        Returns the opened stream.
+
+        Returns:
+            file-like object: Stream.
+        """
+        if self._stream is None:
+            raise ValueError('I/O operation on not opened file.')
+        return self._stream
+
+    async def read(self, size=-1):
+        """
+        Read and return up to size bytes.
+
+        Args:
+            size (int): Number of bytes to read. -1 to read the
+                stream until end.
+
+        Returns:
+            bytes: Object content
+        """
+        return await _run(self._get_stream().read, size)
+
+    async def readinto(self, b):
+        """
+        Read bytes into a pre-allocated, writable bytes-like object b,
+        and return the number of bytes read.
+
+        Args:
+            b (bytes-like object): buffer.
+
+        Returns:
+            int: number of bytes read
+        """
+        return await _run(self._get_stream().readinto, b)
+
+    async def write(self, b):
+        """
+        Write the given bytes-like object, b, to the underlying raw stream,
+        and return the number of bytes written.
+
+        Args:
+            b (bytes-like object): Bytes to write.
+
+        Returns:
+            int: The number of bytes written.
+        """
+        return await _run(self._get_stream().write, b)
+
+    async def flush(self):
+        """
+        Flush the write buffers of the stream if applicable.
+        """
+        await _run(self._get_stream().flush)
+
+    async def close(self):
+        """
+        Flush the write buffers of the stream if applicable and
+        close the object.
+        """
+        if self._stream is not None and not self._stream.closed:
+            await _run(self._stream.close)
+
+    def seek(self, offset, whence=SEEK_SET):
+        """
+        Change the stream position to the given byte offset.
+
+        Args:
+            offset (int): Offset is interpreted relative to the position
+                indicated by whence.
+            whence (int): The default value for whence is SEEK_SET.
+
+        Returns:
+            int: The new absolute position.
+        """
+        return self._get_stream().seek(offset, whence)
+
+    def tell(self):
+        """
+        Return the current stream position.
+
+        Returns:
+            int: Stream position.
+        """
+        return self._get_stream().tell()
+
+
+async def listdir(path='.'):
+    """
+    Return a list containing the names of the entries in the directory given by
+    path.
+
+    Asynchronous equivalent to "pycosio.listdir".
+
+    Args:
+        path (path-like object): Path or URL.
+
+    Returns:
+        list of str: Entries names.
+    """
+    return await _run(cos_listdir, path)
+
+
+async def stat(path, dir_fd=None, follow_symlinks=True):
+    """
+    Get the status of a file or a file descriptor.
+    Perform the equivalent of a "stat()" system call on the given path.
+
+    Asynchronous equivalent to "pycosio.stat".
+
+    Args:
+        path (path-like object): Path or URL.
+        dir_fd: directory descriptors;
+            see the os.rmdir() description for how it is interpreted.
+            Not supported on cloud storage objects.
+        follow_symlinks (bool): Follow symlinks.
+            Not supported on cloud storage objects.
+
+    Returns:
+        os.stat_result: stat result.
+    """
+    return await _run(
+        cos_stat, path, dir_fd=dir_fd, follow_symlinks=follow_symlinks)
+
+
+def scandir(path='.'):
+    """
+    Return an asynchronous iterator of os.DirEntry objects corresponding to
+    the entries in the directory given by path.
+
+    Asynchronous equivalent to "pycosio.scandir", to use with "async for".
+
+    Args:
+        path (path-like object): Path or URL.
+
+    Returns:
+        AsyncScandirIterator: Entries information.
+    """
+    return AsyncScandirIterator(path)
+
+
+class AsyncScandirIterator:
+    """
+    Asynchronous iterator of os.DirEntry objects.
+
+    Entries are listed in batches on the asyncio pool.
+
+    Args:
+        path (path-like object): Path or URL.
+    """
+
+    #: Number of entries listed at once
+    BATCH_SIZE = 1000
+
+    def __init__(self, path):
+        self._path = path
+        self._iterator = None
+        self._entries = []
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._entries:
+            if self._iterator is None:
+                self._iterator = await _run(cos_scandir, self._path)
+            self._entries = await _run(self._next_entries)
+            if not self._entries:
+                raise StopAsyncIteration
+        return self._entries.pop()
+
+    def _next_entries(self):
+        """
+        Returns next entries of the iterator.
+
+        Returns:
+            list of os.DirEntry: Entries, in reversed order.
+        """
+        entries = []
+        for entry in self._iterator:
+            entries.append(entry)
+            if len(entries) >= self.BATCH_SIZE:
+                break
+        entries.reverse()
+        return entries
@@ -1,9 +1,14 @@
 # coding=utf-8
 """Cloud object compatibles standard library 'io' equivalent functions"""
 from contextlib import contextmanager
-from io import open as io_open, TextIOWrapper
+from io import open as io_open, TextIOWrapper, BufferedReader, BufferedWriter
+from mmap import mmap, ACCESS_READ
 
 from pycosio._core.compat import fsdecode
+from pycosio._core.io_base_buffered import ObjectBufferedIOBase
+from pycosio._core.io_base_raw import ObjectRawIOBase
+from pycosio._core.io_compression import CompressedRawIO, get_codec
+from pycosio._core.io_mmap import ObjectMemoryMap
 from pycosio._core.storage_manager import get_instance
 from pycosio._core.functions_core import is_storage
 
@@ -11,7 +16,7 @@ from pycosio._core.functions_core import is_storage
 @contextmanager
 def cos_open(file, mode='r', buffering=-1, encoding=None, errors=None,
              newline=None, storage=None, storage_parameters=None, unsecure=None,
-             **kwargs):
+             compression=None, **kwargs):
     """
     Open file and return a corresponding file object.
 
@@ -48,6 +53,10 @@ def cos_open(file, mode='r', buffering=-1, encoding=None, errors=None,
         unsecure (bool): If True, disables TLS/SSL to improves
             transfer performance. But makes connection unsecure.
             Default to False.
+        compression (str): If specified, the file content is transparently
+            compressed or decompressed with this compression in a background
+            thread. Can be "gzip", "bz2", "xz", or "zstd" if the "zstandard"
+            package is installed. Not supported with the "+" mode.
         kwargs: Other arguments to pass to opened object.
             Note that theses arguments may not be compatible with
             all kind of file and storage.
@@ -59,6 +68,21 @@ def cos_open(file, mode='r', buffering=-1, encoding=None, errors=None,
         OSError: If the file cannot be opened.
         FileExistsError: File open in 'x' mode already exists.
     """
+    # Handles compressed files
+    if compression:
+        if '+' in mode:
+            raise ValueError('"+" mode not supported with compression')
+        get_codec(compression)
+        with cos_open(file, mode.replace('t', '').replace('b', '') + 'b',
+                      buffering, storage=storage,
+                      storage_parameters=storage_parameters,
+                      unsecure=unsecure, **kwargs) as stream:
+            with _compression_io_wrapper(stream, mode, compression) as wrapped:
+                with _text_io_wrapper(wrapped, mode, encoding, errors,
+                                      newline) as text_wrapped:
+                    yield text_wrapped
+        return
+
     # Handles file-like objects:
     if hasattr(file, 'read'):
         with _text_io_wrapper(file, mode, encoding, errors, newline) as wrapped:
@@ -85,6 +109,76 @@ def cos_open(file, mode='r', buffering=-1, encoding=None, errors=None,
             yield stream
 
 
+def cos_mmap(file, storage=None, storage_parameters=None, unsecure=None,
+             page_size=None, cache_size=None, cache=None, **kwargs):
+    """
+    Return a read-only memory map of the file.
+
+    Equivalent to "mmap.mmap" with "access=mmap.ACCESS_READ".
+
+    On cloud storage objects, pages are lazily read when accessed, so only
+    accessed parts of the object are downloaded. File can also be an opened
+    cloud storage object stream, in this case this stream is not closed with
+    the memory map.
+
+    Args:
+        file (path-like object or file-like object): File path, object URL or
+            opened cloud storage object stream.
+        storage (str): Storage name.
+        storage_parameters (dict): Storage configuration parameters.
+            Generally, client configuration and credentials.
+        unsecure (bool): If True, disables TLS/SSL to improves
+            transfer performance. But makes connection unsecure.
+            Default to False.
+        page_size (int): Size in bytes of pages read from cloud storage
+            objects.
+        cache_size (int): Size in bytes of the pages cache of cloud storage
+            objects.
+        cache (pycosio.io.BlockCache): Existing pages cache to use instead of
+            "cache_size". Allows to share a cache between memory maps.
+        kwargs: Other arguments to pass to opened object.
+
+    Returns:
+        mmap.mmap or pycosio.io.ObjectMemoryMap: Memory map.
+    """
+    map_kwargs = dict(page_size=page_size, cache_size=cache_size, cache=cache)
+
+    # Handles cloud storage streams
+    if isinstance(file, ObjectBufferedIOBase):
+        file = file.raw
+    if isinstance(file, ObjectRawIOBase):
+        return ObjectMemoryMap(file, close_raw=False, **map_kwargs)
+
+    # Handles path-like objects
+    file = fsdecode(file).replace('\\', '/')
+
+    # Storage object
+    if is_storage(file, storage):
+        return ObjectMemoryMap(get_instance(
+            name=file, cls='raw', storage=storage,
+            storage_parameters=storage_parameters, mode='r',
+            unsecure=unsecure, **kwargs), **map_kwargs)
+
+    # Local file: Redirect to "mmap.mmap"
+    with io_open(file, 'rb') as stream:
+        return mmap(stream.fileno(), 0, access=ACCESS_READ)
+
+
+@contextmanager
+def _compression_io_wrapper(stream, mode, compression):
+    """Wrap a compressed binary stream to a buffered uncompressed stream.
+
+    Args:
+        stream (file-like object): Compressed binary stream.
+        mode (str): Open mode.
+        compression (str): Compression.
+    """
+    raw = CompressedRawIO(stream, mode=mode, compression=compression)
+    buffered_class = BufferedReader if raw.readable() else BufferedWriter
+    with buffered_class(raw, CompressedRawIO.CHUNK_SIZE) as buffered:
+        yield buffered
+
+
 @contextmanager
 def _text_io_wrapper(stream, mode, encoding, errors, newline):
     """Wrap a binary stream to Text stream.
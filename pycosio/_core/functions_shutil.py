@@ -39,9 +39,11 @@ def _copy(src, dst, src_is_storage, dst_is_storage):
 
             # Tries to copy
             try:
-                return system_dst.copy(src, dst)
+                system_dst.copy(src, dst)
             except (UnsupportedOperation, ObjectException):
                 pass
+            else:
+                return system_dst.invalidate_header(dst)
 
         # Copy from compatible storage using "copy_from_<src_storage>" or
         # "copy_to_<src_storage>" method if any
@@ -50,10 +52,11 @@ def _copy(src, dst, src_is_storage, dst_is_storage):
                 (system_src, system_dst, 'copy_to_%s')):
             if hasattr(caller, method % called.storage):
                 try:
-                    return getattr(caller, method % called.storage)(
+                    getattr(caller, method % called.storage)(
                         src, dst, called)
                 except (UnsupportedOperation, ObjectException):
                     continue
+                return system_dst.invalidate_header(dst)
 
     # At least one storage object: copies streams
     with cos_open(src, 'rb') as fsrc:
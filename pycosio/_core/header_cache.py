@@ -0,0 +1,157 @@
+# coding=utf-8
+"""Cache of objects headers"""
+from collections import OrderedDict
+from threading import Lock
+
+try:
+    from time import monotonic as _clock
+except ImportError:
+    # Python 2
+    from time import time as _clock
+
+
+class HeaderCache:
+    """
+    Least recently used cache of objects headers, with entries expiring after
+    a time to live.
+
+    Entries are keyed by storage client arguments of objects. Partial entries
+    (Like headers built from listing results) are only returned to callers
+    accepting them.
+
+    Args:
+        ttl (float): Time to live of entries in seconds.
+            Default to "DEFAULT_TTL".
+        max_entries (int): Maximum number of entries.
+            Default to "DEFAULT_MAX_ENTRIES".
+    """
+
+    #: Default ttl value in seconds
+    DEFAULT_TTL = 10.0
+
+    #: Default max_entries value
+    DEFAULT_MAX_ENTRIES = 10000
+
+    def __init__(self, ttl=None, max_entries=None):
+        self._ttl = self.DEFAULT_TTL if ttl is None else ttl
+        self._max_entries = max_entries or self.DEFAULT_MAX_ENTRIES
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    @property
+    def ttl(self):
+        """
+        Time to live of entries.
+
+        Returns:
+            float: Time to live in seconds.
+        """
+        return self._ttl
+
+    @property
+    def max_entries(self):
+        """
+        Maximum number of entries.
+
+        Returns:
+            int: Number of entries.
+        """
+        return self._max_entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    @staticmethod
+    def _key(client_kwargs):
+        """
+        Returns the cache key of an object.
+
+        Args:
+            client_kwargs (dict): Client arguments.
+
+        Returns:
+            tuple: Key, or None if client arguments are not hashable.
+        """
+        key = tuple(sorted(client_kwargs.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, client_kwargs, partial=True):
+        """
+        Get an object header.
+
+        Args:
+            client_kwargs (dict): Client arguments.
+            partial (bool): If False, ignore partial headers.
+
+        Returns:
+            dict: Copy of the header, or None if not cached or expired.
+        """
+        key = self._key(client_kwargs)
+        if key is None:
+            return None
+
+        with self._lock:
+            try:
+                entry = self._entries[key]
+            except KeyError:
+                return None
+
+            expiry, header, is_partial = entry
+            if expiry < _clock():
+                del self._entries[key]
+                return None
+            elif is_partial and not partial:
+                return None
+
+            # Mark as most recently used
+            del self._entries[key]
+            self._entries[key] = entry
+
+        return header.copy()
+
+    def set(self, client_kwargs, header, partial=False):
+        """
+        Set an object header.
+
+        Args:
+            client_kwargs (dict): Client arguments.
+            header (dict): Object header.
+            partial (bool): If True, the header does not contain all values
+                returned by a "head" request.
+        """
+        key = self._key(client_kwargs)
+        if key is None:
+            return
+
+        entry = (_clock() + self._ttl, header.copy(), partial)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = entry
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, client_kwargs):
+        """
+        Remove an object header.
+
+        Args:
+            client_kwargs (dict): Client arguments.
+        """
+        key = self._key(client_kwargs)
+        if key is None:
+            return
+
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """
+        Remove all headers.
+        """
+        with self._lock:
+            self._entries.clear()
@@ -1,11 +1,13 @@
 # coding=utf-8
 """Cloud storage abstract IO Base class"""
 from functools import wraps
-from io import IOBase, UnsupportedOperation
+from io import IOBase, RawIOBase, UnsupportedOperation
+from os import SEEK_CUR, SEEK_END, SEEK_SET
 from threading import Lock
 from itertools import chain
 
-from pycosio._core.compat import fsdecode, ThreadPoolExecutor
+from pycosio._core.compat import fsdecode
+from pycosio._core.workers import SharedPoolExecutor
 
 
 class ObjectIOBase(IOBase):
@@ -117,6 +119,112 @@ class ObjectIOBase(IOBase):
         return self._writable
 
 
+class MemoryViewIO(RawIOBase):
+    """
+    Read-only file-like object over a bytes-like object.
+
+    Used as request body by storage clients to upload a buffer without first
+    copying it entirely in a new bytes object.
+
+    Args:
+        buffer (bytes-like object): Content.
+    """
+
+    def __init__(self, buffer):
+        RawIOBase.__init__(self)
+        self._buffer = memoryview(buffer)
+        self._size = len(self._buffer)
+        self._seek = 0
+
+    def __len__(self):
+        return self._size
+
+    def readable(self):
+        """
+        Return True if the stream can be read from.
+
+        Returns:
+            bool: Supports reading.
+        """
+        return True
+
+    def seekable(self):
+        """
+        Return True if the stream supports random access.
+
+        Returns:
+            bool: Supports random access.
+        """
+        return True
+
+    def read(self, size=-1):
+        """
+        Read and return up to size bytes.
+
+        Args:
+            size (int): Number of bytes to read. -1 to read until the end.
+
+        Returns:
+            bytes: Bytes read.
+        """
+        start = self._seek
+        if size is None or size < 0:
+            end = self._size
+        else:
+            end = min(start + size, self._size)
+        self._seek = max(start, end)
+        return self._buffer[start:end].tobytes()
+
+    def readinto(self, b):
+        """
+        Read bytes into a pre-allocated, writable bytes-like object b.
+
+        Args:
+            b (bytes-like object): buffer.
+
+        Returns:
+            int: number of bytes read
+        """
+        start = self._seek
+        data = self._buffer[start:start + len(b)]
+        size = len(data)
+        memoryview(b)[:size] = data
+        self._seek = start + size
+        return size
+
+    def seek(self, offset, whence=SEEK_SET):
+        """
+        Change the stream position to the given byte offset.
+
+        Args:
+            offset (int): Offset is interpreted relative to the position
+                indicated by whence.
+            whence (int): SEEK_SET, SEEK_CUR or SEEK_END.
+
+        Returns:
+            int: The new absolute position.
+        """
+        if whence == SEEK_CUR:
+            offset += self._seek
+        elif whence == SEEK_END:
+            offset += self._size
+        elif whence != SEEK_SET:
+            raise ValueError('Unsupported whence: %s' % whence)
+        if offset < 0:
+            raise ValueError('Negative seek position %s' % offset)
+        self._seek = offset
+        return offset
+
+    def tell(self):
+        """
+        Return the current stream position.
+
+        Returns:
+            int: Stream position.
+        """
+        return self._seek
+
+
 def memoizedmethod(method):
     """
     Decorator that caches method result.
@@ -154,8 +262,12 @@ class WorkerPoolBase:
     """
     Base class that handle a worker pool.
 
+    Tasks run on the pool shared by the whole process
+    (See "PYCOSIO_MAX_WORKERS" environment variable).
+
     Args:
-        max_workers (int): Maximum number of workers.
+        max_workers (int): Maximum number of tasks running concurrently for
+            this instance.
     """
 
     def __init__(self, max_workers=None):
@@ -169,7 +281,7 @@ class WorkerPoolBase:
         Returns:
             concurrent.futures.Executor: Executor pool"""
         # Lazy instantiate workers pool on first call
-        return ThreadPoolExecutor(max_workers=self._workers_count)
+        return SharedPoolExecutor(max_workers=self._workers_count)
 
     def _generate_async(self, generator):
         """
@@ -201,3 +313,40 @@ class WorkerPoolBase:
                 return
 
         return chain(get_first_element(), generator)
+
+    def _generate_pages(self, request_page, prefetch=True):
+        """
+        Generate pages of a paginated request, requesting the next page as a
+        background task while the current page is processed.
+
+        Args:
+            request_page (callable): Function taking the marker of the page to
+                request (None for the first page) and returning a tuple of
+                page content and the marker of the next page (None if last
+                page).
+            prefetch (bool): If False, requests pages only when required.
+
+        Returns:
+            generator: Pages contents.
+        """
+        future = None
+        try:
+            page, marker = request_page(None)
+            while True:
+                if marker is None:
+                    future = None
+                elif prefetch:
+                    future = self._workers.submit(request_page, marker)
+
+                yield page
+
+                if marker is None:
+                    return
+                elif future is None:
+                    page, marker = request_page(marker)
+                else:
+                    page, marker = future.result()
+        finally:
+            # Do not request the next page if the generator is closed
+            if future is not None:
+                future.cancel()
@@ -3,16 +3,21 @@
 from __future__ import division  # Python 2:  Enable "type(int / int) == float"
 
 from abc import abstractmethod
-from concurrent.futures import as_completed
+from concurrent.futures import Future, as_completed, wait
+from functools import partial
 from io import BufferedIOBase, UnsupportedOperation
 from math import ceil
 from os import SEEK_SET
-from threading import Lock
-from time import sleep
+from threading import Condition
+from time import time
 
+from pycosio._core.block_cache import BlockCache
+from pycosio._core.checksum import StreamingMD5
 from pycosio._core.io_base import ObjectIOBase, WorkerPoolBase
 from pycosio._core.io_base_raw import ObjectRawIOBase
 from pycosio._core.exceptions import handle_os_exceptions
+from pycosio._core.memory import BUFFER_POOL, MEMORY_BUDGET
+from pycosio._core.tuning import AutoTuner
 
 
 class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
@@ -21,13 +26,38 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
 
     Args:
         name (path-like object): URL or path to the file which will be opened.
-        mode (str): The mode can be 'r' (default), 'w'.
-            for reading (default) or writing
+        mode (str): The mode can be 'r', 'w', 'a'
+            for reading (default), writing or appending
         buffer_size (int): The size of buffer.
         max_buffers (int): The maximum number of buffers to preload in read mode
-            or awaiting flush in write mode. 0 for no limit.
-        max_workers (int): The maximum number of threads that can be used to
-            execute the given calls.
+            or awaiting flush in write mode. 0 for no limit in write mode, and
+            "MAXIMUM_READ_AHEAD" in read mode.
+            In read mode, the preload window starts small and grows up to this
+            value while the stream is read sequentially.
+            Buffers are also limited by the process-wide memory budget
+            (See "pycosio.mount").
+        max_workers (int): The maximum number of threads of the shared worker
+            pool that can be used concurrently by this stream.
+        cache_size (int): In read mode, size in bytes of the LRU cache of
+            buffers already read or dropped on seek. 0 for no cache.
+        cache (pycosio.io.BlockCache): In read mode, existing cache to use
+            instead of "cache_size". Allows to share a cache between streams.
+        streaming (bool): In read mode, if True, buffers read sequentially
+            are pulled from a single streaming request instead of a range
+            request per buffer. Range requests are used again after a seek
+            until reading is sequential. Ignored if the storage does not
+            support streaming requests.
+        tuner (pycosio.io.AutoTuner): Tuner measuring requests of this stream.
+            If "buffer_size" or "max_workers" are not specified, they are
+            tuned from previous measures, and concurrency is also adjusted
+            while the stream is used. True to use a new tuner.
+            Default to the tuner of the mounted storage if any
+            (See "pycosio.mount").
+        checksum (bool): If True, verify data integrity with checksums when
+            supported by the storage. In write mode, parts are uploaded with
+            their checksum. In read mode, the object checksum is verified
+            while reading it sequentially from its start, and ranges are
+            verified if the storage returns ranges checksums.
         storage_parameters (dict): Storage configuration parameters.
             Generally, client configuration and credentials.
         unsecure (bool): If True, disables TLS/SSL to improves
@@ -36,6 +66,12 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
     # Raw I/O class
     _RAW_CLASS = ObjectRawIOBase
 
+    # Memory budget used by buffers
+    _MEMORY_BUDGET = MEMORY_BUDGET
+
+    # Pool of reusable write buffers
+    _BUFFER_POOL = BUFFER_POOL
+
     #: Default buffer_size value in bytes (Default to 8MB)
     DEFAULT_BUFFER_SIZE = 8388608
 
@@ -45,34 +81,61 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
     #: Maximum buffer_size value in bytes (0 for no limit)
     MAXIMUM_BUFFER_SIZE = 0
 
-    # Time to wait before try a new flush
-    # if number of buffer currently in flush > max_buffer
-    _FLUSH_WAIT = 0.01
+    #: Initial number of buffers to preload in read mode. The read-ahead window
+    #: is doubled each time a buffer is sequentially consumed, up to
+    #: "max_buffers", and is reset to this value on random access.
+    MINIMUM_READ_AHEAD = 2
 
-    def __init__(self, name, mode='r', buffer_size=None,
-                 max_buffers=0, max_workers=None, **kwargs):
+    #: Maximum number of buffers to preload in read mode if "max_buffers" is
+    #: not specified.
+    MAXIMUM_READ_AHEAD = 32
 
-        if 'a' in mode:
-            # TODO: Implement append mode and remove this exception
-            raise NotImplementedError(
-                'Not implemented yet in Pycosio')
+    def __init__(self, name, mode='r', buffer_size=None,
+                 max_buffers=0, max_workers=None, cache_size=0, cache=None,
+                 streaming=False, tuner=None, checksum=False, **kwargs):
 
         BufferedIOBase.__init__(self)
         ObjectIOBase.__init__(self, name, mode=mode)
         WorkerPoolBase.__init__(self, max_workers)
 
+        # In append mode, existing content is handled by the buffered stream
+        # instead of being loaded in memory by the raw stream
+        if 'a' in mode:
+            kwargs['storage_parameters'] = storage_parameters = (
+                kwargs.get('storage_parameters') or dict()).copy()
+            storage_parameters['pycosio.raw_io._init_append'] = False
+
         # Instantiate raw IO
         self._raw = self._RAW_CLASS(
-            name, mode=mode, **kwargs)
+            name, mode=mode, checksum=checksum, **kwargs)
         self._raw._is_raw_of_buffered = True
 
         # Link to RAW methods
         self._mode = self._raw.mode
         self._name = self._raw.name
         self._client_kwargs = self._raw._client_kwargs
+        self._checksum = checksum
+
+        # Initializes requests measures
+        if tuner is True:
+            tuner = AutoTuner()
+        self._tuner = tuner
+        self._tune_workers = tuner is not None and not max_workers
+        if self._tune_workers:
+            self._workers_count = tuner.max_workers
 
         # Initializes buffer
-        if not buffer_size or buffer_size < 0:
+        if (not buffer_size or buffer_size < 0) and tuner is not None:
+            self._buffer_size = tuner.buffer_size(
+                self.MINIMUM_BUFFER_SIZE, self.MAXIMUM_BUFFER_SIZE,
+                self.DEFAULT_BUFFER_SIZE)
+
+            # No need of buffers larger than the object to read
+            if self._readable:
+                self._buffer_size = max(min(
+                    self._buffer_size, self._raw._size),
+                    self.MINIMUM_BUFFER_SIZE)
+        elif not buffer_size or buffer_size < 0:
             self._buffer_size = self.DEFAULT_BUFFER_SIZE
         elif buffer_size < self.MINIMUM_BUFFER_SIZE:
             self._buffer_size = self.MINIMUM_BUFFER_SIZE
@@ -86,30 +149,95 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
         if self._writable:
             self._max_buffers = max_buffers
             self._buffer_seek = 0
-            self._write_buffer = bytearray(self._buffer_size)
+            self._write_buffer = self._BUFFER_POOL.get(self._buffer_size)
             self._seekable = False
             self._write_futures = []
             self._raw_flush = self._raw._flush
+            self._flush_pending = 0
+
+            # Notified each time a flush is completed
+            self._flush_condition = Condition()
+
+            # In append mode, number of parts and size in bytes of the
+            # existing content reused as start of the object
+            self._append_parts = 0
+            self._append_offset = 0
+
+            # Append mode on existing file is initialized on first write
+            self._append_pending = 'a' in mode and self._raw._exists() == 1
 
             # Size used only with random write access
             # Value will be lazy evaluated latter if needed.
             self._size_synched = False
             self._size = 0
-            self._size_lock = Lock()
+
+            # Notified each time the size is updated
+            self._size_condition = Condition()
 
         # Initialize read mode
         else:
             self._size = self._raw._size
             self._read_range = self.raw._read_range
+            self._read_range_into = self.raw._read_range_into
+            if tuner is not None:
+                self._read_range = partial(
+                    self._measure, self._read_range, None)
+                self._read_range_into = partial(
+                    self._measure, self._read_range_into, None)
+            self._direct_queue = dict()
+
+            # Cache of buffers removed from the read queue
+            if cache is None and cache_size:
+                cache = BlockCache(cache_size)
+            self._block_cache = cache
+            if cache is not None:
+                # Avoids to use buffers of a previous version of the object
+                self._version = self._raw._system._getversion_from_header(
+                    self._raw._head())
             if max_buffers:
                 self._max_buffers = max_buffers
             else:
-                self._max_buffers = ceil(self._size / self._buffer_size)
+                self._max_buffers = min(ceil(
+                    self._size / self._buffer_size), self.MAXIMUM_READ_AHEAD)
             self._read_queue = dict()
 
+            # Current read-ahead window size in number of buffers
+            self._read_ahead = min(self.MINIMUM_READ_AHEAD, self._max_buffers)
+
+            # Streaming request used to read buffers sequentially, and its
+            # position. Reads are run by batches, in submission order.
+            self._streaming = streaming
+            self._stream = None
+            self._stream_seek = 0
+            self._stream_batches = 0
+            self._stream_batch = 0
+            self._stream_condition = Condition()
+
+            # Full object MD5 verified while reading sequentially
+            self._read_md5 = None
+            if checksum:
+                expected = self._raw._system._getmd5_from_header(
+                    self._raw._head())
+                if expected is not None:
+                    self._read_md5 = StreamingMD5(
+                        expected, self._size, self._name)
+
         # Track if we attempted a close()
         self._closed = False
 
+    def _init_append(self):
+        """
+        Initializes file on 'a' mode.
+
+        Default implementation writes the existing content again, buffer per
+        buffer. Storage should override this method to reuse the existing
+        content server side when possible, and update "_append_parts" or
+        "_append_offset".
+        """
+        buffer_size = self._buffer_size
+        for start in range(0, self._raw._size, buffer_size):
+            self.write(self._raw._read_range(start, start + buffer_size))
+
     @property
     def _client(self):
         """
@@ -129,9 +257,34 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
             self._closed = True
             with self._seek_lock:
                 self._flush_raw_or_buffered()
-            if self._seek:
+
+                # Recycle the last buffer if not used by a flush in progress
+                if self._write_buffer is not None:
+                    self._BUFFER_POOL.put(self._write_buffer)
+                    self._write_buffer = None
+            if self._seek > self._append_parts:
                 with handle_os_exceptions():
                     self._close_writable()
+            self._raw._system.invalidate_header(
+                client_kwargs=self._raw._client_kwargs)
+
+        elif self._readable and getattr(self, '_read_queue', None):
+            # Cancel preloads not started yet to release shared workers
+            with self._seek_lock:
+                for index in tuple(self._read_queue):
+                    future = self._pop_buffer(index)
+                    try:
+                        future.cancel()
+                    except AttributeError:
+                        # Buffer already evaluated
+                        continue
+
+        if self._readable and getattr(self, '_stream', None) is not None:
+            with self._stream_condition:
+                self._close_stream()
+
+        if getattr(self, '_tuner', None) is not None:
+            self._tuner.checkpoint()
 
     def _close_writable(self):
         """
@@ -155,8 +308,10 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
             with self._seek_lock:
                 self._flush_raw_or_buffered()
 
-                # Clear the buffer
-                self._write_buffer = bytearray(self._buffer_size)
+                # Get a new buffer if the current one is used by a flush
+                if self._write_buffer is None:
+                    self._write_buffer = self._BUFFER_POOL.get(
+                        self._buffer_size)
                 self._buffer_seek = 0
 
     def _flush_raw_or_buffered(self):
@@ -176,7 +331,7 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
         # flush data with raw stream to reduce IO calls
         elif self._buffer_seek:
             self._raw._write_buffer = self._get_buffer()
-            self._raw._seek = self._buffer_seek
+            self._raw._seek = self._append_offset + self._buffer_seek
             self._raw.flush()
 
     @abstractmethod
@@ -185,7 +340,103 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
         Flush the write buffers of the stream if applicable.
 
         In write mode, send the buffer content to the cloud object.
+
+        Implementations should use "_submit_flush" to run the flush in
+        background.
+        """
+
+    def _submit_flush(self, function, *args, **kwargs):
+        """
+        Run a flush operation in background.
+
+        The buffer memory is acquired from the memory budget until the flush
+        completion. If the budget is exhausted, wait for a previous flush of
+        this stream to complete.
+
+        The current write buffer is owned by the flush operation, and is
+        returned to the buffer pool on completion. The "function" arguments
+        can so be views of the write buffer.
+
+        Args:
+            function (callable): Flush function.
+            args, kwargs: Function arguments.
+
+        Returns:
+            concurrent.futures.Future: Flush future.
+        """
+        size = self._buffer_size
+        self._MEMORY_BUDGET.acquire(
+            size, wait_while=lambda: self._flush_pending)
+
+        with self._flush_condition:
+            self._flush_pending += 1
+
+        buffer = self._write_buffer
+        self._write_buffer = None
+
+        if self._tuner is not None:
+            function = partial(
+                self._measure, function, self._buffer_seek)
+
+        try:
+            future = self._workers.submit(function, *args, **kwargs)
+        except BaseException:
+            # The flush can't be run: Keep the buffer and release the memory
+            self._write_buffer = buffer
+            with self._flush_condition:
+                self._flush_pending -= 1
+                self._flush_condition.notify_all()
+            self._MEMORY_BUDGET.release(size)
+            raise
+        future.add_done_callback(partial(self._flush_done, buffer))
+        return future
+
+    def _flush_done(self, buffer, _):
         """
+        Release resources used by a flush once completed.
+
+        Args:
+            buffer (bytearray): Flushed write buffer.
+            _ (concurrent.futures.Future): Flush future.
+        """
+        if buffer is not None:
+            self._BUFFER_POOL.put(buffer)
+        with self._flush_condition:
+            self._flush_pending -= 1
+            self._flush_condition.notify_all()
+        self._MEMORY_BUDGET.release(self._buffer_size)
+
+    def _measure(self, function, size, *args, **kwargs):
+        """
+        Run a request and record its measure in the tuner.
+
+        Args:
+            function (callable): Request function.
+            size (int): Size of data transferred in bytes. If None, use the
+                function result size, or the function result if an integer.
+            args, kwargs: Function arguments.
+
+        Returns:
+            object: Function result.
+        """
+        start = time()
+        result = function(*args, **kwargs)
+        end = time()
+
+        if size is None:
+            try:
+                size = len(result)
+            except TypeError:
+                size = result
+
+        tuner = self._tuner
+        tuner.record(size, start, end)
+
+        # Adjusts concurrency if tuned
+        if self._tune_workers and (
+                tuner.max_workers != self._workers.max_workers):
+            self._workers.set_max_workers(tuner.max_workers)
+        return result
 
     def _get_buffer(self):
         """
@@ -212,28 +463,296 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
             raise UnsupportedOperation('read')
 
         with self._seek_lock:
-            self._raw.seek(self._seek)
+            seek = self._seek
+            start = seek % self._buffer_size
+            queue_index = seek - start
+
+            # Returns from the preloaded buffer if it contains the range
+            if (queue_index in self._read_queue and
+                    0 <= size <= self._buffer_size - start):
+                return self._get_read_buffer(queue_index)[start:start + size]
+
+            self._raw.seek(seek)
             return self._raw._peek(size)
 
-    def _preload_range(self):
-        """Preload data for reading"""
+    def _preload_range(self, seek=None):
+        """
+        Preload data for reading.
+
+        Preload the read-ahead window starting from the buffer that contains
+        the specified position and drops buffers out of this window.
+
+        Args:
+            seek (int): Position from where preload data.
+                Default to current stream position.
+        """
         queue = self._read_queue
         size = self._buffer_size
-        start = self._seek
-        end = int(start + size * self._max_buffers)
-        workers_submit = self._workers.submit
-        indexes = tuple(range(start, end, size))
+        if seek is None:
+            seek = self._seek
+        start = seek - seek % size
+        indexes = range(
+            start, min(start + size * self._read_ahead, self._size), size)
 
         # Drops buffer out of current range
-        for seek in tuple(queue):
-            if seek not in indexes:
-                del queue[seek]
+        for index in tuple(queue):
+            if index not in indexes:
+                self._pop_buffer(index)
 
         # Launch buffer preloading for current range
+        self._preload(indexes, required=True)
+
+    def _preload_next(self, index):
+        """
+        Grow the read-ahead window after a buffer was sequentially consumed,
+        then preload buffers following it.
+
+        Args:
+            index (int): Position of the consumed buffer.
+        """
+        self._read_ahead = min(self._read_ahead * 2, self._max_buffers)
+        size = self._buffer_size
+        start = index + size
+        self._preload(range(
+            start, min(start + size * self._read_ahead, self._size), size),
+            stream=self._streaming)
+
+    def _preload(self, indexes, required=False, stream=False):
+        """
+        Launch preloading of buffers not already in the read queue.
+
+        If the memory budget is exhausted, stops preloading and shrinks the
+        read-ahead window.
+
+        Args:
+            indexes (iterable of int): Positions of buffers to preload.
+            required (bool): If True, the first buffer is required to
+                continue reading and is always preloaded.
+            stream (bool): If True, read buffers from the streaming request.
+        """
+        queue = self._read_queue
+        size = self._buffer_size
         read_range = self._read_range
-        for seek in indexes:
-            if seek not in queue:
-                queue[seek] = workers_submit(read_range, seek, seek + size)
+        workers_submit = self._workers.submit
+        budget = self._MEMORY_BUDGET
+        direct = self._direct_queue
+        cache = self._block_cache
+        streamed = []
+        for index in indexes:
+            if index in queue or index in direct:
+                required = False
+                continue
+
+            if not budget.acquire(size, blocking=False):
+                if not required:
+                    self._read_ahead = max(len(queue), 1)
+                    break
+
+                # Always load the buffer required to continue reading
+                budget.reserve(size)
+
+            required = False
+
+            # Get buffer from cache
+            if cache is not None:
+                buffer = cache.get(self._cache_key(index))
+                if buffer is not None:
+                    queue[index] = buffer
+                    continue
+
+            if stream:
+                queue[index] = future = Future()
+                streamed.append((index, future))
+            else:
+                queue[index] = workers_submit(read_range, index, index + size)
+
+        if streamed:
+            with self._stream_condition:
+                batch = self._stream_batches
+                self._stream_batches += 1
+            workers_submit(self._read_stream_batch, batch, streamed)
+
+    def _read_stream_batch(self, batch, buffers):
+        """
+        Read buffers from the streaming request.
+
+        Batches are run in submission order, and the streaming request is
+        reopened if a batch does not start at its current position.
+
+        Args:
+            batch (int): Batch number.
+            buffers (list of tuple): Position and future of buffers to read.
+        """
+        with self._stream_condition:
+            while self._stream_batch != batch:
+                self._stream_condition.wait()
+            try:
+                size = self._buffer_size
+                for index, future in buffers:
+                    if not future.set_running_or_notify_cancel():
+                        # Buffer dropped
+                        continue
+                    try:
+                        buffer = self._read_stream_range(index, index + size)
+                    except Exception as exception:
+                        self._close_stream()
+                        future.set_exception(exception)
+                    else:
+                        future.set_result(buffer)
+            finally:
+                self._stream_batch += 1
+                self._stream_condition.notify_all()
+
+    def _read_stream_range(self, start, end):
+        """
+        Read a range of bytes from the streaming request.
+
+        Falls back to a range request if the storage does not support
+        streaming requests.
+
+        Args:
+            start (int): Start stream position.
+            end (int): End stream position.
+
+        Returns:
+            bytes: number of bytes read
+        """
+        if self._stream is None or self._stream_seek != start:
+            self._close_stream()
+            try:
+                self._stream = self._raw._open_range_stream(start)
+            except UnsupportedOperation:
+                self._streaming = False
+                return self._read_range(start, end)
+            self._stream_seek = start
+
+        # Response may return less than the requested size
+        size = end - start
+        chunks = []
+        while size > 0:
+            chunk = self._stream.read(size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size -= len(chunk)
+
+        buffer = chunks[0] if len(chunks) == 1 else b''.join(chunks)
+        self._stream_seek += len(buffer)
+        return buffer
+
+    def _close_stream(self):
+        """
+        Close the streaming request if any.
+        """
+        stream = self._stream
+        self._stream = None
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception:
+                # Response is dropped anyway
+                pass
+
+    def _read_direct(self, seek, b_view):
+        """
+        Read buffers entirely covered by a read buffer directly into it in
+        background, if not already preloaded.
+
+        Args:
+            seek (int): Position of the read buffer start.
+            b_view (memoryview): Read buffer.
+
+        Returns:
+            dict: Read futures (returning read size) by buffer position.
+        """
+        size = self._buffer_size
+        end = min(seek + len(b_view), self._size)
+        queue = self._read_queue
+        cache = self._block_cache
+        read_range_into = self._read_range_into
+        workers_submit = self._workers.submit
+        direct = dict()
+        for index in range(seek + -seek % size, end, size):
+            index_end = min(index + size, self._size)
+            if index_end > end:
+                # Last buffer only partially covered
+                break
+            elif index not in queue and (
+                    cache is None or self._cache_key(index) not in cache):
+                start = index - seek
+                direct[index] = workers_submit(
+                    read_range_into, index,
+                    b_view[start:start + index_end - index])
+        return direct
+
+    def _pop_buffer(self, index):
+        """
+        Remove a buffer from the read queue and release its memory.
+
+        Args:
+            index (int): Position of the buffer.
+
+        Returns:
+            concurrent.futures.Future or bytes: Buffer.
+        """
+        buffer = self._read_queue.pop(index)
+        self._MEMORY_BUDGET.release(self._buffer_size)
+
+        # Keep buffer in cache for future reads
+        cache = self._block_cache
+        if cache is not None:
+            key = self._cache_key(index)
+            try:
+                buffer.add_done_callback(partial(self._cache_future, key))
+            except AttributeError:
+                # Buffer already evaluated
+                cache.put(key, buffer)
+
+        return buffer
+
+    def _cache_key(self, index):
+        """
+        Key of a buffer in the cache.
+
+        Args:
+            index (int): Position of the buffer.
+
+        Returns:
+            tuple: Key.
+        """
+        return self._name, self._version, self._size, self._buffer_size, index
+
+    def _cache_future(self, key, future):
+        """
+        Put a preloaded buffer in the cache once loaded.
+
+        Args:
+            key (tuple): Buffer key.
+            future (concurrent.futures.Future): Buffer future.
+        """
+        if not future.cancelled() and future.exception() is None:
+            self._block_cache.put(key, future.result())
+
+    def _verify_read(self, start, data):
+        """
+        Update the object checksum with read data, and verify it once the
+        object is entirely read.
+
+        Args:
+            start (int): Position of the data in the object.
+            data (bytes-like object): Read data.
+        """
+        if self._read_md5 is not None:
+            with handle_os_exceptions():
+                self._read_md5.update(start, data)
+
+    def _reset_read_ahead(self):
+        """
+        Reset the read-ahead window to its initial size.
+
+        Called on random access.
+        """
+        self._read_ahead = min(self.MINIMUM_READ_AHEAD, self._max_buffers)
 
     @property
     def raw(self):
@@ -270,28 +789,32 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
             return b''
 
         # Returns existing buffer with no copy
-        if size == self._buffer_size:
-            queue_index = self._seek
+        if size == self._buffer_size and not self._seek % size:
+            with self._seek_lock:
+                queue_index = self._seek
+                queue = self._read_queue
 
-            # Starts initial preloading on first call
-            if queue_index == 0:
-                self._preload_range()
+                # Starts preloading if buffer not already queued
+                if queue_index not in queue:
+                    self._preload_range(queue_index)
 
-            # Get buffer from future
-            with handle_os_exceptions():
-                buffer = self._read_queue.pop(queue_index).result()
+                # Get buffer from future
+                with handle_os_exceptions():
+                    buffer = self._pop_buffer(queue_index)
+                    try:
+                        buffer = buffer.result()
 
-            # Append another buffer preload at end of queue
-            buffer_size = self._buffer_size
-            index = queue_index + buffer_size * self._max_buffers
-            if index < self._size:
-                self._read_queue[index] = self._workers.submit(
-                    self._read_range, index, index + buffer_size)
+                    # Already evaluated
+                    except AttributeError:
+                        pass
+                self._verify_read(queue_index, buffer)
 
-            # Update seek
-                self._seek += buffer_size
-            else:
-                self._seek = self._size
+                # Preload next buffers
+                self._preload_next(queue_index)
+
+                # Update seek
+                self._seek = seek = queue_index + len(buffer)
+                self._raw.seek(seek)
 
             return buffer
 
@@ -311,16 +834,114 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
         Read and return up to size bytes,
         with at most one call to the underlying raw stream’s.
 
-        Use at most one call to the underlying raw stream’s read method.
+        Bytes are returned from at most one preloaded buffer.
 
         Args:
-            size (int): Number of bytes to read. -1 to read the
-                stream until end.
+            size (int): Number of bytes to read. -1 to read until the end of
+                the current buffer.
 
         Returns:
             bytes: Object content
         """
-        return self._raw.read(size)
+        if self._closed:
+            raise ValueError('ValueError: I/O operation on closed file')
+
+        if not self._readable:
+            raise UnsupportedOperation('read')
+
+        with self._seek_lock:
+            seek = self._seek
+            if seek >= self._size or not size:
+                return b''
+
+            start = seek % self._buffer_size
+            queue_index = seek - start
+            if queue_index not in self._read_queue:
+                # Starts preloading on first call or after random access
+                self._preload_range(seek)
+            buffer = self._get_read_buffer(queue_index)
+
+            data_size = len(buffer)
+            end = data_size if size < 0 else min(start + size, data_size)
+            self._verify_read(seek, memoryview(buffer)[start:end])
+            if end >= data_size:
+                # Removes consumed buffer from queue and preload next buffers
+                self._pop_buffer(queue_index)
+                self._preload_next(queue_index)
+
+            # Updates seek and sync raw
+            self._seek = seek = queue_index + max(start, end)
+            self._raw.seek(seek)
+
+        return buffer[start:end]
+
+    def readline(self, size=-1):
+        """
+        Read and return one line from the stream.
+
+        Newlines are searched directly in preloaded buffers.
+
+        Args:
+            size (int): Maximum number of bytes to read. -1 to read until
+                the end of the line.
+
+        Returns:
+            bytes: Line, including the newline character if any.
+        """
+        if self._closed:
+            raise ValueError('ValueError: I/O operation on closed file')
+
+        if not self._readable:
+            raise UnsupportedOperation('read')
+
+        if size is None:
+            size = -1
+
+        with self._seek_lock:
+            seek = self._seek
+            buffer_size = self._buffer_size
+            if seek < self._size and size and (
+                    seek - seek % buffer_size) not in self._read_queue:
+                # Starts preloading on first call or after random access
+                self._preload_range(seek)
+
+            chunks = []
+            while seek < self._size and size:
+                start = seek % buffer_size
+                queue_index = seek - start
+                buffer = self._get_read_buffer(queue_index)
+
+                # Checks if end of file reached
+                data_size = len(buffer)
+                if data_size <= start:
+                    break
+
+                # Finds line end in buffer
+                end = data_size if size < 0 else min(start + size, data_size)
+                line_end = buffer.find(b'\n', start, end)
+                if line_end != -1:
+                    end = line_end + 1
+
+                chunks.append(buffer[start:end])
+                self._verify_read(seek, chunks[-1])
+                seek += end - start
+                if size > 0:
+                    size -= end - start
+
+                if end == data_size:
+                    # Removes consumed buffer from queue and preload next
+                    # buffers
+                    self._pop_buffer(queue_index)
+                    self._preload_next(queue_index)
+
+                if line_end != -1:
+                    break
+
+            # Updates seek and sync raw
+            self._seek = seek
+            self._raw.seek(seek)
+
+        return chunks[0] if len(chunks) == 1 else b''.join(chunks)
 
     def readinto(self, b):
         """
@@ -340,102 +961,252 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
             # Gets seek
             seek = self._seek
 
-            # Initializes queue
-            queue = self._read_queue
-            if seek == 0:
-                # Starts initial preloading on first call
-                self._preload_range()
-
             # Initializes read data buffer
             size = len(b)
             if size:
                 # Preallocated buffer:
-                # Use memory view to avoid copies
+                # Use memory view to avoid copies, and read entirely covered
+                # buffers directly into it
                 b_view = memoryview(b)
                 size_left = size
+                self._direct_queue = direct = self._read_direct(seek, b_view)
             else:
                 # Dynamic buffer:
                 # Can't avoid copy, read until EOF
                 b_view = b
                 size_left = -1
+                direct = self._direct_queue
             b_end = 0
 
-            # Starts reading
+            # Initializes queue
+            queue = self._read_queue
             buffer_size = self._buffer_size
-            while size_left > 0 or size_left == -1:
+            queue_index = seek - seek % buffer_size
+            if queue_index not in queue and queue_index not in direct:
+                # Starts preloading on first call or after random access
+                self._preload_range(seek)
+
+            try:
+                b_end, seek = self._readinto_buffers(
+                    b_view, seek, size_left, direct)
+            finally:
+                # Cancel or wait direct reads if stopped before reaching them
+                for future in direct.values():
+                    future.cancel()
+                wait(tuple(direct.values()))
+                self._direct_queue = dict()
 
-                # Finds buffer position in queue and buffer seek
-                start = seek % buffer_size
-                queue_index = seek - start
+            # Updates seek and sync raw
+            self._seek = seek
+            self._raw.seek(seek)
 
-                # Gets preloaded buffer
-                try:
-                    buffer = queue[queue_index]
-                except KeyError:
-                    # EOF
-                    break
+        # Returns read size
+        return b_end
 
-                # Get buffer from future
+    def _readinto_buffers(self, b_view, seek, size_left, direct):
+        """
+        Read bytes from preloaded buffers into a read buffer.
+
+        Args:
+            b_view (memoryview or bytearray): Read buffer.
+            seek (int): Position of the read start.
+            size_left (int): Size to read. -1 to read until EOF.
+            direct (dict): Futures of buffers read directly into the read
+                buffer by position.
+
+        Returns:
+            tuple of int: Number of bytes read, new position.
+        """
+        queue = self._read_queue
+        buffer_size = self._buffer_size
+        b_end = 0
+        while size_left > 0 or size_left == -1:
+
+            # Finds buffer position in queue and buffer seek
+            start = seek % buffer_size
+            queue_index = seek - start
+
+            # Gets buffer directly read into read buffer
+            try:
+                future = direct.pop(queue_index)
+            except KeyError:
+                pass
+            else:
                 with handle_os_exceptions():
-                    try:
-                        queue[queue_index] = buffer = buffer.result()
+                    read_size = future.result()
+                b_start = b_end
+                b_end += read_size
+                self._verify_read(seek, b_view[b_start:b_end])
+                size_left -= read_size
+                seek += read_size
 
-                    # Already evaluated
-                    except AttributeError:
-                        pass
-                buffer_view = memoryview(buffer)
-                data_size = len(buffer)
+                # Keep a copy of the buffer in cache for future reads
+                if self._block_cache is not None:
+                    self._block_cache.put(
+                        self._cache_key(queue_index),
+                        b_view[b_start:b_end].tobytes())
+
+                # Preload next buffers
+                if queue_index + buffer_size not in direct:
+                    self._preload_next(queue_index)
 
                 # Checks if end of file reached
-                if not data_size:
+                if read_size < min(buffer_size, self._size - queue_index):
                     break
+                continue
+
+            # Gets preloaded buffer
+            if queue_index not in queue and seek >= self._size:
+                # EOF
+                break
+            buffer = self._get_read_buffer(queue_index)
+            buffer_view = memoryview(buffer)
+            data_size = len(buffer)
+
+            # Checks if end of file reached
+            if data_size <= start:
+                break
+
+            # Gets theoretical range to copy
+            if size_left != -1:
+                end = start + size_left
+            else:
+                end = data_size
 
-                # Gets theoretical range to copy
-                if size_left != -1:
-                    end = start + size_left
-                else:
-                    end = data_size - start
-
-                # Checks for end of buffer
-                if end >= data_size:
-                    # Adjusts range to copy
-                    end = data_size
-
-                    # Removes consumed buffer from queue
-                    del queue[queue_index]
-
-                    # Append another buffer preload at end of queue
-                    index = queue_index + buffer_size * self._max_buffers
-                    if index < self._size:
-                        queue[index] = self._workers.submit(
-                            self._read_range, index, index + buffer_size)
-
-                # Gets read size, updates seek and updates size left
-                read_size = end - start
-                if size_left != -1:
-                    size_left -= read_size
-                seek += read_size
+            # Checks for end of buffer
+            if end >= data_size:
+                # Adjusts range to copy
+                end = data_size
 
-                # Defines read buffer range
-                b_start = b_end
-                b_end = b_start + read_size
+                # Removes consumed buffer from queue
+                self._pop_buffer(queue_index)
 
-                # Copy data from preload buffer to read buffer
-                b_view[b_start:b_end] = buffer_view[start:end]
+                # Preload next buffers
+                self._preload_next(queue_index)
 
-            # Updates seek and sync raw
-            self._seek = seek
-            self._raw.seek(seek)
+            # Gets read size, updates seek and updates size left
+            read_size = end - start
+            if size_left != -1:
+                size_left -= read_size
+            seek += read_size
 
-        # Returns read size
-        return b_end
+            # Defines read buffer range
+            b_start = b_end
+            b_end = b_start + read_size
+
+            # Copy data from preload buffer to read buffer
+            b_view[b_start:b_end] = buffer_view[start:end]
+            self._verify_read(seek - read_size, buffer_view[start:end])
+
+        return b_end, seek
+
+    def _get_read_buffer(self, index):
+        """
+        Get a buffer of the read queue, and load it if not preloaded.
+
+        Args:
+            index (int): Position of the buffer.
+
+        Returns:
+            bytes: Buffer content.
+        """
+        queue = self._read_queue
+        try:
+            buffer = queue[index]
+        except KeyError:
+            # Buffer not preloaded, load it now
+            self._preload((index,), required=True)
+            buffer = queue[index]
+
+        # Get buffer from future
+        with handle_os_exceptions():
+            try:
+                queue[index] = buffer = buffer.result()
+
+            # Already evaluated
+            except AttributeError:
+                pass
+        return buffer
+
+    def read_ranges(self, ranges, max_gap=None):
+        """
+        Read many ranges of bytes.
+
+        Ranges entirely contained in an already loaded or cached buffer are
+        returned from it. Others nearby ranges are merged to reduce the number
+        of requests, and requests are performed in parallel. The stream
+        position is not changed.
+
+        Args:
+            ranges (iterable of tuple): Ranges to read as (offset, length).
+            max_gap (int): Maximum gap in bytes between two ranges to read
+                them in a single request. Default to raw stream
+                "RANGES_MAX_GAP".
+
+        Returns:
+            list of memoryview: Read bytes of each range, in the same order as
+            "ranges". Ranges after the end of file are truncated.
+        """
+        if not self._readable:
+            raise UnsupportedOperation('read')
+
+        ranges = tuple(ranges)
+        results = [None] * len(ranges)
+        missing = []
+        with self._seek_lock:
+            for index, (offset, length) in enumerate(ranges):
+                results[index] = self._get_loaded_range(offset, length)
+                if results[index] is None:
+                    missing.append(index)
+
+        if missing:
+            read = self._raw._read_ranges(
+                (ranges[index] for index in missing), max_gap, self._workers)
+            for index, view in zip(missing, read):
+                results[index] = view
+
+        return results
+
+    def _get_loaded_range(self, offset, length):
+        """
+        Get a range from an already loaded or cached buffer.
+
+        Args:
+            offset (int): Range start position.
+            length (int): Range length.
+
+        Returns:
+            memoryview: Range bytes, or None if not loaded.
+        """
+        start = offset % self._buffer_size
+        index = offset - start
+        if start + length > self._buffer_size:
+            # Range over many buffers
+            return None
+
+        buffer = self._read_queue.get(index)
+        try:
+            if buffer.done() and buffer.exception() is None:
+                buffer = buffer.result()
+            else:
+                buffer = None
+        except AttributeError:
+            # Buffer already evaluated, or not in queue
+            pass
+
+        if buffer is None and self._block_cache is not None:
+            buffer = self._block_cache.get(self._cache_key(index))
+
+        if buffer is None:
+            return None
+        return memoryview(buffer)[start:start + length]
 
     def readinto1(self, b):
         """
         Read bytes into a pre-allocated, writable bytes-like object b,
         and return the number of bytes read.
 
-        Use at most one call to the underlying raw stream’s readinto method.
+        Bytes are read from at most one preloaded buffer.
 
         Args:
             b (bytes-like object): buffer.
@@ -443,7 +1214,10 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
         Returns:
             int: number of bytes read
         """
-        return self._raw.readinto(b)
+        data = self.read1(len(b))
+        read_size = len(data)
+        memoryview(b)[:read_size] = data
+        return read_size
 
     def seek(self, offset, whence=SEEK_SET):
         """
@@ -474,9 +1248,14 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
         with self._seek_lock:
             # Set seek using raw method and
             # sync buffered seek with raw seek
+            previous_seek = self._seek
             self.raw.seek(offset, whence)
             self._seek = seek = self.raw._seek
 
+            # Random access: Restarts with a small read-ahead window
+            if seek != previous_seek:
+                self._reset_read_ahead()
+
             # Preload starting from current seek
             self._preload_range()
 
@@ -499,6 +1278,11 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
         if not self._writable:
             raise UnsupportedOperation('write')
 
+        if self._append_pending:
+            self._append_pending = False
+            with handle_os_exceptions():
+                self._init_append()
+
         size = len(b)
         b_view = memoryview(b)
         size_left = size
@@ -543,18 +1327,17 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
                     # Block flush based on maximum number of
                     # buffers in flush progress
                     if max_buffers:
-                        futures = self._write_futures
-                        flush_wait = self._FLUSH_WAIT
-                        while sum(1 for future in futures
-                                  if not future.done()) >= max_buffers:
-                            sleep(flush_wait)
+                        with self._flush_condition:
+                            while self._flush_pending >= max_buffers:
+                                self._flush_condition.wait()
 
                     # Flush
                     with handle_os_exceptions():
                         self._flush()
 
-                    # Clear buffer
-                    self._write_buffer = bytearray(buffer_size)
+                    # Get a new buffer, the flushed one is recycled once
+                    # its flush is completed
+                    self._write_buffer = self._BUFFER_POOL.get(buffer_size)
                     buffer_view = memoryview(self._write_buffer)
                     end = 0
 
@@ -1,14 +1,19 @@
 # coding=utf-8
 """Cloud storage abstract Raw IO class"""
 from abc import abstractmethod
+from concurrent.futures import wait
+from functools import partial
 from io import RawIOBase, UnsupportedOperation
 from os import SEEK_CUR, SEEK_END, SEEK_SET
 
 from pycosio._core.compat import file_exits_error, permission_error
+from pycosio._core.disk_cache import DiskCache
 from pycosio._core.exceptions import (
     ObjectNotFoundError, ObjectPermissionError, handle_os_exceptions)
 from pycosio._core.io_base import ObjectIOBase, memoizedmethod
 from pycosio._core.io_base_system import SystemBase
+from pycosio._core.retry import is_transient_error
+from pycosio._core.write_spool import WriteSpool
 
 
 class ObjectRawIOBase(RawIOBase, ObjectIOBase):
@@ -31,6 +36,15 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
             Generally, client configuration and credentials.
         unsecure (bool): If True, disables TLS/SSL to improves
             transfer performance. But makes connection unsecure.
+        disk_cache (path-like object or pycosio.io.DiskCache): In read mode,
+            local directory, or existing disk cache, used to persistently
+            cache read chunks of the object. Default to no disk cache.
+        retry (pycosio.io.RetryPolicy): In read mode, policy used to retry
+            range reads on transient errors, and to hedge slow range reads.
+            Default to the policy shared by all streams of the storage.
+        checksum (bool): If True, verify data integrity with checksums when
+            supported by the storage. In read mode, range reads are verified
+            if the storage returns ranges checksums.
     """
     # System I/O class
     _SYSTEM_CLASS = SystemBase
@@ -38,7 +52,33 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
     #: Maximum size of one flush operation (0 for no limit)
     MAX_FLUSH_SIZE = 0
 
-    def __init__(self, name, mode='r', storage_parameters=None, **kwargs):
+    #: Default maximum gap in bytes between two ranges to merge them in a
+    #: single request in "read_ranges"
+    RANGES_MAX_GAP = 1048576
+
+    #: Maximum size in bytes of a single request merging many ranges in
+    #: "read_ranges" (Default to 8MB), so large sets of nearby ranges are
+    #: still read in parallel. 0 for no limit.
+    RANGES_MAX_SIZE = 8388608
+
+    #: Size in bytes of parts read in parallel by "readall" and "readinto"
+    #: when reading a larger range (Default to 8MB). 0 to disable.
+    PARALLEL_READ_SIZE = 8388608
+
+    #: Size in bytes above which the write buffer is moved from memory to a
+    #: temporary file (Default to 64MB). 0 to always keep it in memory.
+    WRITE_SPOOL_SIZE = 67108864
+
+    #: Size in bytes of parts uploaded in parallel on flush by storage that
+    #: support multipart uploads, when flushing a larger buffer
+    #: (Default to 64MB). 0 to disable.
+    MULTIPART_UPLOAD_SIZE = 67108864
+
+    # Maximum number of parts of a multipart upload
+    _MAX_UPLOAD_PARTS = 10000
+
+    def __init__(self, name, mode='r', storage_parameters=None,
+                 disk_cache=None, retry=None, checksum=False, **kwargs):
 
         RawIOBase.__init__(self)
         ObjectIOBase.__init__(self, name, mode=mode)
@@ -53,6 +93,12 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
         except (AttributeError, KeyError):
             pass
 
+        # Check if append mode is initialized by a buffered stream
+        try:
+            init_append = storage_parameters.pop('pycosio.raw_io._init_append')
+        except (AttributeError, KeyError):
+            init_append = True
+
         # Initializes system
         try:
             # Try to get cached system
@@ -72,6 +118,9 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
         # Mark as standalone RAW to avoid flush conflicts on close
         self._is_raw_of_buffered = False
 
+        # Data integrity verification
+        self._checksum = checksum
+
         # Configures write mode
         if self._writable:
             self._write_buffer = bytearray()
@@ -80,8 +129,9 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
             if 'a' in mode:
                 # Initialize with existing file content
                 if self._exists() == 1:
-                    with handle_os_exceptions():
-                        self._init_append()
+                    if init_append:
+                        with handle_os_exceptions():
+                            self._init_append()
 
                 # Create new file
                 elif self._exists() == 0:
@@ -114,12 +164,87 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
             with handle_os_exceptions():
                 self._head()
 
+            self._init_retry(retry)
+
+            if disk_cache is not None:
+                self._init_disk_cache(disk_cache)
+
+    def _init_retry(self, retry):
+        """
+        Initializes retries of ranges reads in read mode.
+
+        "_read_range" reads are also hedged if enabled by the policy.
+        "_read_range_into" reads are never hedged because many requests can't
+        write in the same buffer at once.
+
+        Args:
+            retry (pycosio.io.RetryPolicy): Retry policy.
+                Default to the storage system policy.
+        """
+        if retry is None:
+            retry = self._system._retry_policy
+
+        is_transient = self._is_transient_error
+        self._read_range = partial(
+            retry.call_hedged, is_transient, self._read_range)
+
+        # Default implementation already retries with "_read_range"
+        if type(self)._read_range_into != ObjectRawIOBase._read_range_into:
+            self._read_range_into = partial(
+                retry.call, is_transient, self._read_range_into)
+
+    @staticmethod
+    def _is_transient_error(exception):
+        """
+        Returns True if an exception raised by a request is transient, and so
+        the request can be retried.
+
+        Storage should override this method to handle their client errors.
+
+        Args:
+            exception (Exception): Exception.
+
+        Returns:
+            bool: True if transient.
+        """
+        return is_transient_error(exception)
+
+    def _init_disk_cache(self, disk_cache):
+        """
+        Initializes the disk cache in read mode.
+
+        Ranges reads are redirected to the disk cache. The cache is not used if
+        the object version can't be determined from its header.
+
+        Args:
+            disk_cache (path-like object or pycosio.io.DiskCache): Cache
+                directory or disk cache.
+        """
+        version = self._system._getversion_from_header(self._head())
+        if version is None:
+            return
+
+        if not isinstance(disk_cache, DiskCache):
+            disk_cache = DiskCache(disk_cache)
+
+        size = self._size
+        self._read_range = partial(
+            disk_cache.read_range, self._read_range,
+            (self._system.storage, self._path, size, version), size)
+        self._read_range_into = partial(
+            ObjectRawIOBase._read_range_into, self)
+        self._readall = partial(self._read_range, 0)
+
+        # Streaming requests would bypass the cache
+        self._open_range_stream = partial(
+            ObjectRawIOBase._open_range_stream, self)
+
     def _init_append(self):
         """
         Initializes file on 'a' mode.
         """
         # Require to load the full file content in buffer
-        self._write_buffer[:] = self._readall()
+        self._write_into_buffer(0, self._readall())
 
         # Make initial seek position to current end of file
         self._seek = self._size
@@ -143,6 +268,7 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
             self._closed = True
             if self._write_buffer:
                 self.flush()
+            self._close_write_spool()
 
     def flush(self):
         """
@@ -152,6 +278,7 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
         if self._writable:
             with handle_os_exceptions():
                 self._flush(self._get_buffer())
+            self._system.invalidate_header(client_kwargs=self._client_kwargs)
 
     @abstractmethod
     def _flush(self, buffer):
@@ -167,6 +294,7 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
         Create the file if not exists.
         """
         self._flush(memoryview(b''))
+        self._system.invalidate_header(client_kwargs=self._client_kwargs)
 
     def _get_buffer(self):
         """
@@ -176,7 +304,64 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
         Returns:
             memoryview: buffer view.
         """
-        return memoryview(self._write_buffer)
+        buffer = self._write_buffer
+        if isinstance(buffer, WriteSpool):
+            return buffer.getbuffer()
+        return memoryview(buffer)
+
+    def _write_into_buffer(self, start, data):
+        """
+        Write data in the write buffer.
+
+        The buffer is moved to a temporary file once its size would exceed
+        "WRITE_SPOOL_SIZE".
+
+        Args:
+            start (int): Start position in buffer.
+            data (bytes-like object): Data to write.
+        """
+        buffer = self._write_buffer
+
+        # Like with "bytearray", writing after the end of the buffer appends
+        start = min(start, len(buffer))
+        end = start + len(data)
+        if isinstance(buffer, bytearray):
+            if self.WRITE_SPOOL_SIZE and end > self.WRITE_SPOOL_SIZE:
+                self._write_buffer = buffer = WriteSpool(buffer)
+            elif end <= len(buffer):
+                # Update in place
+                buffer = memoryview(buffer)
+        buffer[start:end] = data
+
+    def _close_write_spool(self):
+        """
+        Remove the write buffer temporary file, if any.
+        """
+        buffer = self._write_buffer
+        if isinstance(buffer, WriteSpool):
+            self._write_buffer = bytearray()
+            buffer.close()
+
+    def _get_upload_parts(self, buffer):
+        """
+        Split a buffer to flush in parts to upload in parallel.
+
+        Args:
+            buffer (memoryview): Buffer content.
+
+        Returns:
+            list of memoryview: Parts. Only one part if the buffer is not
+                larger than "MULTIPART_UPLOAD_SIZE".
+        """
+        size = len(buffer)
+        part_size = self.MULTIPART_UPLOAD_SIZE
+        if not part_size or size <= part_size:
+            return [buffer]
+
+        # Storage limits the number of parts
+        part_size = max(part_size, -(-size // self._MAX_UPLOAD_PARTS))
+        return [buffer[start:start + part_size]
+                for start in range(0, size, part_size)]
 
     @property
     @memoizedmethod
@@ -207,7 +392,8 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
         Returns:
             dict: header.
         """
-        return self._system.head(client_kwargs=self._client_kwargs)
+        return self._system.head(
+            client_kwargs=self._client_kwargs, partial=False)
 
     @memoizedmethod
     def _exists(self):
@@ -270,9 +456,17 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
             raise UnsupportedOperation('read')
 
         with self._seek_lock:
-            # Get data starting from seek
             with handle_os_exceptions():
-                if self._seek and self._seekable:
+                # Large object: Get data by parts read in parallel
+                size = self._get_size_to_read(self._seek)
+                if size:
+                    buffer = bytearray(size)
+                    read_size = self._read_range_into_parallel(
+                        self._seek, memoryview(buffer))
+                    data = memoryview(buffer)[:read_size].tobytes()
+
+                # Get data starting from seek
+                elif self._seek and self._seekable:
                     data = self._read_range(self._seek)
 
                 # Get all data
@@ -292,6 +486,144 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
         """
         return self._read_range(0)
 
+    def _get_size_to_read(self, start):
+        """
+        Return the size to read until EOF if large enough to be read by parts
+        in parallel.
+
+        Args:
+            start (int): Start stream position.
+
+        Returns:
+            int: Size in bytes, or 0 if not read in parallel.
+        """
+        part_size = self.PARALLEL_READ_SIZE
+        if not part_size or not self._seekable:
+            return 0
+        try:
+            size = self._size - start
+        except UnsupportedOperation:
+            # Size not available from header
+            return 0
+        return size if size > part_size else 0
+
+    def _read_range_into_parallel(self, start, buffer):
+        """
+        Read a range of bytes in stream directly into a buffer.
+
+        Ranges larger than "PARALLEL_READ_SIZE" are split in parts read in
+        parallel.
+
+        Args:
+            start (int): Start stream position.
+            buffer (memoryview): Writable buffer.
+
+        Returns:
+            int: number of bytes read
+        """
+        part_size = self.PARALLEL_READ_SIZE
+        size = len(buffer)
+        if not part_size or size <= part_size:
+            return self._read_range_into(start, buffer)
+
+        submit = self._system._workers.submit
+        futures = [(part_start, submit(
+            self._read_range_into, start + part_start,
+            buffer[part_start:part_start + part_size]))
+                   for part_start in range(0, size, part_size)]
+
+        # Wait all parts before returning to not write in the buffer after
+        wait([future for _, future in futures])
+
+        # Parts after a part stopped by the end of file are ignored
+        read_size = 0
+        for part_start, future in futures:
+            part_read_size = future.result()
+            if part_start == read_size:
+                read_size += part_read_size
+        return read_size
+
+    def read_ranges(self, ranges, max_gap=None):
+        """
+        Read many ranges of bytes.
+
+        Nearby ranges are merged to reduce the number of requests, up to
+        "RANGES_MAX_SIZE" bytes by request, and requests are performed in
+        parallel. The stream position is not changed.
+
+        Args:
+            ranges (iterable of tuple): Ranges to read as (offset, length).
+            max_gap (int): Maximum gap in bytes between two ranges to read
+                them in a single request. Default to "RANGES_MAX_GAP".
+
+        Returns:
+            list of memoryview: Read bytes of each range, in the same order as
+            "ranges". Ranges after the end of file are truncated.
+        """
+        if not self._readable:
+            raise UnsupportedOperation('read')
+
+        return self._read_ranges(ranges, max_gap, self._system._workers)
+
+    def _read_ranges(self, ranges, max_gap, workers):
+        """
+        Read many ranges of bytes.
+
+        Args:
+            ranges (iterable of tuple): Ranges to read as (offset, length).
+            max_gap (int): Maximum gap in bytes between two ranges to read
+                them in a single request. Default to "RANGES_MAX_GAP".
+            workers (concurrent.futures.Executor): Executor used to perform
+                requests.
+
+        Returns:
+            list of memoryview: Read bytes of each range.
+        """
+        ranges = tuple(ranges)
+        if max_gap is None:
+            max_gap = self.RANGES_MAX_GAP
+
+        max_size = self.RANGES_MAX_SIZE
+
+        # Merge nearby ranges as groups: [start, end, ranges indexes]
+        groups = []
+        results = [None] * len(ranges)
+        for index in sorted(range(len(ranges)), key=lambda i: ranges[i][0]):
+            offset, length = ranges[index]
+            if not length:
+                # Nothing to read
+                results[index] = memoryview(b'')
+                continue
+
+            elif groups and offset - groups[-1][1] <= max_gap and (
+                    not max_size or
+                    offset + length - groups[-1][0] <= max_size):
+                group = groups[-1]
+                group[1] = max(group[1], offset + length)
+                group[2].append(index)
+            else:
+                groups.append([offset, offset + length, [index]])
+
+        # Read merged ranges in parallel
+        reads = []
+        for start, end, indexes in groups:
+            buffer = memoryview(bytearray(end - start))
+            reads.append((start, buffer, indexes, workers.submit(
+                self._read_range_into, start, buffer)))
+
+        # Split merged ranges
+        for start, buffer, indexes, future in reads:
+            with handle_os_exceptions():
+                read_size = future.result()
+
+            for index in indexes:
+                offset, length = ranges[index]
+                range_start = offset - start
+                results[index] = buffer[range_start:max(range_start, min(
+                    range_start + length, read_size))]
+
+        return results
+
     def readinto(self, b):
         """
         Read bytes into a pre-allocated, writable bytes-like object b,
@@ -313,14 +645,9 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
             end = start + size
             self._seek = end
 
-        # Read data range
+        # Read data range directly in bytes-like object
         with handle_os_exceptions():
-            read_data = self._read_range(start, end)
-
-        # Copy to bytes-like object
-        read_size = len(read_data)
-        if read_size:
-            memoryview(b)[:read_size] = read_data
+            read_size = self._read_range_into_parallel(start, memoryview(b))
 
         # Update stream position if end of file
         if read_size != size:
@@ -344,6 +671,84 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
             bytes: number of bytes read
         """
 
+    def _read_range_into(self, start, buffer):
+        """
+        Read a range of bytes in stream directly into a buffer.
+
+        The range end is defined by the buffer size.
+
+        Default implementation copy the "_read_range" result in the buffer,
+        storage should override this method to write the response content
+        directly in the buffer when possible.
+
+        Args:
+            start (int): Start stream position.
+            buffer (memoryview): Writable buffer.
+
+        Returns:
+            int: number of bytes read
+        """
+        read_data = self._read_range(start, start + len(buffer))
+        read_size = len(read_data)
+        if read_size:
+            buffer[:read_size] = read_data
+        return read_size
+
+    def _open_range_stream(self, start, end=0):
+        """
+        Open a streaming request on a range of bytes, to read its content
+        incrementally.
+
+        Storage supporting streaming requests should override this method,
+        default implementation raises "UnsupportedOperation".
+
+        Args:
+            start (int): Start stream position.
+            end (int): End stream position.
+                0 To not specify end.
+
+        Returns:
+            file-like object: Response content, with "read" and "close"
+            methods.
+        """
+        raise UnsupportedOperation('_open_range_stream')
+
+    @staticmethod
+    def _read_stream_into(stream, buffer):
+        """
+        Read a file-like object response content into a buffer until the
+        buffer is full or the response content is exhausted.
+
+        Args:
+            stream (file-like object): Response content.
+            buffer (memoryview): Writable buffer.
+
+        Returns:
+            int: number of bytes read
+        """
+        size = len(buffer)
+        read_size = 0
+        try:
+            readinto = stream.readinto
+        except AttributeError:
+            readinto = None
+
+        while read_size < size:
+            if readinto is not None:
+                chunk_size = readinto(buffer[read_size:])
+            else:
+                # Response does not support "readinto", copy chunks
+                chunk = stream.read(size - read_size)
+                chunk_size = len(chunk)
+                buffer[read_size:read_size + chunk_size] = chunk
+
+            if not chunk_size:
+                # End of content
+                break
+            read_size += chunk_size
+
+        return read_size
+
     def seek(self, offset, whence=SEEK_SET):
         """
         Change the stream position to the given byte offset.
@@ -372,7 +777,7 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
         if self._writable:
             size = len(self._write_buffer)
             if seek > size:
-                self._write_buffer[seek:size] = b'\0' * (seek - size)
+                self._write_into_buffer(size, b'\0' * (seek - size))
 
         return seek
 
@@ -421,8 +826,5 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
             end = start + size
             self._seek = end
 
-        buffer = self._write_buffer
-        if end <= len(buffer):
-            buffer = memoryview(buffer)
-        buffer[start:end] = b
+        self._write_into_buffer(start, b)
         return size
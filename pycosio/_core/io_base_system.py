@@ -1,16 +1,21 @@
 # coding=utf-8
 """Cloud storage abstract System"""
 from abc import abstractmethod
-from collections import OrderedDict, namedtuple
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, wait
 from io import UnsupportedOperation
+from itertools import islice
 from re import compile
 from stat import S_IFDIR, S_IFREG, S_IFLNK
 
 from dateutil.parser import parse
 
-from pycosio._core.io_base import WorkerPoolBase
+from pycosio._core.io_base import WorkerPoolBase, memoizedmethod
+from pycosio._core.checksum import md5_from_content_md5
 from pycosio._core.compat import ABC, Pattern, to_timestamp
 from pycosio._core.exceptions import ObjectNotFoundError, ObjectPermissionError
+from pycosio._core.header_cache import HeaderCache
+from pycosio._core.retry import RetryPolicy
 
 
 class SystemBase(ABC, WorkerPoolBase):
@@ -30,18 +35,36 @@ class SystemBase(ABC, WorkerPoolBase):
         unsecure (bool): If True, disables TLS/SSL to improves
             transfer performance. But makes connection unsecure.
         roots (tuple): Tuple of roots to force use.
+        header_cache (float or pycosio.io.HeaderCache): Time to live in seconds
+            of cached objects headers, or existing headers cache. Headers are
+            cached on "head" calls and from listing results, and invalidated
+            by writes, removes and copies performed with pycosio. Default to
+            no cache.
     """
 
     # By default, assumes that information are in a standard HTTP header
     _SIZE_KEYS = ('Content-Length',)
     _CTIME_KEYS = ()
     _MTIME_KEYS = ('Last-Modified',)
+    _ETAG_KEYS = ('ETag', 'etag')
 
     # Caches compiled regular expression
     _CHAR_FILTER = compile(r'[^a-z0-9]*')
 
+    # Objects headers cache
+    _header_cache = None
+
+    # True if "_list_objects" supports the "first_level" argument
+    _LIST_FIRST_LEVEL = False
+
+    #: Maximum number of directories listed concurrently by parallel listing
+    LIST_PARALLEL_MAX_SHARDS = 16
+
+    #: Number of entries of a directory returned by each parallel listing task
+    LIST_PARALLEL_BATCH_SIZE = 1000
+
     def __init__(self, storage_parameters=None, unsecure=False, roots=None,
-                 **_):
+                 header_cache=None, **_):
         # Initialize worker pool
         WorkerPoolBase.__init__(self)
 
@@ -65,6 +88,12 @@ class SystemBase(ABC, WorkerPoolBase):
         # Cache for values
         self._cache = {}
 
+        # Cache for objects headers
+        if header_cache is not None and not isinstance(
+                header_cache, HeaderCache):
+            header_cache = HeaderCache(ttl=header_cache)
+        self._header_cache = header_cache
+
         # Initialize roots
         if roots:
             self._roots = roots
@@ -81,6 +110,19 @@ class SystemBase(ABC, WorkerPoolBase):
         """
         return self._storage
 
+    @property
+    @memoizedmethod
+    def _retry_policy(self):
+        """
+        Retry policy used by default by streams of this system.
+
+        The policy is shared to measure reads latency over all streams.
+
+        Returns:
+            pycosio.io.RetryPolicy: Retry policy.
+        """
+        return RetryPolicy()
+
     @property
     def client(self):
         """
@@ -224,6 +266,45 @@ class SystemBase(ABC, WorkerPoolBase):
         """
         return self._get_time(header, self._MTIME_KEYS, 'getmtime')
 
+    def _getversion_from_header(self, header):
+        """
+        Return an identifier of the object version from header.
+
+        The ETag is used if available, else the modification time.
+
+        Args:
+            header (dict): Object header.
+
+        Returns:
+            str: Version, or None if not available.
+        """
+        for key in self._ETAG_KEYS:
+            try:
+                return str(header[key])
+            except KeyError:
+                continue
+        try:
+            return repr(self._getmtime_from_header(header.copy()))
+        except UnsupportedOperation:
+            return None
+
+    def _getmd5_from_header(self, header):
+        """
+        Return the MD5 of the full object content from header.
+
+        The "Content-MD5" header is used if available.
+
+        Args:
+            header (dict): Object header.
+
+        Returns:
+            str: MD5 hex digest, or None if not available.
+        """
+        try:
+            return md5_from_content_md5(header['Content-MD5'])
+        except KeyError:
+            return None
+
     @staticmethod
     def _get_time(header, keys, name):
         """
@@ -382,7 +463,7 @@ class SystemBase(ABC, WorkerPoolBase):
             dict: HTTP header.
         """
 
-    def head(self, path=None, client_kwargs=None, header=None):
+    def head(self, path=None, client_kwargs=None, header=None, partial=True):
         """
         Returns object HTTP header.
 
@@ -390,6 +471,9 @@ class SystemBase(ABC, WorkerPoolBase):
             path (str): Path or URL.
             client_kwargs (dict): Client arguments.
             header (dict): Object header.
+            partial (bool): If False, does not return a cached header built
+                from listing results, that may miss some values (Like
+                checksums or metadata).
 
         Returns:
             dict: HTTP header.
@@ -398,7 +482,75 @@ class SystemBase(ABC, WorkerPoolBase):
             return header
         elif client_kwargs is None:
             client_kwargs = self.get_client_kwargs(path)
-        return self._head(client_kwargs)
+
+        header_cache = self._header_cache
+        if header_cache is None:
+            return self._head(client_kwargs)
+
+        header = header_cache.get(client_kwargs, partial)
+        if header is None:
+            header = self._head(client_kwargs)
+            header_cache.set(client_kwargs, header)
+        return header
+
+    @property
+    def header_cache(self):
+        """
+        Objects headers cache.
+
+        Returns:
+            pycosio.io.HeaderCache: Cache, or None if disabled.
+        """
+        return self._header_cache
+
+    def invalidate_header(self, path=None, client_kwargs=None):
+        """
+        Remove an object header from the headers cache, if enabled.
+
+        Must be called after an object is modified.
+
+        Args:
+            path (str): Path or URL.
+            client_kwargs (dict): Client arguments.
+        """
+        if self._header_cache is not None:
+            if client_kwargs is None:
+                client_kwargs = self.get_client_kwargs(path)
+            self._header_cache.invalidate(client_kwargs)
+
+    def _header_from_listing(self, header):
+        """
+        Returns the header of an object from the header returned by listing.
+
+        Used to populate the headers cache with partial headers, that are not
+        used by streams and "stat".
+
+        Args:
+            header (dict): Object header from listing.
+
+        Returns:
+            dict: Object header compatible with "head" results, or None if not
+                available.
+        """
+        # Listing headers differ from "head" headers by default
+        return None
+
+    def _cache_listed_header(self, locator, obj_path, header):
+        """
+        Cache the header of a listed object, if the headers cache is enabled.
+
+        Args:
+            locator (str): Locator.
+            obj_path (str): Object path relative to locator.
+            header (dict): Object header from listing.
+        """
+        if not header or obj_path.endswith('/'):
+            return
+        header = self._header_from_listing(header.copy())
+        if header is not None:
+            self._header_cache.set(self.get_client_kwargs(
+                '/'.join((locator, obj_path.lstrip('/')))), header,
+                partial=True)
 
     @property
     def roots(self):
@@ -496,8 +648,10 @@ class SystemBase(ABC, WorkerPoolBase):
         """
         if not relative:
             path = self.relpath(path)
-        self._make_dir(self.get_client_kwargs(self.ensure_dir_path(
-            path, relative=True)))
+        client_kwargs = self.get_client_kwargs(self.ensure_dir_path(
+            path, relative=True))
+        self._make_dir(client_kwargs)
+        self.invalidate_header(client_kwargs=client_kwargs)
 
     def _make_dir(self, client_kwargs):
         """
@@ -518,7 +672,9 @@ class SystemBase(ABC, WorkerPoolBase):
         """
         if not relative:
             path = self.relpath(path)
-        self._remove(self.get_client_kwargs(path))
+        client_kwargs = self.get_client_kwargs(path)
+        self._remove(client_kwargs)
+        self.invalidate_header(client_kwargs=client_kwargs)
 
     def _remove(self, client_kwargs):
         """
@@ -558,7 +714,7 @@ class SystemBase(ABC, WorkerPoolBase):
         return path
 
     def list_objects(self, path='', relative=False, first_level=False,
-                     max_request_entries=None):
+                     max_request_entries=None, parallel=False, ordered=True):
         """
         List objects.
 
@@ -569,16 +725,30 @@ class SystemBase(ABC, WorkerPoolBase):
                 Else, returns full tree.
             max_request_entries (int): If specified, maximum entries returned
                 by request.
+            parallel (bool): If True, full tree is listed by sub directories
+                in parallel on the worker pool. Only for storage supporting
+                delimiter listing, else ignored.
+            ordered (bool): If False, with "parallel", objects are returned as
+                soon as listed instead of in the storage listing order.
 
         Returns:
             generator of tuple: object name str, object header dict
         """
         entries = 0
         max_request_entries_arg = None
+        cache_headers = self._header_cache is not None
 
         if not relative:
             path = self.relpath(path)
 
+        if parallel and not first_level and self._LIST_FIRST_LEVEL:
+            def list_tree(client_kwargs, path, max_request_entries):
+                """Lists objects tree in parallel"""
+                return self._list_objects_parallel(
+                    client_kwargs, path, max_request_entries, ordered)
+        else:
+            list_tree = self._list_objects
+
         # From root
         if not path:
             locators = self._list_locators()
@@ -608,10 +778,14 @@ class SystemBase(ABC, WorkerPoolBase):
                 if max_request_entries is not None:
                     max_request_entries_arg = max_request_entries - entries
                 try:
-                    for obj_path, obj_header in self._list_objects(
+                    for obj_path, obj_header in list_tree(
                             self.get_client_kwargs(loc_path), '',
                             max_request_entries_arg):
 
+                        if cache_headers:
+                            self._cache_listed_header(
+                                loc_path, obj_path, obj_header)
+
                         entries += 1
                         yield ('/'.join((loc_path, obj_path.lstrip('/'))),
                                obj_header)
@@ -626,14 +800,27 @@ class SystemBase(ABC, WorkerPoolBase):
         # From locator or sub directory
         locator, path = self.split_locator(path)
 
+        list_kwargs = dict()
+        list_function = list_tree
         if first_level:
             seen = set()
+            list_function = self._list_objects
+
+            # Lists only first level with the storage delimiter
+            if self._LIST_FIRST_LEVEL:
+                list_kwargs['first_level'] = True
+                if path and not path.endswith('/'):
+                    path += '/'
 
         if max_request_entries is not None:
             max_request_entries_arg = max_request_entries - entries
 
-        for obj_path, header in self._list_objects(
-                self.get_client_kwargs(locator), path, max_request_entries_arg):
+        for obj_path, header in list_function(
+                self.get_client_kwargs(locator), path, max_request_entries_arg,
+                **list_kwargs):
+
+            if cache_headers:
+                self._cache_listed_header(locator, obj_path, header)
 
             if path:
                 try:
@@ -677,6 +864,155 @@ class SystemBase(ABC, WorkerPoolBase):
                 if entries == max_request_entries:
                     return
 
+    def _list_objects_parallel(self, client_kwargs, path, max_request_entries,
+                               ordered=True):
+        """
+        Lists objects tree, sharded by sub directories.
+
+        Each directory is listed with the storage delimiter, by batches of
+        "LIST_PARALLEL_BATCH_SIZE" entries, and its sub directories are listed
+        in parallel on the worker pool as soon as they are discovered, with at
+        most "LIST_PARALLEL_MAX_SHARDS" directories listed ahead.
+
+        In ordered mode, directories are listed ahead in the returned order,
+        and the directories being returned are always listed.
+
+        args:
+            client_kwargs (dict): Client arguments.
+            path (str): Path relative to current locator.
+            max_request_entries (int): If specified, maximum entries returned
+                by request.
+            ordered (bool): If True, returns objects in the same order than
+                "_list_objects". Else, returns objects as soon as listed.
+
+        Returns:
+            generator of tuple: object name str, object header dict
+        """
+        max_shards = self.LIST_PARALLEL_MAX_SHARDS
+        started = set()
+
+        def list_objects(prefix):
+            """
+            Lists a directory first level.
+
+            Args:
+                prefix (str): Directory prefix.
+
+            Returns:
+                generator of tuple: object name str, object header dict
+            """
+            return self._list_objects(
+                client_kwargs, prefix, max_request_entries, first_level=True)
+
+        def new_shard(prefix):
+            """
+            Returns a directory listing, not started.
+
+            Args:
+                prefix (str): Directory prefix.
+
+            Returns:
+                _ListShard: Directory listing.
+            """
+            return _ListShard(prefix, list_objects, self._workers,
+                              self.LIST_PARALLEL_BATCH_SIZE)
+
+        def next_batch(shard):
+            """
+            Returns the next batch of a directory listing.
+
+            Args:
+                shard (_ListShard): Directory listing.
+
+            Returns:
+                list of tuple: object name str, object header dict
+            """
+            batch = shard.result()
+            if shard.future is None:
+                started.discard(shard)
+            return batch
+
+        def is_sub_directory(name, prefix):
+            """
+            Returns True if a listed name is a sub directory of the prefix.
+
+            Args:
+                name (str): Listed name.
+                prefix (str): Listed directory prefix.
+
+            Returns:
+                bool: True if sub directory.
+            """
+            return '/' in name[len(prefix):]
+
+        try:
+            # Returns objects as soon as directories are listed
+            if not ordered:
+                waiting = deque((path,))
+                while waiting or started:
+                    while waiting and len(started) < max_shards:
+                        shard = new_shard(waiting.popleft())
+                        shard.start()
+                        started.add(shard)
+
+                    shards = {shard.future: shard for shard in started}
+                    for future in wait(
+                            shards, return_when=FIRST_COMPLETED)[0]:
+                        shard = shards[future]
+                        for name, header in next_batch(shard):
+                            if is_sub_directory(name, shard.prefix):
+                                waiting.append(name)
+                            else:
+                                yield name, header
+                return
+
+            # Returns objects in lexicographic order: Objects of a sub
+            # directory are all between the sub directory name and the next
+            # listed name. Each level is a directory listing, its remaining
+            # entries, and its sub directories not started yet.
+            shard = new_shard(path)
+            shard.start()
+            started.add(shard)
+            levels = [(shard, deque(), deque())]
+            while levels:
+                shard, entries, waiting = levels[-1]
+                if not entries:
+                    if shard.future is None:
+                        levels.pop()
+                        continue
+
+                    for name, header in next_batch(shard):
+                        if is_sub_directory(name, shard.prefix):
+                            sub_shard = new_shard(name)
+                            entries.append((name, None, sub_shard))
+                            waiting.append(sub_shard)
+                        else:
+                            entries.append((name, header, None))
+
+                    # Lists ahead next directories, in the returned order
+                    for _, _, level_waiting in reversed(levels):
+                        while level_waiting and len(started) < max_shards:
+                            sub_shard = level_waiting.popleft()
+                            if not sub_shard.started:
+                                sub_shard.start()
+                                started.add(sub_shard)
+                    continue
+
+                name, header, sub_shard = entries.popleft()
+                if sub_shard is None:
+                    yield name, header
+                    continue
+
+                if not sub_shard.started:
+                    sub_shard.start()
+                    started.add(sub_shard)
+                levels.append((sub_shard, deque(), deque()))
+
+        finally:
+            # Stops listing remaining directories
+            for shard in started:
+                shard.cancel()
+
     def _list_locators(self):
         """
         Lists locators.
@@ -690,6 +1026,11 @@ class SystemBase(ABC, WorkerPoolBase):
         """
         Lists objects.
 
+        Storage that can list only first level objects server side should set
+        "_LIST_FIRST_LEVEL" to True and accept a "first_level" argument. First
+        level objects and sub directories must then be returned together in
+        lexicographic order.
+
         args:
             client_kwargs (dict): Client arguments.
             path (str): Path relative to current locator.
@@ -734,7 +1075,7 @@ class SystemBase(ABC, WorkerPoolBase):
             ("st_mtime", 0), ("st_ctime", 0)))
 
         # Populate standard os.stat_result values with object header content
-        header = self.head(path, client_kwargs, header)
+        header = self.head(path, client_kwargs, header, partial=False)
         for key, method in (
                 ('st_size', self._getsize_from_header),
                 ('st_ctime', self._getctime_from_header),
@@ -766,3 +1107,67 @@ class SystemBase(ABC, WorkerPoolBase):
         stat_result.__name__ = 'os.stat_result'
         stat_result.__module__ = 'pycosio'
         return stat_result(**stat)
+
+
+class _ListShard:
+    """
+    Directory listed in background tasks, by batches of entries.
+
+    Only one batch is listed ahead of the consumed one.
+
+    Args:
+        prefix (str): Directory prefix.
+        list_objects (callable): Function returning the directory entries
+            generator from the prefix.
+        workers (concurrent.futures.Executor): Executor running tasks.
+        batch_size (int): Number of entries by batch.
+    """
+
+    def __init__(self, prefix, list_objects, workers, batch_size):
+        self.prefix = prefix
+        self.future = None
+        self.started = False
+        self._list_objects = list_objects
+        self._workers = workers
+        self._batch_size = batch_size
+        self._objects = None
+
+    def start(self):
+        """
+        Start listing the next batch in background.
+        """
+        self.started = True
+        self.future = self._workers.submit(self._list_batch)
+
+    def _list_batch(self):
+        """
+        List a batch.
+
+        Returns:
+            list of tuple: object name str, object header dict
+        """
+        if self._objects is None:
+            self._objects = self._list_objects(self.prefix)
+        return list(islice(self._objects, self._batch_size))
+
+    def result(self):
+        """
+        Wait for the current batch, and start listing the next one if any.
+
+        Returns:
+            list of tuple: object name str, object header dict
+        """
+        batch = self.future.result()
+        if len(batch) < self._batch_size:
+            # Directory fully listed
+            self.future = None
+        else:
+            self.start()
+        return batch
+
+    def cancel(self):
+        """
+        Cancel the listing of the next batch.
+        """
+        if self.future is not None:
+            self.future.cancel()
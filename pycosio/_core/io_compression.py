@@ -0,0 +1,389 @@
+# coding=utf-8
+"""Streaming compression of binary streams"""
+from bz2 import BZ2Compressor, BZ2Decompressor
+from io import RawIOBase, UnsupportedOperation
+from threading import Thread
+import zlib
+
+try:
+    from queue import Queue, Empty
+except ImportError:
+    # Python 2
+    from Queue import Queue, Empty
+
+try:
+    from lzma import LZMACompressor, LZMADecompressor
+except ImportError:
+    # Python 2
+    LZMACompressor = LZMADecompressor = None
+
+try:
+    import zstandard as _zstd
+except ImportError:
+    _zstd = None
+
+
+def _gzip_compressor():
+    """
+    Returns a gzip compressor.
+
+    Returns:
+        zlib.Compress: Compressor.
+    """
+    return zlib.compressobj(
+        zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+
+def _gzip_decompressor():
+    """
+    Returns a gzip decompressor.
+
+    Returns:
+        zlib.Decompress: Decompressor.
+    """
+    return zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+
+#: Supported compressions, mapped to compressor and decompressor factories
+COMPRESSIONS = {
+    'gzip': (_gzip_compressor, _gzip_decompressor),
+    'bz2': (BZ2Compressor, BZ2Decompressor)}
+if LZMACompressor is not None:
+    COMPRESSIONS['xz'] = (LZMACompressor, LZMADecompressor)
+if _zstd is not None:
+    COMPRESSIONS['zstd'] = (
+        lambda: _zstd.ZstdCompressor().compressobj(),
+        lambda: _zstd.ZstdDecompressor().decompressobj())
+
+
+def get_codec(compression):
+    """
+    Returns compressor and decompressor factories of a compression.
+
+    Args:
+        compression (str): Compression name. See "COMPRESSIONS".
+
+    Returns:
+        tuple of callable: Compressor and decompressor factories.
+
+    Raises:
+        ValueError: Unsupported compression.
+    """
+    try:
+        return COMPRESSIONS[compression]
+    except KeyError:
+        raise ValueError('Unsupported compression: %s (Supported: %s)' % (
+            compression, ', '.join(sorted(COMPRESSIONS))))
+
+
+class CompressedRawIO(RawIOBase):
+    """
+    Stream compressing or decompressing a binary stream.
+
+    Compression and decompression run in a dedicated background thread, so
+    they overlap with both the stream consumer and the transfers of the
+    compressed stream. In read mode, content is decompressed ahead of the
+    consumer; In write mode, content is compressed while the consumer
+    continues to write.
+
+    Streams made of many concatenated compressed streams are supported in
+    read mode. In append mode, a new compressed stream is appended.
+
+    The compressed stream is not closed with this stream.
+
+    Args:
+        stream (file-like object): Compressed binary stream.
+        mode (str): The mode can be 'r', 'w', 'a', 'x'
+            for reading (default), writing or appending.
+        compression (str): Compression name. See "COMPRESSIONS".
+    """
+
+    #: Size in bytes of chunks read from the compressed stream, and of the
+    #: buffer of buffered streams wrapping this stream
+    CHUNK_SIZE = 1048576
+
+    #: Maximum number of chunks waiting for the consumer in read mode, or
+    #: waiting for compression in write mode
+    MAX_CHUNKS = 8
+
+    def __init__(self, stream, mode='r', compression='gzip'):
+        RawIOBase.__init__(self)
+        compressor, decompressor = get_codec(compression)
+
+        self._stream = stream
+        self._compression = compression
+        self._readable = 'r' in mode
+        self._writable = not self._readable
+        self._seek = 0
+        self._chunk = memoryview(b'')
+        self._queue = Queue(maxsize=self.MAX_CHUNKS)
+        self._exception = None
+        self._stopped = False
+
+        if self._readable:
+            self._decompressor = decompressor
+            target = self._decompress
+        else:
+            self._compressor = compressor()
+            target = self._compress
+
+        self._thread = Thread(target=target)
+        self._thread.daemon = True
+        self._thread.start()
+
+    @property
+    def compression(self):
+        """
+        Compression name.
+
+        Returns:
+            str: Compression.
+        """
+        return self._compression
+
+    @property
+    def name(self):
+        """
+        The file name.
+
+        Returns:
+            str: Name.
+        """
+        return getattr(self._stream, 'name', None)
+
+    def readable(self):
+        """
+        Return True if the stream can be read from.
+
+        Returns:
+            bool: True if the stream can be read from.
+        """
+        return self._readable
+
+    def writable(self):
+        """
+        Return True if the stream supports writing.
+
+        Returns:
+            bool: True if the stream supports writing.
+        """
+        return self._writable
+
+    def seekable(self):
+        """
+        Return True if the stream supports random access.
+
+        Returns:
+            bool: Always False.
+        """
+        return False
+
+    def seek(self, offset, whence=0):
+        """
+        Not supported.
+
+        Raises:
+            io.UnsupportedOperation: Always.
+        """
+        raise UnsupportedOperation('seek')
+
+    def tell(self):
+        """
+        Return the current position in the uncompressed content.
+
+        Returns:
+            int: Position.
+        """
+        return self._seek
+
+    def readinto(self, b):
+        """
+        Read bytes into a pre-allocated, writable bytes-like object b,
+        and return the number of bytes read.
+
+        Args:
+            b (bytes-like object): buffer.
+
+        Returns:
+            int: number of bytes read
+        """
+        if not self._readable:
+            raise UnsupportedOperation('read')
+
+        while not self._chunk:
+            chunk = self._queue.get()
+            if chunk is None:
+                # End of stream, keep it marked for next calls
+                self._queue.put(None)
+                self._raise_exception()
+                return 0
+            self._chunk = memoryview(chunk)
+
+        size = min(len(b), len(self._chunk))
+        memoryview(b)[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        self._seek += size
+        return size
+
+    def write(self, b):
+        """
+        Write the given bytes-like object, b, to the compressed stream.
+
+        Args:
+            b (bytes-like object): Bytes to write.
+
+        Returns:
+            int: The number of bytes written.
+        """
+        if not self._writable:
+            raise UnsupportedOperation('write')
+        self._raise_exception()
+
+        # Copy data, because the buffer may be reused by the caller
+        data = bytes(b)
+        if data:
+            self._queue.put(data)
+            self._seek += len(data)
+        return len(data)
+
+    def close(self):
+        """
+        Flush the compressed content and close the stream.
+
+        The compressed stream is not closed.
+        """
+        if self.closed:
+            return
+
+        self._stopped = True
+        if self._writable:
+            # Wait for compression completion
+            self._queue.put(None)
+            self._thread.join()
+
+        else:
+            # Unlock the decompression thread
+            while self._thread.is_alive():
+                try:
+                    self._queue.get(timeout=0.01)
+                except Empty:
+                    continue
+            self._thread.join()
+
+        RawIOBase.close(self)
+        if self._writable:
+            self._raise_exception()
+
+    def _raise_exception(self):
+        """
+        Raise the exception of the background thread, if any.
+        """
+        if self._exception is not None:
+            raise self._exception
+
+    def _put(self, chunk):
+        """
+        Put a decompressed chunk in the queue.
+
+        Args:
+            chunk (bytes): Decompressed data.
+        """
+        if chunk:
+            self._queue.put(chunk)
+
+    def _decompress(self):
+        """
+        Read and decompress the stream, in the background thread.
+        """
+        try:
+            decompressor = self._decompressor()
+            started = False
+            while not self._stopped:
+                data = self._stream.read(self.CHUNK_SIZE)
+                if not data:
+                    break
+
+                while data:
+                    if getattr(decompressor, 'eof', False):
+                        # Concatenated compressed streams
+                        decompressor = self._decompressor()
+                    started = True
+                    for chunk in self._decompress_chunk(decompressor, data):
+                        self._put(chunk)
+                    data = getattr(decompressor, 'unused_data', b'')
+
+            if started and not self._stopped:
+                flush = getattr(decompressor, 'flush', None)
+                if flush is not None:
+                    self._put(flush())
+                if not getattr(decompressor, 'eof', True):
+                    raise EOFError('Compressed stream ended before the '
+                                   'end-of-stream marker was reached')
+
+        except Exception as exception:
+            self._exception = exception
+
+        self._queue.put(None)
+
+    def _decompress_chunk(self, decompressor, data):
+        """
+        Decompress a compressed chunk, by pieces of at most "CHUNK_SIZE" bytes
+        if supported by the decompressor.
+
+        Args:
+            decompressor (object): Decompressor.
+            data (bytes): Compressed data.
+
+        Returns:
+            generator of bytes: Decompressed data.
+        """
+        max_length = self.CHUNK_SIZE
+        try:
+            chunk = decompressor.decompress(data, max_length)
+        except TypeError:
+            # Output size can't be limited (zstd, Python 2 bz2)
+            yield decompressor.decompress(data)
+            return
+        yield chunk
+
+        while not self._stopped and not getattr(decompressor, 'eof', False):
+            # zlib: Input not consumed is returned
+            tail = getattr(decompressor, 'unconsumed_tail', None)
+            if tail is not None:
+                chunk = tail and decompressor.decompress(tail, max_length)
+                if not chunk:
+                    # All input consumed, or end of stream reached
+                    return
+                yield chunk
+
+            # bz2 and lzma: Input not consumed is kept by the decompressor
+            elif decompressor.needs_input:
+                return
+            else:
+                yield decompressor.decompress(b'', max_length)
+
+    def _compress(self):
+        """
+        Compress and write the stream, in the background thread.
+        """
+        compressor = self._compressor
+        while True:
+            data = self._queue.get()
+            if self._exception is not None:
+                # Drop data after an error, and wait the end
+                if data is None:
+                    return
+                continue
+
+            try:
+                if data is None:
+                    self._stream.write(compressor.flush())
+                    return
+                compressed = compressor.compress(data)
+                if compressed:
+                    self._stream.write(compressed)
+
+            except Exception as exception:
+                self._exception = exception
+                if data is None:
+                    return
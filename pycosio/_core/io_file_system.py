@@ -11,7 +11,7 @@ class FileSystemBase(SystemBase):
     """
 
     def list_objects(self, path='', relative=False, first_level=False,
-                     max_request_entries=None):
+                     max_request_entries=None, parallel=False, ordered=True):
         """
         List objects.
 
@@ -22,6 +22,9 @@ class FileSystemBase(SystemBase):
                 Else, returns full tree.
             max_request_entries (int): If specified, maximum entries returned
                 by request.
+            parallel (bool): Not used, sub directories are always listed in
+                background.
+            ordered (bool): Not used.
 
         Returns:
             generator of tuple: object name str, object header dict
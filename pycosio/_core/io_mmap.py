@@ -0,0 +1,361 @@
+# coding=utf-8
+"""Cloud storage read-only memory map"""
+from os import SEEK_CUR, SEEK_END, SEEK_SET
+from threading import Lock
+
+from pycosio._core.block_cache import BlockCache
+from pycosio._core.exceptions import handle_os_exceptions
+
+
+class ObjectMemoryMap:
+    """
+    Read-only memory map of a cloud storage object.
+
+    Provides a subset of the "mmap.mmap" interface. Pages of the object are
+    lazily read with range requests when accessed, and kept in a bounded
+    least recently used page cache, so only accessed parts of the object are
+    downloaded.
+
+    Args:
+        raw (pycosio.io.ObjectRawIOBase subclass): Raw stream of the object,
+            opened in read mode.
+        page_size (int): Size in bytes of pages to read.
+        cache_size (int): Size in bytes of the page cache.
+        cache (pycosio.io.BlockCache): Existing cache to use instead of
+            "cache_size". Allows to share a cache between memory maps.
+        close_raw (bool): If True, close the raw stream when closing the map.
+    """
+
+    #: Default page_size value in bytes (Default to 1MB)
+    DEFAULT_PAGE_SIZE = 1048576
+
+    #: Default cache_size value in bytes (Default to 64MB)
+    DEFAULT_CACHE_SIZE = 67108864
+
+    def __init__(self, raw, page_size=None, cache_size=None, cache=None,
+                 close_raw=True):
+        if not raw.readable():
+            raise ValueError('Memory map requires a stream in read mode')
+
+        self._raw = raw
+        self._close_raw = close_raw
+        self._name = raw.name
+
+        # Get size from stream end, that may differ from object size if the
+        # storage ignore padding
+        with raw._seek_lock:
+            position = raw._seek
+        self._size = raw.seek(0, SEEK_END)
+        raw.seek(position)
+        self._page_size = page_size or self.DEFAULT_PAGE_SIZE
+
+        # Avoids to use pages of a previous version of the object
+        self._version = raw._system._getversion_from_header(raw._head())
+
+        self._shared_cache = cache is not None
+        self._cache = cache if cache is not None else BlockCache(
+            cache_size or self.DEFAULT_CACHE_SIZE)
+        self._seek = 0
+        self._seek_lock = Lock()
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, key):
+        self._check_closed()
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._size)
+            if step == 1:
+                return self._read(start, stop)
+            elif step > 0:
+                return self._read(start, stop)[::step]
+            elif stop >= start:
+                return bytes()
+            return self._read(stop + 1, start + 1)[::step]
+
+        if key < 0:
+            key += self._size
+        if not 0 <= key < self._size:
+            raise IndexError('mmap index out of range')
+        return self._read(key, key + 1)[0]
+
+    def __setitem__(self, key, value):
+        raise TypeError("mmap can't modify a readonly memory map.")
+
+    @property
+    def closed(self):
+        """
+        True if the memory map is closed.
+
+        Returns:
+            bool: Closed.
+        """
+        return self._closed
+
+    @property
+    def name(self):
+        """
+        The file name.
+
+        Returns:
+            str: Name.
+        """
+        return self._name
+
+    def close(self):
+        """
+        Close the memory map and clear its pages if the cache is not shared.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if not self._shared_cache:
+            self._cache.clear()
+        if self._close_raw:
+            self._raw.close()
+
+    def _check_closed(self):
+        """
+        Raise if the memory map is closed.
+
+        Raises:
+            ValueError: Memory map is closed.
+        """
+        if self._closed:
+            raise ValueError('mmap closed or invalid')
+
+    def size(self):
+        """
+        Return the object size.
+
+        Returns:
+            int: Size in bytes.
+        """
+        return self._size
+
+    def tell(self):
+        """
+        Return the current position.
+
+        Returns:
+            int: Position.
+        """
+        return self._seek
+
+    def seek(self, pos, whence=SEEK_SET):
+        """
+        Change the current position.
+
+        Args:
+            pos (int): Position relative to the position indicated by whence.
+            whence (int): SEEK_SET, SEEK_CUR or SEEK_END.
+
+        Returns:
+            int: The new absolute position.
+        """
+        self._check_closed()
+        with self._seek_lock:
+            if whence == SEEK_CUR:
+                pos += self._seek
+            elif whence == SEEK_END:
+                pos += self._size
+            elif whence != SEEK_SET:
+                raise ValueError('unknown seek type')
+            if not 0 <= pos <= self._size:
+                raise ValueError('seek out of range')
+            self._seek = pos
+        return pos
+
+    def read(self, n=None):
+        """
+        Read bytes from the current position, and advance the position.
+
+        Args:
+            n (int): Number of bytes to read. None or negative to read until
+                the end of the object.
+
+        Returns:
+            bytes: Read bytes.
+        """
+        self._check_closed()
+        with self._seek_lock:
+            start = self._seek
+            end = self._size if n is None or n < 0 else min(
+                start + n, self._size)
+            self._seek = max(start, end)
+        return self._read(start, end)
+
+    def read_byte(self):
+        """
+        Read one byte from the current position, and advance the position.
+
+        Returns:
+            int: Read byte.
+        """
+        self._check_closed()
+        with self._seek_lock:
+            start = self._seek
+            if start >= self._size:
+                raise ValueError('read byte out of range')
+            self._seek += 1
+        return self._read(start, start + 1)[0]
+
+    def readline(self):
+        """
+        Read a line from the current position, and advance the position.
+
+        Returns:
+            bytes: Read line.
+        """
+        self._check_closed()
+        with self._seek_lock:
+            start = self._seek
+            end = self.find(b'\n', start)
+            end = self._size if end == -1 else end + 1
+            self._seek = max(start, end)
+        return self._read(start, end)
+
+    def find(self, sub, start=None, end=None):
+        """
+        Return the lowest index where the sub-sequence "sub" is found, such as
+        "sub" is contained in the range [start, end].
+
+        Pages are read one by one until "sub" is found.
+
+        Args:
+            sub (bytes-like object): Sub-sequence to find.
+            start (int): Start position. Default to current position.
+            end (int): End position. Default to end of object.
+
+        Returns:
+            int: Index, or -1 on failure.
+        """
+        self._check_closed()
+        start, end = self._search_range(start, end)
+        sub_size = len(sub)
+        if not sub_size:
+            return start if start <= end else -1
+
+        while start < end:
+            page_end = (start // self._page_size + 1) * self._page_size
+            index = self._read(
+                start, min(end, page_end + sub_size - 1)).find(sub)
+            if index != -1:
+                return start + index
+            start = page_end
+        return -1
+
+    def rfind(self, sub, start=None, end=None):
+        """
+        Return the highest index where the sub-sequence "sub" is found, such as
+        "sub" is contained in the range [start, end].
+
+        Pages are read one by one, from the end, until "sub" is found.
+
+        Args:
+            sub (bytes-like object): Sub-sequence to find.
+            start (int): Start position. Default to current position.
+            end (int): End position. Default to end of object.
+
+        Returns:
+            int: Index, or -1 on failure.
+        """
+        self._check_closed()
+        start, end = self._search_range(start, end)
+        sub_size = len(sub)
+        if not sub_size:
+            return end if start <= end else -1
+
+        while end - start >= sub_size:
+            page_start = ((end - 1) // self._page_size) * self._page_size
+            window_start = max(start, page_start - sub_size + 1)
+            index = self._read(window_start, end).rfind(sub)
+            if index != -1:
+                return window_start + index
+            elif window_start == start:
+                break
+            end = window_start + sub_size - 1
+        return -1
+
+    def _search_range(self, start, end):
+        """
+        Returns search range as positive positions.
+
+        Args:
+            start (int): Start position. Default to current position.
+            end (int): End position. Default to end of object.
+
+        Returns:
+            tuple of int: start, end
+        """
+        if start is None:
+            start = self._seek
+        if end is None:
+            end = self._size
+        return slice(start, end).indices(self._size)[:2]
+
+    def _read(self, start, end):
+        """
+        Read a range of bytes from pages.
+
+        Missing pages are read with as few requests as possible.
+
+        Args:
+            start (int): Start position.
+            end (int): End position.
+
+        Returns:
+            bytes: Read bytes.
+        """
+        end = min(end, self._size)
+        if start >= end:
+            return bytes()
+
+        page_size = self._page_size
+        first_index = start // page_size
+        indexes = range(first_index, (end - 1) // page_size + 1)
+
+        # Get pages from cache
+        pages = {index: self._cache.get(self._cache_key(index))
+                 for index in indexes}
+
+        # Read missing pages, adjacent pages are merged in a single request
+        missing = [index for index in indexes if pages[index] is None]
+        if missing:
+            with handle_os_exceptions():
+                read_pages = self._raw._read_ranges(
+                    ((index * page_size, page_size) for index in missing),
+                    0, self._raw._system._workers)
+
+            for index, page in zip(missing, read_pages):
+                page = page.tobytes()
+
+                # Restore null chars stripped by storage that ignore padding
+                page_end = min((index + 1) * page_size, self._size)
+                page += b'\0' * (page_end - index * page_size - len(page))
+
+                pages[index] = page
+                self._cache.put(self._cache_key(index), page)
+
+        data = b''.join(pages[index] for index in indexes)
+        offset = first_index * page_size
+        return data[start - offset:end - offset]
+
+    def _cache_key(self, index):
+        """
+        Returns the page cache key of a page.
+
+        Args:
+            index (int): Page index.
+
+        Returns:
+            tuple: Cache key.
+        """
+        return self._name, self._version, self._size, self._page_size, index
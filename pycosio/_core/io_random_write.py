@@ -4,7 +4,6 @@ from abc import abstractmethod
 from functools import partial
 from io import UnsupportedOperation
 from os import SEEK_SET
-from time import sleep
 
 from pycosio._core.io_base_raw import ObjectRawIOBase
 from pycosio._core.io_base_buffered import ObjectBufferedIOBase
@@ -37,11 +36,13 @@ class ObjectRawIORandomWriteBase(ObjectRawIOBase):
                 start = end - len(buffer)
 
                 # Clear buffer
+                self._close_write_spool()
                 self._write_buffer = bytearray()
 
             # Flush content
             with handle_os_exceptions():
                 self._flush(buffer, start, end)
+            self._system.invalidate_header(client_kwargs=self._client_kwargs)
 
     @abstractmethod
     def _flush(self, buffer, start, end):
@@ -61,6 +62,7 @@ class ObjectRawIORandomWriteBase(ObjectRawIOBase):
         Create the file if not exists.
         """
         self._flush(memoryview(b''), 0, 0)
+        self._system.invalidate_header(client_kwargs=self._client_kwargs)
 
     def seek(self, offset, whence=SEEK_SET):
         """
@@ -98,6 +100,15 @@ class ObjectBufferedIORandomWriteBase(ObjectBufferedIOBase):
     # Need to be flagged because it is not an abstract class
     __DEFAULT_CLASS = False
 
+    def _init_append(self):
+        """
+        Initializes file on 'a' mode.
+
+        Buffers are flushed after the existing content.
+        """
+        self._raw._init_append()
+        self._append_offset = self._raw._seek
+
     def _flush(self):
         """
         Flush the write buffers of the stream if applicable.
@@ -106,10 +117,10 @@ class ObjectBufferedIORandomWriteBase(ObjectBufferedIOBase):
         """
         # Flush buffer to specified range
         buffer = self._get_buffer()
-        start = self._buffer_size * (self._seek - 1)
+        start = self._append_offset + self._buffer_size * (self._seek - 1)
         end = start + len(buffer)
 
-        future = self._workers.submit(
+        future = self._submit_flush(
             self._flush_range, buffer=buffer, start=start, end=end)
         self._write_futures.append(future)
         future.add_done_callback(partial(self._update_size, end))
@@ -128,11 +139,12 @@ class ObjectBufferedIORandomWriteBase(ObjectBufferedIOBase):
             size (int): Size value.
             future (concurrent.futures._base.Future): future.
         """
-        with self._size_lock:
+        with self._size_condition:
             # Update value
             if size > self._size and future.done:
                 # Size can be lower if seek down on an 'a' mode open file.
                 self._size = size
+            self._size_condition.notify_all()
 
     def _flush_range(self, buffer, start, end):
         """
@@ -147,7 +159,7 @@ class ObjectBufferedIORandomWriteBase(ObjectBufferedIOBase):
             end (int): End of buffer position to flush.
         """
         # On first call, Get file size if exists
-        with self._size_lock:
+        with self._size_condition:
             if not self._size_synched:
                 self._size_synched = True
                 try:
@@ -155,11 +167,11 @@ class ObjectBufferedIORandomWriteBase(ObjectBufferedIOBase):
                 except (ObjectNotFoundError, UnsupportedOperation):
                     self._size = 0
 
-        # It is not possible to flush a part if start > size:
-        # If it is the case, wait that previous parts are flushed before
-        # flushing this one
-        while start > self._size:
-            sleep(self._FLUSH_WAIT)
+            # It is not possible to flush a part if start > size:
+            # If it is the case, wait that previous parts are flushed before
+            # flushing this one
+            while start > self._size:
+                self._size_condition.wait()
 
         # Flush buffer using RAW IO
         self._raw_flush(buffer, start, end)
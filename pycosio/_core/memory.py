@@ -0,0 +1,238 @@
+# coding=utf-8
+"""Process-wide memory management shared by all buffered streams"""
+from os import environ
+from threading import Condition, Lock
+
+#: Environment variable that can be used to define the memory budget in bytes
+ENV_MEMORY_BUDGET = 'PYCOSIO_MEMORY_BUDGET'
+
+#: Environment variable that can be used to define the buffer pool size in bytes
+ENV_BUFFER_POOL_SIZE = 'PYCOSIO_BUFFER_POOL_SIZE'
+
+
+class MemoryBudget:
+    """
+    Limit the memory used by preloaded and flushing buffers.
+
+    The budget is soft: A stream can always obtain memory if it does not hold
+    any, to ensure it can progress.
+
+    Args:
+        size (int): Budget size in bytes. Default to "PYCOSIO_MEMORY_BUDGET"
+            environment variable value if defined. 0 for no limit (default).
+    """
+
+    def __init__(self, size=None):
+        self._size = size
+        self._used = 0
+        self._condition = Condition()
+
+    @property
+    def size(self):
+        """
+        Budget size.
+
+        Returns:
+            int: Budget size in bytes. 0 if no limit.
+        """
+        if self._size is None:
+            try:
+                self._size = int(environ[ENV_MEMORY_BUDGET])
+            except (KeyError, ValueError):
+                self._size = 0
+        return self._size
+
+    def set_size(self, size):
+        """
+        Set the budget size.
+
+        Args:
+            size (int): Budget size in bytes. 0 for no limit. None to use the
+                default value.
+        """
+        with self._condition:
+            self._size = size
+            self._condition.notify_all()
+
+    @property
+    def used(self):
+        """
+        Memory currently used.
+
+        Returns:
+            int: Used memory in bytes.
+        """
+        return self._used
+
+    def _available(self, size):
+        """
+        Returns True if memory is available in the budget.
+
+        Args:
+            size (int): Memory size in bytes.
+
+        Returns:
+            bool: True if available.
+        """
+        budget_size = self.size
+        return not budget_size or self._used + size <= budget_size
+
+    def acquire(self, size, blocking=True, wait_while=None):
+        """
+        Acquire memory from the budget.
+
+        Args:
+            size (int): Memory size in bytes.
+            blocking (bool): If True, wait until memory is available.
+                If False, returns immediately.
+            wait_while (callable): If specified and blocking, wait only while
+                this function returns True, then acquire memory even if it
+                exceeds the budget.
+
+        Returns:
+            bool: True if memory was acquired.
+        """
+        with self._condition:
+            if not self._available(size):
+                if not blocking:
+                    return False
+
+                while not self._available(size) and (
+                        wait_while is None or wait_while()):
+                    self._condition.wait()
+
+            self._used += size
+            return True
+
+    def reserve(self, size):
+        """
+        Acquire memory from the budget, even if it exceeds the budget.
+
+        Args:
+            size (int): Memory size in bytes.
+        """
+        with self._condition:
+            self._used += size
+
+    def release(self, size):
+        """
+        Release memory to the budget.
+
+        Args:
+            size (int): Memory size in bytes.
+        """
+        with self._condition:
+            self._used -= size
+            self._condition.notify_all()
+
+
+class BufferPool:
+    """
+    Pool of reusable write buffers.
+
+    Buffers are returned to the pool once their content is uploaded, and are
+    reused by next writes instead of allocating and zero filling new
+    buffers. Buffers obtained from the pool are not cleared.
+
+    Args:
+        size (int): Maximum size in bytes of free buffers kept in the pool.
+            Default to "PYCOSIO_BUFFER_POOL_SIZE" environment variable value
+            if defined, else to "DEFAULT_SIZE". 0 to disable the pool.
+    """
+
+    #: Default size value in bytes (Default to 256MB)
+    DEFAULT_SIZE = 268435456
+
+    def __init__(self, size=None):
+        self._size = size
+        self._free = dict()
+        self._free_size = 0
+        self._lock = Lock()
+
+    @property
+    def size(self):
+        """
+        Pool size.
+
+        Returns:
+            int: Pool size in bytes. 0 if disabled.
+        """
+        if self._size is None:
+            try:
+                self._size = int(environ[ENV_BUFFER_POOL_SIZE])
+            except (KeyError, ValueError):
+                self._size = self.DEFAULT_SIZE
+        return self._size
+
+    def set_size(self, size):
+        """
+        Set the pool size.
+
+        Args:
+            size (int): Pool size in bytes. 0 to disable the pool. None to use
+                the default value.
+        """
+        with self._lock:
+            self._size = size
+        if self._free_size > self.size:
+            self.clear()
+
+    @property
+    def free_size(self):
+        """
+        Size of free buffers in the pool.
+
+        Returns:
+            int: Size in bytes.
+        """
+        return self._free_size
+
+    def get(self, size):
+        """
+        Get a buffer from the pool, or a new buffer if none available.
+
+        Args:
+            size (int): Buffer size in bytes.
+
+        Returns:
+            bytearray: Buffer.
+        """
+        with self._lock:
+            try:
+                buffer = self._free[size].pop()
+            except (KeyError, IndexError):
+                return bytearray(size)
+            self._free_size -= size
+            return buffer
+
+    def put(self, buffer):
+        """
+        Return a buffer to the pool.
+
+        The buffer is discarded if the pool is full. The buffer must not be
+        used anymore by the caller.
+
+        Args:
+            buffer (bytearray): Buffer.
+        """
+        size = len(buffer)
+        with self._lock:
+            if self._free_size + size > self.size:
+                return
+            self._free.setdefault(size, []).append(buffer)
+            self._free_size += size
+
+    def clear(self):
+        """
+        Discard all free buffers.
+        """
+        with self._lock:
+            self._free.clear()
+            self._free_size = 0
+
+
+#: Budget shared by all streams
+MEMORY_BUDGET = MemoryBudget()
+
+#: Buffer pool shared by all streams
+BUFFER_POOL = BufferPool()
@@ -0,0 +1,247 @@
+# coding=utf-8
+"""Retries and hedged requests of range reads"""
+from __future__ import division  # Python 2:  Enable "type(int / int) == float"
+
+from atexit import register
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, wait
+from random import uniform
+from threading import Lock
+from time import sleep, time
+
+from pycosio._core.compat import ThreadPoolExecutor
+from pycosio._core.exceptions import ObjectException
+
+try:
+    #: Errors always considered as transient
+    TRANSIENT_ERRORS = (ConnectionError, TimeoutError)
+except NameError:
+    # Python 2
+    from socket import error as _socket_error, timeout as _socket_timeout
+    TRANSIENT_ERRORS = (_socket_error, _socket_timeout)
+
+
+def is_transient_error(exception):
+    """
+    Returns True if the exception is a transient network error.
+
+    Args:
+        exception (Exception): Exception.
+
+    Returns:
+        bool: True if transient.
+    """
+    return (isinstance(exception, TRANSIENT_ERRORS) and
+            not isinstance(exception, ObjectException))
+
+
+class RetryPolicy:
+    """
+    Retry policy of range reads.
+
+    Reads failing with transient errors are retried with an exponential
+    backoff with jitter.
+
+    Optionally, reads are hedged: If a read is slower than a percentile of the
+    latency of previous reads, a duplicate request is sent and the first
+    response is used.
+
+    A policy is generally shared by all streams of a storage to measure
+    latency over all their reads.
+
+    Args:
+        max_attempts (int): Maximum number of attempts of a read.
+            Default to "DEFAULT_MAX_ATTEMPTS". 1 to disable retries.
+        backoff (float): Maximum delay in seconds before the first retry.
+            Doubled on each retry. Default to "DEFAULT_BACKOFF".
+        max_backoff (float): Maximum delay in seconds between two retries.
+            Default to "DEFAULT_MAX_BACKOFF".
+        hedge_percentile (float): Latency percentile (Between 0 and 100) of
+            previous reads after which a read is hedged. Default to no
+            hedging.
+    """
+
+    #: Default max_attempts value
+    DEFAULT_MAX_ATTEMPTS = 4
+
+    #: Default backoff value in seconds
+    DEFAULT_BACKOFF = 0.1
+
+    #: Default max_backoff value in seconds
+    DEFAULT_MAX_BACKOFF = 5.0
+
+    #: Number of measured reads required before hedging reads
+    HEDGE_MIN_SAMPLES = 20
+
+    #: Number of last reads used to compute the latency percentile
+    HEDGE_WINDOW = 200
+
+    # Executor running hedged reads, shared by all policies
+    _hedge_executor = None
+    _hedge_lock = Lock()
+
+    #: Maximum number of threads running hedged reads
+    HEDGE_MAX_WORKERS = 32
+
+    def __init__(self, max_attempts=None, backoff=None, max_backoff=None,
+                 hedge_percentile=None):
+        self._max_attempts = max_attempts or self.DEFAULT_MAX_ATTEMPTS
+        self._backoff = (
+            self.DEFAULT_BACKOFF if backoff is None else backoff)
+        self._max_backoff = (
+            self.DEFAULT_MAX_BACKOFF if max_backoff is None else max_backoff)
+        self._hedge_percentile = hedge_percentile
+        self._latencies = deque(maxlen=self.HEDGE_WINDOW)
+        self._lock = Lock()
+
+    @property
+    def max_attempts(self):
+        """
+        Maximum number of attempts of a read.
+
+        Returns:
+            int: Number of attempts.
+        """
+        return self._max_attempts
+
+    @property
+    def hedge_percentile(self):
+        """
+        Latency percentile after which a read is hedged.
+
+        Returns:
+            float: Percentile, or None if hedging is disabled.
+        """
+        return self._hedge_percentile
+
+    def call(self, is_transient, function, *args, **kwargs):
+        """
+        Call a function, and retry it on transient errors.
+
+        Args:
+            is_transient (callable): Function returning True if an exception
+                is transient.
+            function (callable): Function to call.
+            args, kwargs: Function arguments.
+
+        Returns:
+            object: Function result.
+        """
+        attempt = 0
+        while True:
+            start = time()
+            try:
+                result = function(*args, **kwargs)
+            except Exception as exception:
+                attempt += 1
+                if attempt >= self._max_attempts or not is_transient(
+                        exception):
+                    raise
+                sleep(self._get_backoff(attempt))
+                continue
+
+            if self._hedge_percentile is not None:
+                with self._lock:
+                    self._latencies.append(time() - start)
+            return result
+
+    def call_hedged(self, is_transient, function, *args, **kwargs):
+        """
+        Call a function, retry it on transient errors, and call it again
+        concurrently if slower than the hedging latency percentile.
+
+        The function must have no side effects, because many calls may run at
+        once and results of slowest calls are dropped.
+
+        Args:
+            is_transient (callable): Function returning True if an exception
+                is transient.
+            function (callable): Function to call.
+            args, kwargs: Function arguments.
+
+        Returns:
+            object: Function result.
+        """
+        threshold = self._get_hedge_threshold()
+        if threshold is None:
+            return self.call(is_transient, function, *args, **kwargs)
+
+        submit = self._get_hedge_executor().submit
+        futures = [submit(self.call, is_transient, function, *args, **kwargs)]
+        if not wait(futures, timeout=threshold)[0]:
+            # Slow read: Send a duplicate request
+            futures.append(submit(
+                self.call, is_transient, function, *args, **kwargs))
+
+        # Returns first successful result
+        while True:
+            done = wait(futures, return_when=FIRST_COMPLETED)[0]
+            for future in done:
+                futures.remove(future)
+                if future.exception() is None or not futures:
+                    for other in futures:
+                        other.cancel()
+                    return future.result()
+
+    def _get_backoff(self, attempt):
+        """
+        Returns the delay before a retry.
+
+        Args:
+            attempt (int): Number of failed attempts.
+
+        Returns:
+            float: Delay in seconds.
+        """
+        return uniform(0, min(
+            self._max_backoff, self._backoff * 2 ** (attempt - 1)))
+
+    def _get_hedge_threshold(self):
+        """
+        Returns the latency after which a read is hedged.
+
+        Returns:
+            float: Latency in seconds, or None if reads are not hedged.
+        """
+        percentile = self._hedge_percentile
+        if percentile is None:
+            return None
+
+        with self._lock:
+            if len(self._latencies) < self.HEDGE_MIN_SAMPLES:
+                return None
+            latencies = sorted(self._latencies)
+
+        index = int(round(percentile / 100 * (len(latencies) - 1)))
+        return latencies[min(max(index, 0), len(latencies) - 1)]
+
+    @classmethod
+    def _get_hedge_executor(cls):
+        """
+        Returns the executor running hedged reads.
+
+        Reads are not run on the shared worker pool, because they are called
+        from its threads.
+
+        Returns:
+            concurrent.futures.Executor: Executor.
+        """
+        with cls._hedge_lock:
+            if RetryPolicy._hedge_executor is None:
+                RetryPolicy._hedge_executor = ThreadPoolExecutor(
+                    max_workers=cls.HEDGE_MAX_WORKERS)
+            return RetryPolicy._hedge_executor
+
+
+def _shutdown_hedge_executor():
+    """
+    Shutdown the executor running hedged reads, if any.
+    """
+    with RetryPolicy._hedge_lock:
+        executor = RetryPolicy._hedge_executor
+        RetryPolicy._hedge_executor = None
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+register(_shutdown_hedge_executor)
@@ -8,6 +8,9 @@ from pycosio._core.io_base_raw import ObjectRawIOBase
 from pycosio._core.io_base_buffered import ObjectBufferedIOBase
 from pycosio._core.io_base_system import SystemBase
 from pycosio._core.compat import Pattern
+from pycosio._core.disk_cache import DiskCache
+from pycosio._core.memory import MEMORY_BUDGET
+from pycosio._core.tuning import AutoTuner
 
 # Packages where to search for storage
 STORAGE_PACKAGE = ['pycosio.storage']
@@ -95,12 +98,21 @@ def get_instance(name, cls='system', storage=None, storage_parameters=None,
         system_parameters['storage_parameters'][
             'pycosio.system_cached'] = info['system_cached']
 
+    # Use mounted disk cache if not specified
+    if info.get('disk_cache') is not None:
+        kwargs.setdefault('disk_cache', info['disk_cache'])
+
+    # Use mounted tuner with buffered streams if not specified
+    if cls == 'buffered' and info.get('tuner') is not None:
+        kwargs.setdefault('tuner', info['tuner'])
+
     kwargs.update(system_parameters)
     return info[cls](name=name, *args, **kwargs)
 
 
 def mount(storage=None, name='', storage_parameters=None,
-          unsecure=None, extra_root=None):
+          unsecure=None, extra_root=None, memory_budget=None,
+          disk_cache=None, tuner=None, header_cache=None):
     """
     Mount a new storage.
 
@@ -120,10 +132,32 @@ def mount(storage=None, name='', storage_parameters=None,
             and extra_root "mycloud://" it is possible to access object
             using "mycloud://container/object" instead of
             "https://www.mycloud.com/user/container/object".
+        memory_budget (int): Maximum memory size in bytes that can be used by
+            preloaded and flushing buffers of all buffered streams. This
+            value is process-wide and applies to all storage. 0 for no limit.
+            Default to "PYCOSIO_MEMORY_BUDGET" environment variable value if
+            defined, else no limit.
+        disk_cache (path-like object or pycosio.io.DiskCache): Local
+            directory, or existing disk cache, used by default to persistently
+            cache chunks of objects read from this storage.
+        tuner (bool, path-like object or pycosio.io.AutoTuner): If True, the
+            buffer size and concurrency of buffered streams of this storage
+            are tuned from measured requests. If a path, the tuner state is
+            also persisted in this JSON file and reused by next mounts.
+            Can also be an existing tuner.
+        header_cache (float or pycosio.io.HeaderCache): Time to live in seconds
+            of cached objects headers of this storage, or existing headers
+            cache. Cached headers are used by "exists", "getsize", "stat", and
+            other functions requiring objects headers, instead of performing a
+            new request. Default to no cache.
 
     Returns:
         dict: keys are mounted storage, values are dicts of storage information.
     """
+    # Updates process-wide memory budget
+    if memory_budget is not None:
+        MEMORY_BUDGET.set_size(memory_budget)
+
     # Tries to infer storage from name
     if storage is None:
         if '://' in name:
@@ -138,6 +172,14 @@ def mount(storage=None, name='', storage_parameters=None,
     system_parameters = _system_parameters(
         unsecure=unsecure, storage_parameters=storage_parameters)
     storage_info = dict(storage=storage, system_parameters=system_parameters)
+    if disk_cache is not None:
+        if not isinstance(disk_cache, DiskCache):
+            disk_cache = DiskCache(disk_cache)
+        storage_info['disk_cache'] = disk_cache
+    if tuner:
+        if not isinstance(tuner, AutoTuner):
+            tuner = AutoTuner(None if tuner is True else tuner)
+        storage_info['tuner'] = tuner
 
     # Finds module containing target subclass
     for package in STORAGE_PACKAGE:
@@ -160,7 +202,8 @@ def mount(storage=None, name='', storage_parameters=None,
         for storage in getattr(module, 'MOUNT_REDIRECT'):
             result[storage] = mount(
                 storage=storage, storage_parameters=storage_parameters,
-                unsecure=unsecure)
+                unsecure=unsecure, disk_cache=disk_cache, tuner=tuner,
+                header_cache=header_cache)
         return result
 
     # Finds storage subclass
@@ -196,7 +239,8 @@ def mount(storage=None, name='', storage_parameters=None,
             break
 
     # Caches a system instance
-    storage_info['system_cached'] = storage_info['system'](**system_parameters)
+    storage_info['system_cached'] = storage_info['system'](
+        header_cache=header_cache, **system_parameters)
 
     # Gets roots
     roots = storage_info['system_cached'].roots
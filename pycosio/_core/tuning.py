@@ -0,0 +1,339 @@
+# coding=utf-8
+"""Buffered streams auto-tuning from measured requests performance"""
+from __future__ import division  # Python 2:  Enable "type(int / int) == float"
+
+from json import dump, load
+from os import rename
+from threading import Lock
+from time import time
+from uuid import uuid4
+
+from pycosio._core.compat import fsdecode, remove
+from pycosio._core.workers import SHARED_POOL
+
+
+class AutoTuner:
+    """
+    Tune the buffer size and concurrency of buffered streams from measured
+    requests.
+
+    Requests durations are modeled as "latency + size / bandwidth". The buffer
+    size is chosen to make latency a small part of requests durations, and the
+    concurrency is changed step by step while it increases the measured
+    throughput.
+
+    A tuner is generally shared by all streams of a storage
+    (See "pycosio.mount"). Its state can be persisted in a file to be reused
+    by next processes.
+
+    Args:
+        path (path-like object): JSON file where the tuner state is loaded from
+            and saved to. Default to no persistence.
+        max_workers (int): Maximum concurrency. Default to the shared worker
+            pool size.
+    """
+
+    #: Part of requests durations targeted for the data transfer, the remaining
+    #: part is the latency.
+    TRANSFER_RATIO = 0.8
+
+    #: Minimal tuned buffer size value in bytes (Default to 256KB)
+    MINIMUM_BUFFER_SIZE = 262144
+
+    #: Maximum tuned buffer size value in bytes (Default to 256MB)
+    MAXIMUM_BUFFER_SIZE = 268435456
+
+    #: Initial concurrency
+    INITIAL_WORKERS = 4
+
+    #: Number of measured requests before each concurrency change
+    WINDOW_SIZE = 16
+
+    #: Minimal throughput gain ratio required to keep changing concurrency
+    MINIMUM_GAIN = 0.05
+
+    #: Number of windows with a stable concurrency before trying a new one
+    STABLE_WINDOWS = 8
+
+    #: Weight of a new measure in moving averages
+    SMOOTHING = 0.1
+
+    #: Minimal delay in seconds between two saves of the state on "checkpoint"
+    SAVE_INTERVAL = 60
+
+    def __init__(self, path=None, max_workers=None):
+        self._path = fsdecode(path) if path is not None else None
+        self._max_workers = max_workers
+        self._lock = Lock()
+        self._saved = time()
+
+        # Moving averages of requests sizes, durations, squared sizes and
+        # sizes by durations, used to fit the requests duration model.
+        self._moments = None
+        self._latency = None
+        self._bandwidth = None
+
+        # Concurrency hill climbing state
+        self._workers = self.INITIAL_WORKERS
+        self._direction = 1
+        self._stable = 0
+        self._throughput = None
+        self._window = None
+
+        if self._path is not None:
+            self._load()
+
+    @property
+    def path(self):
+        """
+        File where the state is persisted.
+
+        Returns:
+            str: Path, or None if not persisted.
+        """
+        return self._path
+
+    @property
+    def latency(self):
+        """
+        Estimated requests latency.
+
+        Returns:
+            float: Latency in seconds, or None if not measured yet.
+        """
+        return self._latency
+
+    @property
+    def bandwidth(self):
+        """
+        Estimated bandwidth of a single request.
+
+        Returns:
+            float: Bandwidth in bytes per second, or None if not measured yet.
+        """
+        return self._bandwidth
+
+    @property
+    def max_workers(self):
+        """
+        Tuned concurrency.
+
+        Returns:
+            int: Maximum number of concurrent requests of a stream.
+        """
+        return self._workers
+
+    def buffer_size(self, minimum=1, maximum=0, default=None):
+        """
+        Tuned buffer size.
+
+        Args:
+            minimum (int): Minimal buffer size value in bytes.
+            maximum (int): Maximum buffer size value in bytes. 0 for no limit.
+            default (int): Value returned if latency and bandwidth are not
+                measured yet.
+
+        Returns:
+            int: Buffer size in bytes.
+        """
+        with self._lock:
+            latency = self._latency
+            bandwidth = self._bandwidth
+
+        if latency is None:
+            size = default or minimum
+        else:
+            ratio = self.TRANSFER_RATIO
+            target = latency * bandwidth * ratio / (1 - ratio)
+
+            # Round to a power of two to limit the number of distinct sizes
+            size = self.MINIMUM_BUFFER_SIZE
+            while size < target and size < self.MAXIMUM_BUFFER_SIZE:
+                size *= 2
+
+        if maximum and size > maximum:
+            size = maximum
+        return max(size, minimum)
+
+    def record(self, size, start, end):
+        """
+        Record a request measure.
+
+        Args:
+            size (int): Size of data transferred in bytes.
+            start (float): Request start time, as returned by "time.time".
+            end (float): Request end time, as returned by "time.time".
+        """
+        duration = end - start
+        if size <= 0 or duration <= 0:
+            return
+
+        with self._lock:
+            self._update_model(size, duration)
+            self._update_window(size, start, end)
+
+    def _update_model(self, size, duration):
+        """
+        Update latency and bandwidth estimations.
+
+        Args:
+            size (int): Request size in bytes.
+            duration (float): Request duration in seconds.
+        """
+        sample = (size, duration, size * size, size * duration)
+        if self._moments is None:
+            self._moments = sample
+        else:
+            weight = self.SMOOTHING
+            self._moments = tuple(
+                moment + weight * (value - moment)
+                for moment, value in zip(self._moments, sample))
+        mean_size, mean_duration, mean_size2, mean_size_duration = self._moments
+
+        # Linear regression of durations over sizes
+        variance = mean_size2 - mean_size * mean_size
+        if variance > 1e-4 * mean_size * mean_size:
+            slope = (mean_size_duration - mean_size * mean_duration) / variance
+            latency = mean_duration - slope * mean_size
+            if slope > 0 and latency >= 0:
+                self._latency = latency
+                self._bandwidth = 1 / slope
+                return
+
+        # Sizes are too similar to separate latency from transfer time:
+        # Update the bandwidth with the previous latency estimation
+        if self._latency is not None and mean_duration > self._latency:
+            self._bandwidth = mean_size / (mean_duration - self._latency)
+
+    def _update_window(self, size, start, end):
+        """
+        Update the current measure window and the concurrency once completed.
+
+        Args:
+            size (int): Request size in bytes.
+            start (float): Request start time.
+            end (float): Request end time.
+        """
+        if self._window is None:
+            self._window = [start, end, size, 1]
+            return
+
+        window = self._window
+        window[0] = min(window[0], start)
+        window[1] = max(window[1], end)
+        window[2] += size
+        window[3] += 1
+        if window[3] < max(self.WINDOW_SIZE, 2 * self._workers):
+            return
+
+        self._window = None
+        throughput = window[2] / (window[1] - window[0])
+        previous = self._throughput
+        self._throughput = throughput
+
+        if self._direction == 0:
+            # Stable: Periodically tries a higher concurrency
+            self._stable += 1
+            if self._stable < self.STABLE_WINDOWS:
+                return
+            self._stable = 0
+            self._direction = 1
+
+        elif previous is not None and (
+                throughput < previous * (1 + self.MINIMUM_GAIN)):
+            # No gain: Restores the previous concurrency and keep it
+            self._direction = -self._direction
+            self._set_workers()
+            self._direction = 0
+            return
+
+        self._set_workers()
+
+    def _set_workers(self):
+        """
+        Change the concurrency by a step in the current direction.
+        """
+        max_workers = self._max_workers or SHARED_POOL.max_workers
+        if self._direction > 0:
+            workers = min(self._workers * 2, max_workers)
+        else:
+            workers = max(self._workers // 2, 1)
+
+        if workers == self._workers:
+            # Limit reached
+            self._direction = 0
+        self._workers = workers
+
+    def to_dict(self):
+        """
+        Return the tuner state.
+
+        Returns:
+            dict: State.
+        """
+        with self._lock:
+            return dict(latency=self._latency, bandwidth=self._bandwidth,
+                        workers=self._workers, moments=self._moments)
+
+    def update(self, state):
+        """
+        Update the tuner from a state.
+
+        Args:
+            state (dict): State, as returned by "to_dict".
+        """
+        with self._lock:
+            self._latency = state.get('latency')
+            self._bandwidth = state.get('bandwidth')
+            self._workers = state.get('workers') or self.INITIAL_WORKERS
+            moments = state.get('moments')
+            self._moments = tuple(moments) if moments else None
+
+            # Restarts from a stable state, measures may be different now
+            self._direction = 0
+            self._stable = 0
+            self._throughput = None
+            self._window = None
+
+    def _load(self):
+        """
+        Load the state from the file, if exists.
+        """
+        try:
+            with open(self._path, 'rt') as state_file:
+                state = load(state_file)
+        except (IOError, OSError, ValueError):
+            return
+        if isinstance(state, dict):
+            self.update(state)
+
+    def save(self):
+        """
+        Save the state in the file.
+
+        The state is written in a temporary file, then atomically moved to
+        the file path.
+        """
+        if self._path is None:
+            return
+
+        self._saved = time()
+        tmp_path = '%s.%s.tmp' % (self._path, uuid4().hex)
+        try:
+            with open(tmp_path, 'wt') as state_file:
+                dump(self.to_dict(), state_file)
+            rename(tmp_path, self._path)
+
+        except (IOError, OSError):
+            # Persistence is best effort
+            try:
+                remove(tmp_path)
+            except OSError:
+                pass
+
+    def checkpoint(self):
+        """
+        Save the state in the file if not saved since "SAVE_INTERVAL".
+        """
+        if time() - self._saved >= self.SAVE_INTERVAL:
+            self.save()
@@ -0,0 +1,327 @@
+# coding=utf-8
+"""Process-wide worker pool shared by all streams and systems"""
+from atexit import register
+from collections import deque
+from concurrent.futures import Executor, Future, wait as wait_futures
+from multiprocessing import cpu_count
+from os import environ
+from threading import Lock, local
+
+from pycosio._core.compat import ThreadPoolExecutor
+
+#: Environment variable that can be used to define the shared pool size
+ENV_MAX_WORKERS = 'PYCOSIO_MAX_WORKERS'
+
+
+def _default_max_workers():
+    """
+    Returns the default number of threads of the shared pool.
+
+    Returns:
+        int: Number of threads.
+    """
+    try:
+        return int(environ[ENV_MAX_WORKERS])
+    except (KeyError, ValueError):
+        # Use this number because workers are used to overlap I/O instead of
+        # CPU work.
+        try:
+            return cpu_count() * 5
+        except NotImplementedError:
+            return 5
+
+
+class SharedWorkerPool:
+    """
+    Thread pool shared by the whole process.
+
+    The underlying threads are lazily started on first submitted task.
+
+    Tasks submitted by tasks running on this pool run on a second pool of the
+    same size, because waiting for them on this bounded pool could deadlock.
+    Tasks submitted by tasks of this second pool are run in the calling thread.
+
+    Args:
+        max_workers (int): Maximum number of threads. Default to
+            "PYCOSIO_MAX_WORKERS" environment variable value if defined, or
+            5 times the number of CPU.
+        nested (bool): If True, use a second pool for nested tasks. Else,
+            nested tasks are run in the calling thread.
+    """
+
+    def __init__(self, max_workers=None, nested=True):
+        self._max_workers = max_workers
+        self._executor = None
+        self._lock = Lock()
+        self._thread_local = local()
+        self._nested = SharedWorkerPool(
+            max_workers, nested=False) if nested else None
+
+    @property
+    def max_workers(self):
+        """
+        Maximum number of threads.
+
+        Returns:
+            int: Maximum number of threads.
+        """
+        if not self._max_workers:
+            self._max_workers = _default_max_workers()
+        return self._max_workers
+
+    def set_max_workers(self, max_workers):
+        """
+        Set the maximum number of threads.
+
+        Tasks already submitted are completed by current threads, new tasks
+        are submitted to a pool with the new size.
+
+        Args:
+            max_workers (int): Maximum number of threads. None to use the
+                default value.
+        """
+        with self._lock:
+            self._max_workers = max_workers
+            executor = self._executor
+            self._executor = None
+
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+        if self._nested is not None:
+            self._nested.set_max_workers(max_workers)
+
+    def in_worker_thread(self):
+        """
+        Returns True if the current thread is a thread of this pool.
+
+        Returns:
+            bool: True if in a worker thread.
+        """
+        return getattr(self._thread_local, 'is_worker', False)
+
+    def get_pool(self):
+        """
+        Returns the pool to use to submit a task from the current thread.
+
+        Returns:
+            SharedWorkerPool: Pool, or None if the task must run in the
+                current thread.
+        """
+        if not self.in_worker_thread():
+            if self._nested is not None and self._nested.in_worker_thread():
+                return None
+            return self
+        return self._nested
+
+    def submit(self, function, *args, **kwargs):
+        """
+        Submit a task to the pool.
+
+        Args:
+            function (callable): Function to run.
+            args, kwargs: Function arguments.
+
+        Returns:
+            concurrent.futures.Future: Task future.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers)
+            executor = self._executor
+        return executor.submit(self._run, function, *args, **kwargs)
+
+    def _run(self, function, *args, **kwargs):
+        """
+        Run a task in a worker thread.
+
+        Args:
+            function (callable): Function to run.
+            args, kwargs: Function arguments.
+
+        Returns:
+            object: Function result.
+        """
+        self._thread_local.is_worker = True
+        return function(*args, **kwargs)
+
+    def shutdown(self, wait=True):
+        """
+        Shutdown the pool, threads are restarted on next submitted task.
+
+        Args:
+            wait (bool): If True, wait until all tasks are completed.
+        """
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+        if self._nested is not None:
+            self._nested.shutdown(wait=wait)
+
+
+#: Pool shared by all streams and systems
+SHARED_POOL = SharedWorkerPool()
+register(SHARED_POOL.shutdown)
+
+
+class SharedPoolExecutor(Executor):
+    """
+    Executor that run tasks on the shared pool with a concurrency limit.
+
+    Tasks exceeding the limit are queued and submitted to the shared pool once
+    a previous task of this executor is completed.
+
+    Tasks submitted from a thread of the shared pool run on its nested tasks
+    pool, without concurrency limit other than this pool size, to avoid
+    deadlocks on the bounded shared pool. Tasks submitted from a thread of the
+    nested tasks pool are run directly in the calling thread: Parallel
+    operations started at this depth are serialized.
+
+    Args:
+        max_workers (int): Maximum number of tasks running concurrently.
+            Default to no limit other than the shared pool size.
+        pool (SharedWorkerPool): Pool to use. Default to the shared pool.
+    """
+
+    def __init__(self, max_workers=None, pool=None):
+        self._max_workers = max_workers
+        self._pool = pool or SHARED_POOL
+        self._lock = Lock()
+        self._pending = deque()
+        self._running = 0
+        self._futures = set()
+        self._shutdown = False
+
+    @property
+    def max_workers(self):
+        """
+        Maximum number of tasks running concurrently.
+
+        Returns:
+            int: Maximum number of tasks. None if no limit.
+        """
+        return self._max_workers
+
+    def set_max_workers(self, max_workers):
+        """
+        Set the maximum number of tasks running concurrently.
+
+        Pending tasks are submitted if the limit is increased, running tasks
+        are completed if it is decreased.
+
+        Args:
+            max_workers (int): Maximum number of tasks. None for no limit.
+        """
+        tasks = []
+        with self._lock:
+            self._max_workers = max_workers
+            while self._pending and (
+                    not max_workers or self._running < max_workers):
+                tasks.append(self._pending.popleft())
+                self._running += 1
+
+        for task in tasks:
+            self._pool.submit(self._run, task)
+
+    def submit(self, function, *args, **kwargs):
+        """
+        Submit a task.
+
+        Args:
+            function (callable): Function to run.
+            args, kwargs: Function arguments.
+
+        Returns:
+            concurrent.futures.Future: Task future.
+        """
+        future = Future()
+        task = (future, function, args, kwargs)
+
+        pool = self._pool.get_pool()
+        if pool is None:
+            # Nested task in a nested task: Run it in current thread
+            self._run(task, release=False)
+            return future
+
+        elif pool is not self._pool:
+            # Nested task: Run it on the nested tasks pool, without waiting
+            # for a slot of this executor that may be held by the caller
+            with self._lock:
+                self._futures.add(future)
+            pool.submit(self._run, task, release=False)
+            return future
+
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+            self._futures.add(future)
+
+            if self._max_workers and self._running >= self._max_workers:
+                # Concurrency limit reached: Wait for a running task completion
+                self._pending.append(task)
+                return future
+            self._running += 1
+
+        self._pool.submit(self._run, task)
+        return future
+
+    def _run(self, task, release=True):
+        """
+        Run a task and set its future.
+
+        Args:
+            task (tuple): future, function, args, kwargs.
+            release (bool): If True, release the slot used by this task on the
+                shared pool once completed. False for nested tasks.
+        """
+        future, function, args, kwargs = task
+        try:
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = function(*args, **kwargs)
+                except BaseException as exception:
+                    future.set_exception(exception)
+                else:
+                    future.set_result(result)
+        finally:
+            if release:
+                self._task_done(future)
+            else:
+                with self._lock:
+                    self._futures.discard(future)
+
+    def _task_done(self, future):
+        """
+        Submit the next pending task once a task is completed.
+
+        Args:
+            future (concurrent.futures.Future): Completed task future.
+        """
+        with self._lock:
+            self._futures.discard(future)
+            try:
+                task = self._pending.popleft()
+            except IndexError:
+                self._running -= 1
+                return
+
+        self._pool.submit(self._run, task)
+
+    def shutdown(self, wait=True):
+        """
+        Signal the executor that it should free any resources that it is using
+        when the currently pending futures are done executing.
+
+        Args:
+            wait (bool): If True, wait until all tasks are completed.
+        """
+        with self._lock:
+            self._shutdown = True
+            futures = tuple(self._futures)
+        if wait:
+            wait_futures(futures)
@@ -0,0 +1,77 @@
+# coding=utf-8
+"""Raw streams write buffer spooled on local disk"""
+from mmap import mmap, ACCESS_READ
+from tempfile import TemporaryFile
+from threading import Lock
+
+
+class WriteSpool:
+    """
+    Write buffer stored in a temporary file.
+
+    Provides the subset of the "bytearray" interface used by raw streams write
+    buffers, so memory usage does not grow with the size of the object.
+
+    Args:
+        content (bytes-like object): Initial content.
+    """
+
+    def __init__(self, content=b''):
+        self._file = TemporaryFile()
+        self._lock = Lock()
+        self._size = 0
+        if content:
+            self[0:len(content)] = content
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
+
+    __nonzero__ = __bool__
+
+    def __setitem__(self, key, value):
+        """
+        Write "value" at the start of the "key" slice.
+
+        Like with "bytearray", a start position after the end of the buffer
+        is the end of the buffer. The "key" slice must have the size of
+        "value", or extend the buffer.
+
+        Args:
+            key (slice): Range to write.
+            value (bytes-like object): Data to write.
+        """
+        with self._lock:
+            if key.start is None and key.stop is None:
+                # Replace the full content
+                self._file.seek(0)
+                self._file.truncate()
+                self._size = 0
+            start = min(key.start or 0, self._size)
+            self._file.seek(start)
+            self._file.write(value)
+            self._size = max(self._size, start + len(value))
+
+    def getbuffer(self):
+        """
+        Get a read-only memory view of the buffer content.
+
+        The content is memory mapped, so it is read from the disk on access.
+
+        Returns:
+            memoryview: Buffer view.
+        """
+        with self._lock:
+            if not self._size:
+                return memoryview(b'')
+            self._file.flush()
+            return memoryview(mmap(
+                self._file.fileno(), self._size, access=ACCESS_READ))
+
+    def close(self):
+        """
+        Close and remove the temporary file.
+        """
+        self._file.close()
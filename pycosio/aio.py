@@ -0,0 +1,28 @@
+# coding=utf-8
+"""Cloud object storage asyncio API
+
+Asynchronous equivalents of "pycosio" functions, to use with "asyncio".
+Blocking operations run on a dedicated thread pool, so many files can be
+accessed concurrently with a bounded number of threads: At most
+"set_max_workers" operations run concurrently (Default to
+"PYCOSIO_MAX_WORKERS" environment variable value if defined, or 5 times the
+number of CPU), other operations wait for a completed one. Parallel transfers
+started by an operation (Like reading a large object by ranges) run on the
+shared worker pool, and are not limited by this value.
+
+Requires Python 3.5 or more."""
+
+# Shadowing "open" built-in name is done to provides "pycosio.aio.open"
+from pycosio._core.functions_aio import (
+    cos_open as open, listdir, scandir, stat, set_max_workers, AsyncObjectIO,
+    AsyncScandirIterator)
+
+__all__ = ['open', 'listdir', 'scandir', 'stat', 'set_max_workers',
+           'AsyncObjectIO', 'AsyncScandirIterator']
+
+# Makes cleaner namespace
+for _name in __all__:
+    locals()[_name].__module__ = __name__
+locals()['open'].__qualname__ = 'open'
+locals()['open'].__name__ = 'open'
+del _name
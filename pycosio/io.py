@@ -13,10 +13,22 @@ from pycosio._core.io_base_system import SystemBase
 from pycosio._core.io_random_write import (
     ObjectRawIORandomWriteBase, ObjectBufferedIORandomWriteBase)
 from pycosio._core.io_file_system import FileSystemBase
+from pycosio._core.io_mmap import ObjectMemoryMap
+from pycosio._core.io_compression import CompressedRawIO
+
+# Add streams and systems cache utilities to public interface
+from pycosio._core.block_cache import BlockCache
+from pycosio._core.disk_cache import DiskCache
+from pycosio._core.header_cache import HeaderCache
+
+# Add streams tuning utilities to public interface
+from pycosio._core.tuning import AutoTuner
+from pycosio._core.retry import RetryPolicy
 
 __all__ = ['ObjectRawIOBase', 'ObjectBufferedIOBase', 'SystemBase',
            'ObjectRawIORandomWriteBase', 'ObjectBufferedIORandomWriteBase',
-           'FileSystemBase']
+           'FileSystemBase', 'ObjectMemoryMap', 'BlockCache', 'DiskCache',
+           'HeaderCache', 'AutoTuner', 'RetryPolicy', 'CompressedRawIO']
 
 # Makes cleaner namespace
 for _name in __all__:
@@ -6,7 +6,9 @@ from abc import abstractmethod as _abstractmethod
 from contextlib import contextmanager as _contextmanager
 from concurrent.futures import as_completed as _as_completed
 from io import (
-    UnsupportedOperation as _UnsupportedOperation, BytesIO as _BytesIO)
+    UnsupportedOperation as _UnsupportedOperation, BytesIO as _BytesIO,
+    RawIOBase as _RawIOBase, SEEK_SET as _SEEK_SET, SEEK_CUR as _SEEK_CUR,
+    SEEK_END as _SEEK_END)
 from threading import Lock as _Lock
 
 from azure.common import AzureHttpError as _AzureHttpError
@@ -217,6 +219,88 @@ class _AzureBaseSystem(_SystemBase):
         return result
 
 
+class _MemoryViewWriter(_RawIOBase):
+    """
+    Writable and seekable file-like object over a pre-allocated buffer.
+
+    Allows Azure storage functions to write directly in the buffer.
+
+    Args:
+        buffer (memoryview): Writable buffer.
+    """
+
+    def __init__(self, buffer):
+        _RawIOBase.__init__(self)
+        self._buffer = buffer
+        self._seek = 0
+
+        #: Size of data written in the buffer
+        self.written = 0
+
+    def seekable(self):
+        """
+        Returns True: Stream is seekable.
+
+        Returns:
+            bool: True
+        """
+        return True
+
+    def writable(self):
+        """
+        Returns True: Stream is writable.
+
+        Returns:
+            bool: True
+        """
+        return True
+
+    def seek(self, offset, whence=_SEEK_SET):
+        """
+        Change the stream position to the given byte offset.
+
+        Args:
+            offset (int): Offset is interpreted relative to the position
+                indicated by whence.
+            whence (int): SEEK_SET, SEEK_CUR or SEEK_END.
+
+        Returns:
+            int: The new absolute position.
+        """
+        if whence == _SEEK_CUR:
+            offset += self._seek
+        elif whence == _SEEK_END:
+            offset += len(self._buffer)
+        self._seek = offset
+        return offset
+
+    def tell(self):
+        """
+        Return the current stream position.
+
+        Returns:
+            int: Stream position.
+        """
+        return self._seek
+
+    def write(self, b):
+        """
+        Write the given bytes-like object in the buffer.
+
+        Args:
+            b (bytes-like object): Bytes to write.
+
+        Returns:
+            int: The number of bytes written.
+        """
+        start = self._seek
+        end = start + len(b)
+        self._buffer[start:end] = b
+        self._seek = end
+        self.written = max(self.written, end)
+        return end - start
+
+
 class _AzureStorageRawIOBase(_ObjectRawIOBase):
     """
     Common Raw IO for all Azure storage classes
@@ -232,6 +316,23 @@ class _AzureStorageRawIOBase(_ObjectRawIOBase):
             function: Read function.
         """
 
+    @staticmethod
+    def _is_transient_error(exception):
+        """
+        Returns True if an exception raised by a request is transient, and so
+        the request can be retried.
+
+        Args:
+            exception (Exception): Exception.
+
+        Returns:
+            bool: True if transient.
+        """
+        if isinstance(exception, _AzureHttpError):
+            status = exception.status_code or 0
+            return status in (408, 429) or status >= 500
+        return _ObjectRawIOBase._is_transient_error(exception)
+
     def _read_range(self, start, end=0):
         """
         Read a range of bytes in stream.
@@ -249,7 +350,8 @@ class _AzureStorageRawIOBase(_ObjectRawIOBase):
             with _handle_azure_exception():
                 self._get_to_stream(
                     stream=stream, start_range=start,
-                    end_range=(end - 1) if end else None, **self._client_kwargs)
+                    end_range=(end - 1) if end else None,
+                    validate_content=self._checksum, **self._client_kwargs)
 
         # Check for end of file
         except _AzureHttpError as exception:
@@ -260,6 +362,34 @@ class _AzureStorageRawIOBase(_ObjectRawIOBase):
 
         return stream.getvalue()
 
+    def _read_range_into(self, start, buffer):
+        """
+        Read a range of bytes in stream directly into a buffer.
+
+        Args:
+            start (int): Start stream position.
+            buffer (memoryview): Writable buffer.
+
+        Returns:
+            int: number of bytes read
+        """
+        stream = _MemoryViewWriter(buffer)
+        try:
+            with _handle_azure_exception():
+                self._get_to_stream(
+                    stream=stream, start_range=start,
+                    end_range=start + len(buffer) - 1,
+                    validate_content=self._checksum, **self._client_kwargs)
+
+        # Check for end of file
+        except _AzureHttpError as exception:
+            if exception.status_code == 416:
+                # EOF
+                return 0
+            raise
+
+        return stream.written
+
     def _readall(self):
         """
         Read and return all the bytes from the stream until EOF.
@@ -269,7 +399,9 @@ class _AzureStorageRawIOBase(_ObjectRawIOBase):
         """
         stream = _BytesIO()
         with _handle_azure_exception():
-            self._get_to_stream(stream=stream, **self._client_kwargs)
+            self._get_to_stream(
+                stream=stream, validate_content=self._checksum,
+                **self._client_kwargs)
         return stream.getvalue()
 
 
@@ -387,7 +519,7 @@ class _AzureStorageRawIORangeWriteBase(_ObjectRawIORandomWriteBase,
                     self._update_range, data=buffer_part.tobytes(),
                     start_range=start_range,
                     end_range=start_range + len(buffer_part) - 1,
-                    **self._client_kwargs))
+                    validate_content=self._checksum, **self._client_kwargs))
 
             with _handle_azure_exception():
                 # Wait for upload completion
@@ -399,4 +531,5 @@ class _AzureStorageRawIORangeWriteBase(_ObjectRawIORandomWriteBase,
             with _handle_azure_exception():
                 self._update_range(
                     data=buffer.tobytes(), start_range=start,
-                    end_range=end - 1, **self._client_kwargs)
+                    end_range=end - 1, validate_content=self._checksum,
+                    **self._client_kwargs)
@@ -30,6 +30,14 @@ class AzureAppendBlobRawIO(AzureBlobRawIO, ObjectRawIORandomWriteBase):
             information.
         unsecure (bool): If True, disables TLS/SSL to improves
             transfer performance. But makes connection unsecure.
+        disk_cache (path-like object or pycosio.io.DiskCache): In read mode,
+            local directory, or existing disk cache, used to persistently
+            cache read chunks of the object. Default to no disk cache.
+        retry (pycosio.io.RetryPolicy): In read mode, policy used to retry
+            range reads on transient errors, and to hedge slow range reads.
+            Default to the policy shared by all streams of the storage.
+        checksum (bool): If True, verify data integrity with checksums when
+            supported by the storage.
     """
     __DEFAULT_CLASS = False
 
@@ -80,13 +88,16 @@ class AzureAppendBlobRawIO(AzureBlobRawIO, ObjectRawIORandomWriteBase):
 
                 with _handle_azure_exception():
                     self._client.append_block(
-                        block=buffer_part.tobytes(), **self._client_kwargs)
+                        block=buffer_part.tobytes(),
+                        validate_content=self._checksum,
+                        **self._client_kwargs)
 
         # Small buffer, send it in one command.
         elif buffer_size:
             with _handle_azure_exception():
                 self._client.append_block(
-                    block=buffer.tobytes(), **self._client_kwargs)
+                    block=buffer.tobytes(), validate_content=self._checksum,
+                    **self._client_kwargs)
 
 
 class AzureAppendBlobBufferedIO(AzureBlobBufferedIO,
@@ -97,12 +108,22 @@ class AzureAppendBlobBufferedIO(AzureBlobBufferedIO,
 
     Args:
         name (path-like object): URL or path to the file which will be opened.
-        mode (str): The mode can be 'r', 'w' for reading (default) or writing
+        mode (str): The mode can be 'r', 'w', 'a'
+            for reading (default), writing or appending
         buffer_size (int): The size of buffer.
         max_buffers (int): The maximum number of buffers to preload in read mode
             or awaiting flush in write mode. 0 for no limit.
-        max_workers (int): The maximum number of threads that can be used to
-            execute the given calls.
+        max_workers (int): The maximum number of threads of the shared worker
+            pool that can be used concurrently by this stream.
+        cache_size (int): In read mode, size in bytes of the LRU cache of
+            buffers already read or dropped on seek. 0 for no cache.
+        cache (pycosio.io.BlockCache): In read mode, existing cache to use
+            instead of "cache_size". Allows to share a cache between streams.
+        tuner (pycosio.io.AutoTuner): Tuner measuring requests of this stream.
+            If "buffer_size" or "max_workers" are not specified, they are
+            tuned from previous measures.
+        checksum (bool): If True, verify data integrity with checksums when
+            supported by the storage.
         storage_parameters (dict): Azure service keyword arguments.
             This is generally Azure credentials and configuration. See
             "azure.storage.blob.baseblobservice.BaseBlobService" for more
@@ -125,9 +146,9 @@ class AzureAppendBlobBufferedIO(AzureBlobBufferedIO,
         """
         Flush the write buffer of the stream.
         """
-        self._write_futures.append(self._workers.submit(
+        self._write_futures.append(self._submit_flush(
             self._client.append_block, block=self._get_buffer().tobytes(),
-            **self._client_kwargs))
+            validate_content=self._checksum, **self._client_kwargs))
 
 
 AZURE_RAW[_BLOB_TYPE] = AzureAppendBlobRawIO
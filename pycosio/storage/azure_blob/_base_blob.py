@@ -46,7 +46,8 @@ def _new_blob(cls, name, kwargs):
     try:
         # Also cache file header to avoid double head call
         # (in __new__ and __init__)
-        storage_parameters['pycosio.raw_io._head'] = head = system.head(name)
+        storage_parameters['pycosio.raw_io._head'] = head = system.head(
+            name, partial=False)
     except ObjectException:
         # Unable to access to the file (May not exists, or may not have read
         # access permission), try to use arguments as blob type source.
@@ -72,6 +73,14 @@ class AzureBlobRawIO(_AzureStorageRawIOBase):
             information.
         unsecure (bool): If True, disables TLS/SSL to improves
             transfer performance. But makes connection unsecure.
+        disk_cache (path-like object or pycosio.io.DiskCache): In read mode,
+            local directory, or existing disk cache, used to persistently
+            cache read chunks of the object. Default to no disk cache.
+        retry (pycosio.io.RetryPolicy): In read mode, policy used to retry
+            range reads on transient errors, and to hedge slow range reads.
+            Default to the policy shared by all streams of the storage.
+        checksum (bool): If True, verify data integrity with checksums when
+            supported by the storage.
         blob_type (str): Blob type to use on new file creation.
             Possibles values: BlockBlob (default), AppendBlob, PageBlob.
     """
@@ -103,12 +112,22 @@ class AzureBlobBufferedIO(ObjectBufferedIOBase):
 
     Args:
         name (path-like object): URL or path to the file which will be opened.
-        mode (str): The mode can be 'r', 'w' for reading (default) or writing
+        mode (str): The mode can be 'r', 'w', 'a'
+            for reading (default), writing or appending
         buffer_size (int): The size of buffer.
         max_buffers (int): The maximum number of buffers to preload in read mode
             or awaiting flush in write mode. 0 for no limit.
-        max_workers (int): The maximum number of threads that can be used to
-            execute the given calls.
+        max_workers (int): The maximum number of threads of the shared worker
+            pool that can be used concurrently by this stream.
+        cache_size (int): In read mode, size in bytes of the LRU cache of
+            buffers already read or dropped on seek. 0 for no cache.
+        cache (pycosio.io.BlockCache): In read mode, existing cache to use
+            instead of "cache_size". Allows to share a cache between streams.
+        tuner (pycosio.io.AutoTuner): Tuner measuring requests of this stream.
+            If "buffer_size" or "max_workers" are not specified, they are
+            tuned from previous measures.
+        checksum (bool): If True, verify data integrity with checksums when
+            supported by the storage.
         storage_parameters (dict): Azure service keyword arguments.
             This is generally Azure credentials and configuration. See
             "azure.storage.blob.baseblobservice.BaseBlobService" for more
@@ -9,7 +9,7 @@ from azure.storage.blob import BlobBlock
 from azure.storage.blob.models import _BlobTypes
 
 from pycosio.storage.azure import _handle_azure_exception
-from pycosio._core.io_base import memoizedmethod
+from pycosio._core.io_base import memoizedmethod, MemoryViewIO
 from pycosio.io import ObjectBufferedIOBase
 from pycosio.storage.azure_blob._base_blob import (
     AzureBlobRawIO, AzureBlobBufferedIO, AZURE_RAW, AZURE_BUFFERED)
@@ -30,6 +30,14 @@ class AzureBlockBlobRawIO(AzureBlobRawIO):
             information.
         unsecure (bool): If True, disables TLS/SSL to improves
             transfer performance. But makes connection unsecure.
+        disk_cache (path-like object or pycosio.io.DiskCache): In read mode,
+            local directory, or existing disk cache, used to persistently
+            cache read chunks of the object. Default to no disk cache.
+        retry (pycosio.io.RetryPolicy): In read mode, policy used to retry
+            range reads on transient errors, and to hedge slow range reads.
+            Default to the policy shared by all streams of the storage.
+        checksum (bool): If True, verify data integrity with checksums when
+            supported by the storage.
     """
     __DEFAULT_CLASS = False
 
@@ -54,7 +62,8 @@ class AzureBlockBlobRawIO(AzureBlobRawIO):
         with _handle_azure_exception():
             # Write entire file at once
             self._client.create_blob_from_bytes(
-                blob=buffer.tobytes(), **self._client_kwargs)
+                blob=buffer.tobytes(), validate_content=self._checksum,
+                **self._client_kwargs)
 
     def _create(self):
         """
@@ -69,12 +78,22 @@ class AzureBlockBlobBufferedIO(AzureBlobBufferedIO):
 
     Args:
         name (path-like object): URL or path to the file which will be opened.
-        mode (str): The mode can be 'r', 'w' for reading (default) or writing
+        mode (str): The mode can be 'r', 'w', 'a'
+            for reading (default), writing or appending
         buffer_size (int): The size of buffer.
         max_buffers (int): The maximum number of buffers to preload in read mode
             or awaiting flush in write mode. 0 for no limit.
-        max_workers (int): The maximum number of threads that can be used to
-            execute the given calls.
+        max_workers (int): The maximum number of threads of the shared worker
+            pool that can be used concurrently by this stream.
+        cache_size (int): In read mode, size in bytes of the LRU cache of
+            buffers already read or dropped on seek. 0 for no cache.
+        cache (pycosio.io.BlockCache): In read mode, existing cache to use
+            instead of "cache_size". Allows to share a cache between streams.
+        tuner (pycosio.io.AutoTuner): Tuner measuring requests of this stream.
+            If "buffer_size" or "max_workers" are not specified, they are
+            tuned from previous measures.
+        checksum (bool): If True, verify data integrity with checksums when
+            supported by the storage.
         storage_parameters (dict): Azure service keyword arguments.
             This is generally Azure credentials and configuration. See
             "azure.storage.blob.baseblobservice.BaseBlobService" for more
@@ -90,6 +109,28 @@ class AzureBlockBlobBufferedIO(AzureBlobBufferedIO):
         if self._writable:
             self._blocks = []
 
+            # Existing blob blocks to reuse in append mode
+            self._committed_blocks = []
+
+    def _init_append(self):
+        """
+        Initializes file on 'a' mode.
+
+        Committed blocks of the existing blob are reused as first blocks of
+        the new block list.
+        """
+        with _handle_azure_exception():
+            blocks = self._client.get_block_list(
+                block_list_type='committed',
+                **self._client_kwargs).committed_blocks
+
+        # Blob may have been created without blocks
+        if not blocks or sum(block.size for block in blocks) != self._raw._size:
+            return ObjectBufferedIOBase._init_append(self)
+
+        self._committed_blocks = blocks
+        self._seek = self._append_parts = 1
+
     @staticmethod
     def _get_random_block_id(length):
         """
@@ -110,9 +151,10 @@ class AzureBlockBlobBufferedIO(AzureBlobBufferedIO):
         block_id = self._get_random_block_id(32)
 
         # Upload block with workers
-        self._write_futures.append(self._workers.submit(
-            self._client.put_block, block=self._get_buffer().tobytes(),
-            block_id=block_id, **self._client_kwargs))
+        self._write_futures.append(self._submit_flush(
+            self._client.put_block, block=MemoryViewIO(self._get_buffer()),
+            block_id=block_id, validate_content=self._checksum,
+            **self._client_kwargs))
 
         # Save block information
         self._blocks.append(BlobBlock(id=block_id))
@@ -124,9 +166,8 @@ class AzureBlockBlobBufferedIO(AzureBlobBufferedIO):
         for future in self._write_futures:
             future.result()
 
-        block_list = self._client.get_block_list(**self._client_kwargs)
         self._client.put_block_list(
-            block_list=block_list.committed_blocks + self._blocks,
+            block_list=self._committed_blocks + self._blocks,
             **self._client_kwargs)
 
 
@@ -30,6 +30,14 @@ class AzurePageBlobRawIO(AzureBlobRawIO, _AzureStorageRawIORangeWriteBase):
             information.
         unsecure (bool): If True, disables TLS/SSL to improves
             transfer performance. But makes connection unsecure.
+        disk_cache (path-like object or pycosio.io.DiskCache): In read mode,
+            local directory, or existing disk cache, used to persistently
+            cache read chunks of the object. Default to no disk cache.
+        retry (pycosio.io.RetryPolicy): In read mode, policy used to retry
+            range reads on transient errors, and to hedge slow range reads.
+            Default to the policy shared by all streams of the storage.
+        checksum (bool): If True, verify data integrity with checksums when
+            supported by the storage.
         content_length (int): Define the size to preallocate on new file
             creation. This is not mandatory, and file will be resized on needs
             but this allow to improve performance when file size is known in
@@ -58,6 +66,19 @@ class AzurePageBlobRawIO(AzureBlobRawIO, _AzureStorageRawIORangeWriteBase):
         """
         return self._system.client[_BLOB_TYPE]
 
+    def _init_disk_cache(self, disk_cache):
+        """
+        Initializes the disk cache in read mode.
+
+        Args:
+            disk_cache (path-like object or pycosio.io.DiskCache): Cache
+                directory or disk cache.
+        """
+        if self._ignore_padding:
+            # Padding is stripped on each read range, so chunks can't be cached
+            return
+        AzureBlobRawIO._init_disk_cache(self, disk_cache)
+
     @property
     @memoizedmethod
     def _resize(self):
@@ -132,6 +153,41 @@ class AzurePageBlobRawIO(AzureBlobRawIO, _AzureStorageRawIORangeWriteBase):
 
         return data
 
+    def _read_range_into(self, start, buffer):
+        """
+        Read a range of bytes in stream directly into a buffer.
+
+        Args:
+            start (int): Start stream position.
+            buffer (memoryview): Writable buffer.
+
+        Returns:
+            int: number of bytes read
+        """
+        if self._ignore_padding:
+            # Needs "_read_range" to remove trailing Null chars
+            return ObjectRawIORandomWriteBase._read_range_into(
+                self, start, buffer)
+
+        return AzureBlobRawIO._read_range_into(self, start, buffer)
+
+    def _read_range_into_parallel(self, start, buffer):
+        """
+        Read a range of bytes in stream directly into a buffer.
+
+        Args:
+            start (int): Start stream position.
+            buffer (memoryview): Writable buffer.
+
+        Returns:
+            int: number of bytes read
+        """
+        if self._ignore_padding:
+            # Padding can't be stripped from parts
+            return self._read_range_into(start, buffer)
+
+        return AzureBlobRawIO._read_range_into_parallel(self, start, buffer)
+
     def _readall(self):
         """
         Read and return all the bytes from the stream until EOF.
@@ -235,13 +291,23 @@ class AzurePageBlobBufferedIO(AzureBlobBufferedIO,
 
     Args:
         name (path-like object): URL or path to the file which will be opened.
-        mode (str): The mode can be 'r', 'w' for reading (default) or writing
+        mode (str): The mode can be 'r', 'w', 'a'
+            for reading (default), writing or appending
         buffer_size (int): The size of buffer.
             If not 512 bytes aligned, will be round to be page aligned.
         max_buffers (int): The maximum number of buffers to preload in read mode
             or awaiting flush in write mode. 0 for no limit.
-        max_workers (int): The maximum number of threads that can be used to
-            execute the given calls.
+        max_workers (int): The maximum number of threads of the shared worker
+            pool that can be used concurrently by this stream.
+        cache_size (int): In read mode, size in bytes of the LRU cache of
+            buffers already read or dropped on seek. 0 for no cache.
+        cache (pycosio.io.BlockCache): In read mode, existing cache to use
+            instead of "cache_size". Allows to share a cache between streams.
+        tuner (pycosio.io.AutoTuner): Tuner measuring requests of this stream.
+            If "buffer_size" or "max_workers" are not specified, they are
+            tuned from previous measures.
+        checksum (bool): If True, verify data integrity with checksums when
+            supported by the storage.
         storage_parameters (dict): Azure service keyword arguments.
             This is generally Azure credentials and configuration. See
             "azure.storage.blob.baseblobservice.BaseBlobService" for more
@@ -283,9 +349,9 @@ class AzurePageBlobBufferedIO(AzureBlobBufferedIO,
         In write mode, send the buffer content to the cloud object.
         """
         buffer = self._get_buffer()
-        start = self._buffer_size * (self._seek - 1)
+        start = self._append_offset + self._buffer_size * (self._seek - 1)
 
-        self._write_futures.append(self._workers.submit(
+        self._write_futures.append(self._submit_flush(
             self._raw_flush, buffer=buffer, start=start,
             end=start + len(buffer)))
 
@@ -6,7 +6,7 @@ import re as _re
 
 from azure.storage.blob import (
     PageBlobService, BlockBlobService, AppendBlobService)
-from azure.storage.blob.models import _BlobTypes
+from azure.storage.blob.models import _BlobTypes, BlobPrefix
 
 from pycosio.storage.azure import (
     _handle_azure_exception, _AzureBaseSystem)
@@ -29,6 +29,7 @@ class _AzureBlobSystem(_AzureBaseSystem):
         unsecure (bool): If True, disables TLS/SSL to improves
             transfer performance. But makes connection unsecure.
     """
+    _LIST_FIRST_LEVEL = True
 
     def copy(self, src, dst, other_system=None):
         """
@@ -157,7 +158,8 @@ class _AzureBlobSystem(_AzureBaseSystem):
             for container in self._client_block.list_containers():
                 yield container.name, self._model_to_dict(container)
 
-    def _list_objects(self, client_kwargs, path, max_request_entries):
+    def _list_objects(self, client_kwargs, path, max_request_entries,
+                      first_level=False):
         """
         Lists objects.
 
@@ -166,18 +168,26 @@ class _AzureBlobSystem(_AzureBaseSystem):
             path (str): Path relative to current locator.
             max_request_entries (int): If specified, maximum entries returned
                 by request.
+            first_level (bool): If True, lists only first level objects, and
+                sub directories as names ending with "/" and empty headers.
 
         Returns:
             generator of tuple: object name str, object header dict
         """
         client_kwargs = self._update_listing_client_kwargs(
             client_kwargs, max_request_entries)
+        if first_level:
+            client_kwargs['delimiter'] = '/'
 
         blob = None
         with _handle_azure_exception():
             for blob in self._client_block.list_blobs(
                     prefix=path, **client_kwargs):
-                yield blob.name, self._model_to_dict(blob)
+                if isinstance(blob, BlobPrefix):
+                    # Sub directory
+                    yield blob.name, dict()
+                else:
+                    yield blob.name, self._model_to_dict(blob)
 
         # None only if path don't exists
         if blob is None:
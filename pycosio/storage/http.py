@@ -93,6 +93,14 @@ class HTTPRawIO(_ObjectRawIOBase):
     Args:
         name (path-like object): URL to the file which will be opened.
         mode (str): The mode can be 'r' for reading (default)
+        disk_cache (path-like object or pycosio.io.DiskCache): Local
+            directory, or existing disk cache, used to persistently cache read
+            chunks of the object. Default to no disk cache.
+        retry (pycosio.io.RetryPolicy): In read mode, policy used to retry
+            range reads on transient errors, and to hedge slow range reads.
+            Default to the policy shared by all streams of the storage.
+        checksum (bool): If True, verify data integrity with checksums when
+            supported by the storage.
     """
     _SYSTEM_CLASS = _HTTPSystem
     _TIMEOUT = _HTTPSystem._TIMEOUT
@@ -108,6 +116,26 @@ class HTTPRawIO(_ObjectRawIOBase):
         # Check if object support random read
         self._seekable = self._head().get('Accept-Ranges') == 'bytes'
 
+    @staticmethod
+    def _is_transient_error(exception):
+        """
+        Returns True if an exception raised by a request is transient, and so
+        the request can be retried.
+
+        Args:
+            exception (Exception): Exception.
+
+        Returns:
+            bool: True if transient.
+        """
+        if isinstance(exception, _requests.HTTPError):
+            status = getattr(exception.response, 'status_code', None) or 0
+            return status in (408, 429) or status >= 500
+        return isinstance(exception, (
+            _requests.ConnectionError, _requests.Timeout,
+            _requests.exceptions.ChunkedEncodingError)) or (
+            _ObjectRawIOBase._is_transient_error(exception))
+
     def _read_range(self, start, end=0):
         """
         Read a range of bytes in stream.
@@ -132,6 +160,55 @@ class HTTPRawIO(_ObjectRawIOBase):
         # Get object content
         return _handle_http_errors(response).content
 
+    def _read_range_into(self, start, buffer):
+        """
+        Read a range of bytes in stream directly into a buffer.
+
+        Args:
+            start (int): Start stream position.
+            buffer (memoryview): Writable buffer.
+
+        Returns:
+            int: number of bytes read
+        """
+        # Get object part without loading its content
+        response = self._client.request(
+            'GET', self.name, headers=dict(
+                Range=self._http_range(start, start + len(buffer))),
+            timeout=self._TIMEOUT, stream=True)
+
+        try:
+            if response.status_code == 416:
+                # EOF
+                return 0
+
+            # Write object content in buffer
+            raw = _handle_http_errors(response).raw
+            raw.decode_content = True
+            return self._read_stream_into(raw, buffer)
+
+        finally:
+            response.close()
+
+    def _open_range_stream(self, start, end=0):
+        """
+        Open a streaming request on a range of bytes, to read its content
+        incrementally.
+
+        Args:
+            start (int): Start stream position.
+            end (int): End stream position.
+                0 To not specify end.
+
+        Returns:
+            file-like object: Response content.
+        """
+        raw = _handle_http_errors(self._client.request(
+            'GET', self.name, headers=dict(Range=self._http_range(start, end)),
+            timeout=self._TIMEOUT, stream=True)).raw
+        raw.decode_content = True
+        return raw
+
     def _readall(self):
         """
         Read and return all the bytes from the stream until EOF.
@@ -158,8 +235,21 @@ class HTTPBufferedIO(_ObjectBufferedIOBase):
         buffer_size (int): The size of buffer.
         max_buffers (int): The maximum number of buffers to preload in read mode
             or awaiting flush in write mode. 0 for no limit.
-        max_workers (int): The maximum number of threads that can be used to
-            execute the given calls.
+        max_workers (int): The maximum number of threads of the shared worker
+            pool that can be used concurrently by this stream.
+        cache_size (int): In read mode, size in bytes of the LRU cache of
+            buffers already read or dropped on seek. 0 for no cache.
+        cache (pycosio.io.BlockCache): In read mode, existing cache to use
+            instead of "cache_size". Allows to share a cache between streams.
+        streaming (bool): In read mode, if True, buffers read sequentially
+            are pulled from a single streaming request instead of a range
+            request per buffer. Range requests are used again after a seek
+            until reading is sequential.
+        tuner (pycosio.io.AutoTuner): Tuner measuring requests of this stream.
+            If "buffer_size" or "max_workers" are not specified, they are
+            tuned from previous measures.
+        checksum (bool): If True, verify data integrity with checksums when
+            supported by the storage.
     """
 
     _RAW_CLASS = HTTPRawIO
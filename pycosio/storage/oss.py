@@ -1,5 +1,6 @@
 # coding=utf-8
 """Alibaba cloud OSS"""
+from concurrent.futures import wait as _wait
 from contextlib import contextmanager as _contextmanager
 import re as _re
 
@@ -7,7 +8,9 @@ import oss2 as _oss
 from oss2.models import PartInfo as _PartInfo
 from oss2.exceptions import OssError as _OssError
 
-from pycosio._core.io_base import memoizedmethod as _memoizedmethod
+from pycosio._core.checksum import content_md5 as _content_md5
+from pycosio._core.io_base import (
+    memoizedmethod as _memoizedmethod, MemoryViewIO as _MemoryViewIO)
 from pycosio._core.exceptions import (
     ObjectNotFoundError as _ObjectNotFoundError,
     ObjectPermissionError as _ObjectPermissionError)
@@ -51,6 +54,7 @@ class _OSSSystem(_SystemBase):
     """
     _CTIME_KEYS = ('Creation-Date', 'creation_date')
     _MTIME_KEYS = ('Last-Modified', 'last_modified')
+    _LIST_FIRST_LEVEL = True
 
     def __init__(self, storage_parameters=None, *args, **kwargs):
         try:
@@ -249,7 +253,8 @@ class _OSSSystem(_SystemBase):
         for bucket in response.buckets:
             yield bucket.name, self._model_to_dict(bucket, ('name',))
 
-    def _list_objects(self, client_kwargs, path, max_request_entries):
+    def _list_objects(self, client_kwargs, path, max_request_entries,
+                      first_level=False):
         """
         Lists objects.
 
@@ -258,6 +263,8 @@ class _OSSSystem(_SystemBase):
             path (str): Path relative to current locator.
             max_request_entries (int): If specified, maximum entries returned
                 by request.
+            first_level (bool): If True, lists only first level objects, and
+                sub directories as names ending with "/" and empty headers.
 
         Returns:
             generator of tuple: object name str, object header dict
@@ -265,27 +272,47 @@ class _OSSSystem(_SystemBase):
         kwargs = dict()
         if max_request_entries:
             kwargs['max_keys'] = max_request_entries
+        if first_level:
+            kwargs['delimiter'] = '/'
 
         bucket = self._get_bucket(client_kwargs)
 
-        while True:
+        def request_page(marker):
+            """
+            Request a page of results.
+
+            Args:
+                marker (str): Marker of the page.
+
+            Returns:
+                tuple: response, next marker str.
+            """
             with _handle_oss_error():
-                response = bucket.list_objects(prefix=path, **kwargs)
+                response = bucket.list_objects(
+                    prefix=path, marker=marker or '', **kwargs)
+            return response, response.next_marker or None
+
+        # Handles results on more than one page. Next page is requested in
+        # background, except if the caller limits the number of results.
+        for response in self._generate_pages(
+                request_page, prefetch=not max_request_entries):
 
-            if not response.object_list:
+            if not response.object_list and not response.prefix_list:
                 # In case of empty dir, return empty dir path:
                 # if empty result, the dir do not exists.
                 raise _ObjectNotFoundError('Not found: %s' % path)
 
-            for obj in response.object_list:
-                yield obj.key, self._model_to_dict(obj, ('key',))
+            objects = [(obj.key, self._model_to_dict(obj, ('key',)))
+                       for obj in response.object_list]
 
-            # Handles results on more than one page
-            if response.next_marker:
-                client_kwargs['marker'] = response.next_marker
-            else:
-                # End of results
-                break
+            # Sub directories, in lexicographic order with objects
+            if response.prefix_list:
+                objects.extend(
+                    (prefix, dict()) for prefix in response.prefix_list)
+                objects.sort(key=lambda obj: obj[0])
+
+            for name, header in objects:
+                yield name, header
 
 
 class OSSRawIO(_ObjectRawIOBase):
@@ -299,9 +326,35 @@ class OSSRawIO(_ObjectRawIOBase):
             This is generally OSS credentials and configuration.
         unsecure (bool): If True, disables TLS/SSL to improves
             transfer performance. But makes connection unsecure.
+        disk_cache (path-like object or pycosio.io.DiskCache): In read mode,
+            local directory, or existing disk cache, used to persistently
+            cache read chunks of the object. Default to no disk cache.
+        retry (pycosio.io.RetryPolicy): In read mode, policy used to retry
+            range reads on transient errors, and to hedge slow range reads.
+            Default to the policy shared by all streams of the storage.
+        checksum (bool): If True, verify data integrity with checksums when
+            supported by the storage.
     """
     _SYSTEM_CLASS = _OSSSystem
 
+    @staticmethod
+    def _is_transient_error(exception):
+        """
+        Returns True if an exception raised by a request is transient, and so
+        the request can be retried.
+
+        Args:
+            exception (Exception): Exception.
+
+        Returns:
+            bool: True if transient.
+        """
+        if isinstance(exception, _OssError):
+            # Negative status are network errors
+            status = exception.status
+            return status < 0 or status in (408, 429) or status >= 500
+        return _ObjectRawIOBase._is_transient_error(exception)
+
     @property
     @_memoizedmethod
     def _bucket(self):
@@ -350,6 +403,49 @@ class OSSRawIO(_ObjectRawIOBase):
         # Get object content
         return response.read()
 
+    def _read_range_into(self, start, buffer):
+        """
+        Read a range of bytes in stream directly into a buffer.
+
+        Args:
+            start (int): Start stream position.
+            buffer (memoryview): Writable buffer.
+
+        Returns:
+            int: number of bytes read
+        """
+        if start >= self._size:
+            # EOF. Do not detect using 416 (Out of range) error, 200 returned.
+            return 0
+
+        # Get object bytes range
+        with _handle_oss_error():
+            response = self._bucket.get_object(key=self._key, headers=dict(
+                Range=self._http_range(
+                    start, min(start + len(buffer), self._size))))
+
+        # Write object content in buffer
+        return self._read_stream_into(response, buffer)
+
+    def _open_range_stream(self, start, end=0):
+        """
+        Open a streaming request on a range of bytes, to read its content
+        incrementally.
+
+        Args:
+            start (int): Start stream position.
+            end (int): End stream position.
+                0 To not specify end.
+
+        Returns:
+            file-like object: Response content.
+        """
+        with _handle_oss_error():
+            return self._bucket.get_object(key=self._key, headers=dict(
+                Range=self._http_range(
+                    # Returns full file if end > size
+                    start, end if end <= self._size else self._size)))
+
     def _readall(self):
         """
         Read and return all the bytes from the stream until EOF.
@@ -367,8 +463,42 @@ class OSSRawIO(_ObjectRawIOBase):
         Args:
             buffer (memoryview): Buffer content.
         """
+        parts = self._get_upload_parts(buffer)
+        if len(parts) == 1:
+            headers = ({'Content-MD5': _content_md5(buffer)}
+                       if self._checksum else None)
+            with _handle_oss_error():
+                self._bucket.put_object(
+                    key=self._key, data=_MemoryViewIO(buffer), headers=headers)
+            return
+
+        # Upload large buffer by parts in parallel
         with _handle_oss_error():
-            self._bucket.put_object(key=self._key, data=buffer.tobytes())
+            upload_id = self._bucket.init_multipart_upload(
+                self._key).upload_id
+            futures = []
+            try:
+                for part_number, part in enumerate(parts, 1):
+                    headers = ({'Content-MD5': _content_md5(part)}
+                               if self._checksum else None)
+                    futures.append(self._system._workers.submit(
+                        self._bucket.upload_part, key=self._key,
+                        upload_id=upload_id, part_number=part_number,
+                        data=_MemoryViewIO(part), headers=headers))
+
+                self._bucket.complete_multipart_upload(
+                    key=self._key, upload_id=upload_id, parts=[
+                        _PartInfo(part_number=part_number,
+                                  etag=future.result().etag)
+                        for part_number, future in enumerate(futures, 1)])
+            except BaseException:
+                # Clean up failed upload, once remaining parts are stopped
+                for future in futures:
+                    future.cancel()
+                _wait(futures)
+                self._bucket.abort_multipart_upload(
+                    key=self._key, upload_id=upload_id)
+                raise
 
 
 class OSSBufferedIO(_ObjectBufferedIOBase):
@@ -376,12 +506,26 @@ class OSSBufferedIO(_ObjectBufferedIOBase):
 
     Args:
         name (path-like object): URL or path to the file which will be opened.
-        mode (str): The mode can be 'r', 'w' for reading (default) or writing
+        mode (str): The mode can be 'r', 'w', 'a'
+            for reading (default), writing or appending
         buffer_size (int): The size of buffer.
         max_buffers (int): The maximum number of buffers to preload in read mode
             or awaiting flush in write mode. 0 for no limit.
-        max_workers (int): The maximum number of threads that can be used to
-            execute the given calls.
+        max_workers (int): The maximum number of threads of the shared worker
+            pool that can be used concurrently by this stream.
+        cache_size (int): In read mode, size in bytes of the LRU cache of
+            buffers already read or dropped on seek. 0 for no cache.
+        cache (pycosio.io.BlockCache): In read mode, existing cache to use
+            instead of "cache_size". Allows to share a cache between streams.
+        streaming (bool): In read mode, if True, buffers read sequentially
+            are pulled from a single streaming request instead of a range
+            request per buffer. Range requests are used again after a seek
+            until reading is sequential.
+        tuner (pycosio.io.AutoTuner): Tuner measuring requests of this stream.
+            If "buffer_size" or "max_workers" are not specified, they are
+            tuned from previous measures.
+        checksum (bool): If True, verify data integrity with checksums when
+            supported by the storage.
         storage_parameters (dict): OSS2 Auth keyword arguments and endpoint.
             This is generally OSS credentials and configuration.
         unsecure (bool): If True, disables TLS/SSL to improves
@@ -393,6 +537,9 @@ class OSSBufferedIO(_ObjectBufferedIOBase):
     #: Minimal buffer_size in bytes (OSS multipart upload minimal part size)
     MINIMUM_BUFFER_SIZE = 102400
 
+    # Maximum size of a part copied from an existing object
+    _MAX_COPY_PART_SIZE = 5368709120
+
     def __init__(self, *args, **kwargs):
         _ObjectBufferedIOBase.__init__(self, *args, **kwargs)
 
@@ -400,6 +547,48 @@ class OSSBufferedIO(_ObjectBufferedIOBase):
         self._key = self._raw._key
         self._upload_id = None
 
+        # Ranges of existing object to copy as first parts in append mode
+        self._copy_ranges = []
+
+    def _init_append(self):
+        """
+        Initializes file on 'a' mode.
+
+        The existing object is copied server side as first parts of the
+        multipart upload.
+        """
+        size = self._raw._size
+        if size < self.MINIMUM_BUFFER_SIZE:
+            # Too small to be a part, write it again
+            return _ObjectBufferedIOBase._init_append(self)
+
+        # Split object in parts not greater than the maximum copy size
+        parts_count = -(-size // self._MAX_COPY_PART_SIZE)
+        part_size = -(-size // parts_count)
+        self._copy_ranges = [
+            (start, min(start + part_size, size) - 1)
+            for start in range(0, size, part_size)]
+        self._seek = self._append_parts = len(self._copy_ranges)
+
+    def _upload_part(self, buffer, part_number):
+        """
+        Upload a part.
+
+        The part checksum is computed if "checksum" is enabled.
+
+        Args:
+            buffer (memoryview): Part content.
+            part_number (int): Part number.
+
+        Returns:
+            oss2.models.PutObjectResult: Uploaded part information.
+        """
+        headers = (
+            {'Content-MD5': _content_md5(buffer)} if self._checksum else None)
+        return self._bucket.upload_part(
+            key=self._key, upload_id=self._upload_id, part_number=part_number,
+            data=_MemoryViewIO(buffer), headers=headers)
+
     def _flush(self):
         """
         Flush the write buffers of the stream.
@@ -410,10 +599,20 @@ class OSSBufferedIO(_ObjectBufferedIOBase):
                 self._upload_id = self._bucket.init_multipart_upload(
                     self._key).upload_id
 
+            # Copy existing object parts in append mode
+            for part_number, copy_range in enumerate(self._copy_ranges, 1):
+                self._write_futures.append(dict(
+                    response=self._workers.submit(
+                        self._bucket.upload_part_copy,
+                        source_bucket_name=self._client_kwargs['bucket_name'],
+                        source_key=self._key, byte_range=copy_range,
+                        target_key=self._key, target_upload_id=self._upload_id,
+                        target_part_number=part_number),
+                    part_number=part_number))
+
         # Upload part with workers
-        response = self._workers.submit(
-            self._bucket.upload_part, key=self._key, upload_id=self._upload_id,
-            part_number=self._seek, data=self._get_buffer().tobytes())
+        response = self._submit_flush(
+            self._upload_part, self._get_buffer(), part_number=self._seek)
 
         # Save part information
         self._write_futures.append(
@@ -1,16 +1,23 @@
 # coding=utf-8
 """Amazon Web Services S3"""
+from concurrent.futures import wait as _wait
 from contextlib import contextmanager as _contextmanager
 from io import UnsupportedOperation as _UnsupportedOperation
 import re as _re
 
 import boto3 as _boto3
-from botocore.exceptions import ClientError as _ClientError
+from botocore.exceptions import (
+    ClientError as _ClientError, ConnectionError as _ConnectionError,
+    HTTPClientError as _HTTPClientError,
+    IncompleteReadError as _IncompleteReadError)
 
+from pycosio._core.checksum import (
+    content_md5 as _content_md5, md5_from_etag as _md5_from_etag)
 from pycosio._core.compat import to_timestamp as _to_timestamp
 from pycosio._core.exceptions import (
     ObjectNotFoundError as _ObjectNotFoundError,
     ObjectPermissionError as _ObjectPermissionError)
+from pycosio._core.io_base import MemoryViewIO as _MemoryViewIO
 from pycosio.io import (
     ObjectRawIOBase as _ObjectRawIOBase,
     ObjectBufferedIOBase as _ObjectBufferedIOBase,
@@ -24,6 +31,10 @@ _ERROR_CODES = {
     '403': _ObjectPermissionError,
     '404': _ObjectNotFoundError}
 
+_TRANSIENT_ERROR_CODES = frozenset((
+    'InternalError', 'RequestTimeout', 'ServiceUnavailable', 'SlowDown',
+    'Throttling', 'ThrottlingException'))
+
 
 @_contextmanager
 def _handle_client_error():
@@ -62,6 +73,7 @@ class _S3System(_SystemBase):
     _SIZE_KEYS = ('ContentLength',)
     _CTIME_KEYS = ('CreationDate',)
     _MTIME_KEYS = ('LastModified',)
+    _LIST_FIRST_LEVEL = True
 
     def __init__(self, *args, **kwargs):
         self._session = None
@@ -202,6 +214,44 @@ class _S3System(_SystemBase):
         except KeyError:
             raise _UnsupportedOperation('getsize')
 
+    def _getmd5_from_header(self, header):
+        """
+        Return the MD5 of the full object content from header.
+
+        The ETag is the MD5 only for objects uploaded in a single part and not
+        encrypted with KMS or customer provided keys.
+
+        Args:
+            header (dict): Object header.
+
+        Returns:
+            str: MD5 hex digest, or None if not available.
+        """
+        if (header.get('ServerSideEncryption') == 'aws:kms' or
+                'SSECustomerAlgorithm' in header):
+            return None
+        try:
+            return _md5_from_etag(header['ETag'])
+        except KeyError:
+            return None
+
+    def _header_from_listing(self, header):
+        """
+        Returns the header of an object from the header returned by listing.
+
+        Args:
+            header (dict): Object header from listing.
+
+        Returns:
+            dict: Object header compatible with "head" results, or None if not
+                available.
+        """
+        try:
+            header['ContentLength'] = header.pop('Size')
+        except KeyError:
+            return None
+        return header
+
     def _head(self, client_kwargs):
         """
         Returns object or bucket HTTP header.
@@ -272,7 +322,8 @@ class _S3System(_SystemBase):
         for bucket in response['Buckets']:
             yield bucket.pop('Name'), bucket
 
-    def _list_objects(self, client_kwargs, path, max_request_entries):
+    def _list_objects(self, client_kwargs, path, max_request_entries,
+                      first_level=False):
         """
         Lists objects.
 
@@ -281,6 +332,8 @@ class _S3System(_SystemBase):
             path (str): Path relative to current locator.
             max_request_entries (int): If specified, maximum entries returned
                 by request.
+            first_level (bool): If True, lists only first level objects, and
+                sub directories as names ending with "/" and empty headers.
 
         Returns:
             generator of tuple: object name str, object header dict
@@ -288,25 +341,49 @@ class _S3System(_SystemBase):
         client_kwargs = client_kwargs.copy()
         if max_request_entries:
             client_kwargs['MaxKeys'] = max_request_entries
-
-        while True:
+        if first_level:
+            client_kwargs['Delimiter'] = '/'
+
+        def request_page(continuation_token):
+            """
+            Request a page of results.
+
+            Args:
+                continuation_token (str): Continuation token.
+
+            Returns:
+                tuple: response dict, next continuation token str.
+            """
+            kwargs = client_kwargs
+            if continuation_token is not None:
+                kwargs = dict(
+                    client_kwargs, ContinuationToken=continuation_token)
             with _handle_client_error():
-                response = self.client.list_objects_v2(
-                    Prefix=path, **client_kwargs)
+                response = self.client.list_objects_v2(Prefix=path, **kwargs)
+            return response, response.get('NextContinuationToken')
 
-            try:
-                for obj in response['Contents']:
-                    yield obj.pop('Key'), obj
-            except KeyError:
-                raise _ObjectNotFoundError('Not found: %s' % path)
+        # Handles results on more than one page. Next page is requested in
+        # background, except if the caller limits the number of results.
+        for response in self._generate_pages(
+                request_page, prefetch=not max_request_entries):
 
-            # Handles results on more than one page
+            prefixes = response.get('CommonPrefixes', ())
             try:
-                client_kwargs['ContinuationToken'] = response[
-                    'NextContinuationToken']
+                objects = [(obj.pop('Key'), obj)
+                           for obj in response['Contents']]
             except KeyError:
-                # End of results
-                break
+                if not prefixes:
+                    raise _ObjectNotFoundError('Not found: %s' % path)
+                objects = []
+
+            # Sub directories, in lexicographic order with objects
+            if prefixes:
+                objects.extend(
+                    (prefix['Prefix'], dict()) for prefix in prefixes)
+                objects.sort(key=lambda obj: obj[0])
+
+            for name, header in objects:
+                yield name, header
 
 
 class S3RawIO(_ObjectRawIOBase):
@@ -325,9 +402,38 @@ class S3RawIO(_ObjectRawIOBase):
             May be optional if running on AWS EC2 instances.
         unsecure (bool): If True, disables TLS/SSL to improves
             transfer performance. But makes connection unsecure.
+        disk_cache (path-like object or pycosio.io.DiskCache): In read mode,
+            local directory, or existing disk cache, used to persistently
+            cache read chunks of the object. Default to no disk cache.
+        retry (pycosio.io.RetryPolicy): In read mode, policy used to retry
+            range reads on transient errors, and to hedge slow range reads.
+            Default to the policy shared by all streams of the storage.
+        checksum (bool): If True, verify data integrity with checksums when
+            supported by the storage.
     """
     _SYSTEM_CLASS = _S3System
 
+    @staticmethod
+    def _is_transient_error(exception):
+        """
+        Returns True if an exception raised by a request is transient, and so
+        the request can be retried.
+
+        Args:
+            exception (Exception): Exception.
+
+        Returns:
+            bool: True if transient.
+        """
+        if isinstance(exception, _ClientError):
+            response = exception.response
+            return (response.get('Error', {}).get('Code') in
+                    _TRANSIENT_ERROR_CODES or response.get(
+                        'ResponseMetadata', {}).get('HTTPStatusCode', 0) >= 500)
+        return isinstance(exception, (
+            _ConnectionError, _HTTPClientError, _IncompleteReadError)) or (
+            _ObjectRawIOBase._is_transient_error(exception))
+
     def _read_range(self, start, end=0):
         """
         Read a range of bytes in stream.
@@ -356,6 +462,52 @@ class S3RawIO(_ObjectRawIOBase):
         # Get object content
         return response['Body'].read()
 
+    def _read_range_into(self, start, buffer):
+        """
+        Read a range of bytes in stream directly into a buffer.
+
+        Args:
+            start (int): Start stream position.
+            buffer (memoryview): Writable buffer.
+
+        Returns:
+            int: number of bytes read
+        """
+        # Get object part from S3
+        try:
+            with _handle_client_error():
+                response = self._client.get_object(
+                    Range=self._http_range(start, start + len(buffer)),
+                    **self._client_kwargs)
+
+        # Check for end of file
+        except _ClientError as exception:
+            if exception.response['Error']['Code'] == 'InvalidRange':
+                # EOF
+                return 0
+            raise
+
+        # Write object content in buffer
+        return self._read_stream_into(response['Body'], buffer)
+
+    def _open_range_stream(self, start, end=0):
+        """
+        Open a streaming request on a range of bytes, to read its content
+        incrementally.
+
+        Args:
+            start (int): Start stream position.
+            end (int): End stream position.
+                0 To not specify end.
+
+        Returns:
+            file-like object: Response content.
+        """
+        with _handle_client_error():
+            return self._client.get_object(
+                Range=self._http_range(start, end),
+                **self._client_kwargs)['Body']
+
     def _readall(self):
         """
         Read and return all the bytes from the stream until EOF.
@@ -373,9 +525,43 @@ class S3RawIO(_ObjectRawIOBase):
         Args:
             buffer (memoryview): Buffer content.
         """
+        parts = self._get_upload_parts(buffer)
+        if len(parts) == 1:
+            kwargs = self._client_kwargs.copy()
+            if self._checksum:
+                kwargs['ContentMD5'] = _content_md5(buffer)
+            with _handle_client_error():
+                self._client.put_object(Body=_MemoryViewIO(buffer), **kwargs)
+            return
+
+        # Upload large buffer by parts in parallel
         with _handle_client_error():
-            self._client.put_object(
-                Body=buffer.tobytes(), **self._client_kwargs)
+            upload_id = self._client.create_multipart_upload(
+                **self._client_kwargs)['UploadId']
+            futures = []
+            try:
+                for part_number, part in enumerate(parts, 1):
+                    kwargs = self._client_kwargs.copy()
+                    if self._checksum:
+                        kwargs['ContentMD5'] = _content_md5(part)
+                    futures.append(self._system._workers.submit(
+                        self._client.upload_part, Body=_MemoryViewIO(part),
+                        PartNumber=part_number, UploadId=upload_id, **kwargs))
+
+                self._client.complete_multipart_upload(
+                    MultipartUpload={'Parts': [
+                        dict(ETag=future.result()['ETag'],
+                             PartNumber=part_number)
+                        for part_number, future in enumerate(futures, 1)]},
+                    UploadId=upload_id, **self._client_kwargs)
+            except BaseException:
+                # Clean up if failure, once remaining parts are stopped
+                for future in futures:
+                    future.cancel()
+                _wait(futures)
+                self._client.abort_multipart_upload(
+                    UploadId=upload_id, **self._client_kwargs)
+                raise
 
 
 class S3BufferedIO(_ObjectBufferedIOBase):
@@ -383,12 +569,26 @@ class S3BufferedIO(_ObjectBufferedIOBase):
 
     Args:
         name (path-like object): URL or path to the file which will be opened.
-        mode (str): The mode can be 'r', 'w' for reading (default) or writing
+        mode (str): The mode can be 'r', 'w', 'a'
+            for reading (default), writing or appending
         buffer_size (int): The size of buffer.
         max_buffers (int): The maximum number of buffers to preload in read mode
             or awaiting flush in write mode. 0 for no limit.
-        max_workers (int): The maximum number of threads that can be used to
-            execute the given calls.
+        max_workers (int): The maximum number of threads of the shared worker
+            pool that can be used concurrently by this stream.
+        cache_size (int): In read mode, size in bytes of the LRU cache of
+            buffers already read or dropped on seek. 0 for no cache.
+        cache (pycosio.io.BlockCache): In read mode, existing cache to use
+            instead of "cache_size". Allows to share a cache between streams.
+        streaming (bool): In read mode, if True, buffers read sequentially
+            are pulled from a single streaming request instead of a range
+            request per buffer. Range requests are used again after a seek
+            until reading is sequential.
+        tuner (pycosio.io.AutoTuner): Tuner measuring requests of this stream.
+            If "buffer_size" or "max_workers" are not specified, they are
+            tuned from previous measures.
+        checksum (bool): If True, verify data integrity with checksums when
+            supported by the storage.
         storage_parameters (dict): Boto3 Session keyword arguments.
             This is generally AWS credentials and configuration.
             This dict should contain two sub-dicts:
@@ -405,6 +605,9 @@ class S3BufferedIO(_ObjectBufferedIOBase):
     #: Minimal buffer_size in bytes (S3 multipart upload minimal part size)
     MINIMUM_BUFFER_SIZE = 5242880
 
+    # Maximum size of a part copied from an existing object
+    _MAX_COPY_PART_SIZE = 5368709120
+
     def __init__(self, *args, **kwargs):
 
         _ObjectBufferedIOBase.__init__(self, *args, **kwargs)
@@ -413,6 +616,58 @@ class S3BufferedIO(_ObjectBufferedIOBase):
         if self._writable:
             self._upload_args = self._client_kwargs.copy()
 
+            # Ranges of existing object to copy as first parts in append mode
+            self._copy_ranges = []
+
+    def _init_append(self):
+        """
+        Initializes file on 'a' mode.
+
+        The existing object is copied server side as first parts of the
+        multipart upload.
+        """
+        size = self._raw._size
+        if size < self.MINIMUM_BUFFER_SIZE:
+            # Too small to be a part, write it again
+            return _ObjectBufferedIOBase._init_append(self)
+
+        # Split object in parts not greater than the maximum copy size
+        parts_count = -(-size // self._MAX_COPY_PART_SIZE)
+        part_size = -(-size // parts_count)
+        self._copy_ranges = [
+            self._raw._http_range(start, min(start + part_size, size))
+            for start in range(0, size, part_size)]
+        self._seek = self._append_parts = len(self._copy_ranges)
+
+    def _upload_part_copy(self, **kwargs):
+        """
+        Copy a range of the existing object as part.
+
+        Args:
+            kwargs: "upload_part_copy" arguments.
+
+        Returns:
+            dict: Copied part information.
+        """
+        return self._client.upload_part_copy(**kwargs)['CopyPartResult']
+
+    def _upload_part(self, buffer, **kwargs):
+        """
+        Upload a part.
+
+        The part checksum is computed if "checksum" is enabled.
+
+        Args:
+            buffer (memoryview): Part content.
+            kwargs: "upload_part" arguments.
+
+        Returns:
+            dict: Uploaded part information.
+        """
+        if self._checksum:
+            kwargs['ContentMD5'] = _content_md5(buffer)
+        return self._client.upload_part(Body=_MemoryViewIO(buffer), **kwargs)
+
     def _flush(self):
         """
         Flush the write buffers of the stream.
@@ -424,10 +679,18 @@ class S3BufferedIO(_ObjectBufferedIOBase):
                     'UploadId'] = self._client.create_multipart_upload(
                     **self._client_kwargs)['UploadId']
 
+            # Copy existing object parts in append mode
+            for part_number, copy_range in enumerate(self._copy_ranges, 1):
+                self._write_futures.append(dict(
+                    response=self._workers.submit(
+                        self._upload_part_copy, CopySource=self._client_kwargs,
+                        CopySourceRange=copy_range, PartNumber=part_number,
+                        **self._upload_args), PartNumber=part_number))
+
         # Upload part with workers
-        response = self._workers.submit(
-            self._client.upload_part, Body=self._get_buffer().tobytes(),
-            PartNumber=self._seek, **self._upload_args)
+        response = self._submit_flush(
+            self._upload_part, self._get_buffer(), PartNumber=self._seek,
+            **self._upload_args)
 
         # Save part information
         self._write_futures.append(
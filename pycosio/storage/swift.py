@@ -1,11 +1,13 @@
 # coding=utf-8
 """OpenStack Swift"""
 from contextlib import contextmanager as _contextmanager
-from json import dumps as _dumps
+from json import dumps as _dumps, loads as _loads
+from uuid import uuid4 as _uuid
 
 import swiftclient as _swift
 from swiftclient.exceptions import ClientException as _ClientException
 
+from pycosio._core.checksum import md5_from_etag as _md5_from_etag
 from pycosio._core.io_base import memoizedmethod as _memoizedmethod
 from pycosio._core.exceptions import (
     ObjectNotFoundError as _ObjectNotFoundError,
@@ -52,6 +54,7 @@ class _SwiftSystem(_SystemBase):
     """
     _SIZE_KEYS = ('content-length', 'content_length', 'bytes')
     _MTIME_KEYS = ('last-modified', 'last_modified')
+    _LIST_FIRST_LEVEL = True
 
     def copy(self, src, dst, other_system=None):
         """
@@ -112,6 +115,44 @@ class _SwiftSystem(_SystemBase):
 
         return self.client.get_auth()[0],
 
+    def _getmd5_from_header(self, header):
+        """
+        Return the MD5 of the full object content from header.
+
+        The ETag is the MD5 only for objects that are not large objects
+        manifests.
+
+        Args:
+            header (dict): Object header.
+
+        Returns:
+            str: MD5 hex digest, or None if not available.
+        """
+        if ('x-object-manifest' in header or
+                'x-static-large-object' in header):
+            return None
+        try:
+            return _md5_from_etag(header['etag'])
+        except KeyError:
+            return None
+
+    def _header_from_listing(self, header):
+        """
+        Returns the header of an object from the header returned by listing.
+
+        Args:
+            header (dict): Object header from listing.
+
+        Returns:
+            dict: Object header compatible with "head" results, or None if not
+                available.
+        """
+        try:
+            header['etag'] = header.pop('hash')
+        except KeyError:
+            return None
+        return header
+
     def _head(self, client_kwargs):
         """
         Returns object HTTP header.
@@ -175,7 +216,8 @@ class _SwiftSystem(_SystemBase):
         for container in response[1]:
             yield container.pop('name'), container
 
-    def _list_objects(self, client_kwargs, path, max_request_entries):
+    def _list_objects(self, client_kwargs, path, max_request_entries,
+                      first_level=False):
         """
         Lists objects.
 
@@ -184,6 +226,8 @@ class _SwiftSystem(_SystemBase):
             path (str): Path relative to current locator.
             max_request_entries (int): If specified, maximum entries returned
                 by request.
+            first_level (bool): If True, lists only first level objects, and
+                sub directories as names ending with "/" and empty headers.
 
         Returns:
             generator of tuple: object name str, object header dict
@@ -193,13 +237,19 @@ class _SwiftSystem(_SystemBase):
             kwargs['limit'] = max_request_entries
         else:
             kwargs['full_listing'] = True
+        if first_level:
+            kwargs['delimiter'] = '/'
 
         with _handle_client_exception():
             response = self.client.get_container(
                 client_kwargs['container'], **kwargs)
 
         for obj in response[1]:
-            yield obj.pop('name'), obj
+            try:
+                # Sub directory
+                yield obj['subdir'], dict()
+            except KeyError:
+                yield obj.pop('name'), obj
 
 
 class SwiftRawIO(_ObjectRawIOBase):
@@ -217,9 +267,37 @@ class SwiftRawIO(_ObjectRawIOBase):
             (see "swiftclient.client.Connection" for more information)
         unsecure (bool): If True, disables TLS/SSL to improves
             transfer performance. But makes connection unsecure.
+        disk_cache (path-like object or pycosio.io.DiskCache): In read mode,
+            local directory, or existing disk cache, used to persistently
+            cache read chunks of the object. Default to no disk cache.
+        retry (pycosio.io.RetryPolicy): In read mode, policy used to retry
+            range reads on transient errors, and to hedge slow range reads.
+            Default to the policy shared by all streams of the storage.
+        checksum (bool): If True, verify data integrity with checksums when
+            supported by the storage.
     """
     _SYSTEM_CLASS = _SwiftSystem
 
+    # Size of chunks of streamed response content
+    _STREAM_CHUNK_SIZE = 65536
+
+    @staticmethod
+    def _is_transient_error(exception):
+        """
+        Returns True if an exception raised by a request is transient, and so
+        the request can be retried.
+
+        Args:
+            exception (Exception): Exception.
+
+        Returns:
+            bool: True if transient.
+        """
+        if isinstance(exception, _ClientException):
+            status = exception.http_status or 0
+            return status in (408, 429) or status >= 500
+        return _ObjectRawIOBase._is_transient_error(exception)
+
     @property
     @_memoizedmethod
     def _client_args(self):
@@ -255,6 +333,52 @@ class SwiftRawIO(_ObjectRawIOBase):
                 return b''
             raise
 
+    def _read_range_into(self, start, buffer):
+        """
+        Read a range of bytes in stream directly into a buffer.
+
+        Args:
+            start (int): Start stream position.
+            buffer (memoryview): Writable buffer.
+
+        Returns:
+            int: number of bytes read
+        """
+        try:
+            with _handle_client_exception():
+                # Get response content as stream
+                body = self._client.get_object(
+                    *self._client_args, headers=dict(Range=self._http_range(
+                        start, start + len(buffer))),
+                    resp_chunk_size=self._STREAM_CHUNK_SIZE)[1]
+
+        except _ClientException as exception:
+            if exception.http_status == 416:
+                # EOF
+                return 0
+            raise
+
+        # Write object content in buffer
+        return self._read_stream_into(body, buffer)
+
+    def _open_range_stream(self, start, end=0):
+        """
+        Open a streaming request on a range of bytes, to read its content
+        incrementally.
+
+        Args:
+            start (int): Start stream position.
+            end (int): End stream position.
+                0 To not specify end.
+
+        Returns:
+            file-like object: Response content.
+        """
+        with _handle_client_exception():
+            return self._client.get_object(
+                *self._client_args, headers=dict(Range=self._http_range(
+                    start, end)), resp_chunk_size=self._STREAM_CHUNK_SIZE)[1]
+
     def _readall(self):
         """
         Read and return all the bytes from the stream until EOF.
@@ -282,9 +406,23 @@ class SwiftBufferedIO(_ObjectBufferedIOBase):
 
     Args:
         name (path-like object): URL or path to the file which will be opened.
-        mode (str): The mode can be 'r', 'w' for reading (default) or writing
-        max_workers (int): The maximum number of threads that can be used to
-            execute the given calls.
+        mode (str): The mode can be 'r', 'w', 'a'
+            for reading (default), writing or appending
+        max_workers (int): The maximum number of threads of the shared worker
+            pool that can be used concurrently by this stream.
+        cache_size (int): In read mode, size in bytes of the LRU cache of
+            buffers already read or dropped on seek. 0 for no cache.
+        cache (pycosio.io.BlockCache): In read mode, existing cache to use
+            instead of "cache_size". Allows to share a cache between streams.
+        streaming (bool): In read mode, if True, buffers read sequentially
+            are pulled from a single streaming request instead of a range
+            request per buffer. Range requests are used again after a seek
+            until reading is sequential.
+        tuner (pycosio.io.AutoTuner): Tuner measuring requests of this stream.
+            If "buffer_size" or "max_workers" are not specified, they are
+            tuned from previous measures.
+        checksum (bool): If True, verify data integrity with checksums when
+            supported by the storage.
         storage_parameters (dict): Swift connection keyword arguments.
             This is generally OpenStack credentials and configuration.
             (see "swiftclient.client.Connection" for more information)
@@ -294,6 +432,9 @@ class SwiftBufferedIO(_ObjectBufferedIOBase):
 
     _RAW_CLASS = SwiftRawIO
 
+    # Minimal size in bytes of a static large object segment, except the last
+    _MINIMUM_SEGMENT_SIZE = 1048576
+
     def __init__(self, *args, **kwargs):
 
         _ObjectBufferedIOBase.__init__(self, *args, **kwargs)
@@ -303,13 +444,68 @@ class SwiftBufferedIO(_ObjectBufferedIOBase):
         if self._writable:
             self._segment_name = self._object_name + '.%03d'
 
+            # Existing object segments to reuse in append mode
+            self._append_segments = None
+
+    def _init_append(self):
+        """
+        Initializes file on 'a' mode.
+
+        Segments of an existing static large object are reused as first
+        segments of the new manifest. Other existing objects are copied server
+        side as first segment.
+        """
+        size = self._raw._size
+        if size < self._MINIMUM_SEGMENT_SIZE:
+            # Too small to be a segment, write it again
+            return _ObjectBufferedIOBase._init_append(self)
+
+        # New segments must not overwrite existing object segments
+        self._segment_name = '%s.%s.%%03d' % (self._object_name, _uuid().hex)
+
+        header = self._raw._head()
+        if str(header.get(
+                'x-static-large-object', '')).lower() == 'true':
+            with _handle_client_exception():
+                manifest = _loads(self._client.get_object(
+                    self._container, self._object_name,
+                    query_string='multipart-manifest=get')[1])
+            self._append_segments = [dict(
+                path=segment['name'].lstrip('/'), etag=segment['hash'],
+                size_bytes=segment['bytes']) for segment in manifest]
+
+        else:
+            for key in self._raw._system._ETAG_KEYS:
+                try:
+                    etag = header[key]
+                    break
+                except KeyError:
+                    continue
+            else:
+                etag = None
+            self._append_segments = [dict(
+                path='/'.join((self._container, self._segment_name % 0)),
+                etag=etag, copy=True)]
+
+        self._seek = self._append_parts = len(self._append_segments)
+
     def _flush(self):
         """
         Flush the write buffers of the stream.
         """
+        # Reuse existing object as first segments in append mode
+        if self._append_segments:
+            for segment in self._append_segments:
+                if segment.pop('copy', False):
+                    # Copy the existing object as a segment with workers
+                    segment['etag'] = self._workers.submit(
+                        self._copy_segment, segment['path'], segment['etag'])
+                self._write_futures.append(segment)
+            self._append_segments = None
+
         # Upload segment with workers
         name = self._segment_name % self._seek
-        response = self._workers.submit(
+        response = self._submit_flush(
             self._client.put_object, self._container, name,
             self._get_buffer())
 
@@ -317,13 +513,34 @@ class SwiftBufferedIO(_ObjectBufferedIOBase):
         self._write_futures.append(dict(
             etag=response, path='/'.join((self._container, name))))
 
+    def _copy_segment(self, path, etag):
+        """
+        Copy the existing object as a segment.
+
+        Args:
+            path (str): Segment path.
+            etag (str): Existing object ETag.
+
+        Returns:
+            str: Segment ETag.
+        """
+        with _handle_client_exception():
+            self._client.copy_object(
+                container=self._container, obj=self._object_name,
+                destination=path)
+        return etag
+
     def _close_writable(self):
         """
         Close the object in write mode.
         """
         # Wait segments upload completion
         for segment in self._write_futures:
-            segment['etag'] = segment['etag'].result()
+            try:
+                segment['etag'] = segment['etag'].result()
+            except AttributeError:
+                # Reused existing segment
+                continue
 
         # Upload manifest file
         with _handle_client_exception():
@@ -1,5 +1,10 @@
 # coding=utf-8
 """Pytest configuration"""
+from sys import version_info
+
+# Asyncio API requires Python 3.5
+collect_ignore = (
+    ['test_core_functions_aio.py'] if version_info < (3, 5) else [])
 
 
 def pytest_addoption(parser):
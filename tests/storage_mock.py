@@ -146,6 +146,47 @@ class ObjectStorageMock:
 
         return headers
 
+    def get_locator_delimited(self, locator, prefix=None, limit=None,
+                              delimiter=None, raise_404_if_empty=False):
+        """
+        Get locator content, grouping objects sharing a common prefix ending
+        with delimiter, like storage listing with a delimiter.
+
+        Args:
+            locator (str): locator name
+            prefix (str): Filter returned object with this prefix.
+            limit (int): Maximum number of result to return.
+            delimiter (str): Delimiter. If None, does not group objects.
+            raise_404_if_empty (bool): Raise 404 Error if empty.
+
+        Returns:
+            tuple: objects names, objects headers dict and
+                common prefixes list.
+        """
+        prefix = prefix or ''
+        headers = dict()
+        prefixes = []
+        for name, header in sorted(self.get_locator(
+                locator, prefix=prefix, raise_404_if_empty=False).items()):
+
+            sub_name = name[len(prefix):]
+            if delimiter and delimiter in sub_name:
+                common_prefix = ''.join((
+                    prefix, sub_name.split(delimiter, 1)[0], delimiter))
+                if common_prefix in prefixes:
+                    continue
+                prefixes.append(common_prefix)
+            else:
+                headers[name] = header
+
+            if len(headers) + len(prefixes) == limit:
+                break
+
+        if not headers and not prefixes and raise_404_if_empty:
+            self._raise_404()
+
+        return headers, prefixes
+
     def get_locators(self):
         """
         Get locators headers.
@@ -242,7 +283,7 @@ class ObjectStorageMock:
         Args:
             locator (str): locator name
             path (str): Object path.
-            content (bytes like-object): File content.
+            content (bytes like-object or file-like object): File content.
             headers (dict): Header to put with the file.
             data_range (tuple of int): Range of position of content.
             new_file (bool): If True, force new file creation.
@@ -250,6 +291,10 @@ class ObjectStorageMock:
         Returns:
             dict: File header.
         """
+        if hasattr(content, 'read'):
+            # Request body stream
+            content = content.read()
+
         with self._put_lock:
             if new_file:
                 self.delete_object(locator, path, not_exists_ok=True)
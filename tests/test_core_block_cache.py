@@ -0,0 +1,40 @@
+# coding=utf-8
+"""Test pycosio._core.block_cache"""
+
+
+def test_block_cache():
+    """Tests pycosio._core.block_cache.BlockCache"""
+    from pycosio._core.block_cache import BlockCache
+
+    cache = BlockCache(capacity=30)
+    assert cache.capacity == 30
+
+    # Tests put and get
+    cache.put('a', 10 * b'a')
+    cache.put('b', 10 * b'b')
+    assert cache.get('a') == 10 * b'a'
+    assert cache.get('c') is None
+    assert 'b' in cache
+    assert len(cache) == 2
+    assert cache.size == 20
+
+    # Tests least recently used eviction
+    cache.put('c', 15 * b'c')
+    assert 'b' not in cache
+    assert 'a' in cache
+    assert cache.size == 25
+
+    # Tests replace
+    cache.put('c', 5 * b'c')
+    assert cache.size == 15
+    assert cache.get('c') == 5 * b'c'
+
+    # Tests buffer larger than capacity
+    cache.put('d', 50 * b'd')
+    assert 'd' not in cache
+    assert cache.size == 15
+
+    # Tests clear
+    cache.clear()
+    assert not len(cache)
+    assert cache.size == 0
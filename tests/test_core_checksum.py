@@ -0,0 +1,48 @@
+# coding=utf-8
+"""Test pycosio._core.checksum"""
+from hashlib import md5
+
+import pytest
+
+
+def test_checksum():
+    """Tests pycosio._core.checksum"""
+    from pycosio._core.checksum import (
+        content_md5, md5_from_content_md5, md5_from_etag, StreamingMD5)
+    from pycosio._core.exceptions import ObjectIntegrityError
+
+    content = b'0123456789' * 100
+    digest = md5(content).hexdigest()
+
+    # Tests Content-MD5 header conversion
+    header = content_md5(content)
+    assert header == content_md5(memoryview(content))
+    assert md5_from_content_md5(header) == digest
+    assert md5_from_content_md5('invalid') is None
+    assert md5_from_content_md5('') is None
+
+    # Tests ETag conversion
+    assert md5_from_etag('"%s"' % digest) == digest
+    assert md5_from_etag(digest.upper()) == digest
+    assert md5_from_etag('"%s-2"' % digest) is None
+
+    # Tests sequential read verification
+    checker = StreamingMD5(digest, len(content), 'name')
+    for start in range(0, len(content), 300):
+        assert checker.active
+        checker.update(start, content[start:start + 300])
+    assert not checker.active
+
+    # Tests mismatch
+    checker = StreamingMD5(digest, len(content), 'name')
+    checker.update(0, content[:500])
+    with pytest.raises(ObjectIntegrityError):
+        checker.update(500, content[500:-1] + b'?')
+    assert not checker.active
+
+    # Tests non sequential read abandon verification
+    checker = StreamingMD5(digest, len(content), 'name')
+    checker.update(0, content[:500])
+    checker.update(600, content[600:])
+    assert not checker.active
+    checker.update(500, content[500:600])
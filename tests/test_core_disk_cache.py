@@ -0,0 +1,141 @@
+# coding=utf-8
+"""Test pycosio._core.disk_cache"""
+import os
+
+
+def test_disk_cache(tmpdir):
+    """Tests pycosio._core.disk_cache.DiskCache"""
+    from pycosio._core.disk_cache import DiskCache
+    from pycosio._core.io_base_raw import ObjectRawIOBase
+    from pycosio._core.retry import RetryPolicy
+
+    content = bytes(bytearray(range(256))) * 4
+    size = len(content)
+    reads = []
+
+    def read_range(start, end=0):
+        """Read content and count reads"""
+        reads.append((start, end))
+        return content[start:end or None]
+
+    path = str(tmpdir.join('cache'))
+    cache = DiskCache(path, chunk_size=100)
+    assert cache.path == path
+    assert os.path.isdir(path)
+    key = ('storage', 'path', size, 'etag')
+
+    # Tests read on miss: Full chunks are read
+    assert cache.read_range(read_range, key, size, 10, 20) == content[10:20]
+    assert reads == [(0, 100)]
+
+    # Tests read on hit: No new read
+    assert cache.read_range(read_range, key, size, 50, 90) == content[50:90]
+    assert len(reads) == 1
+
+    # Tests read on many chunks and until end of object
+    assert cache.read_range(read_range, key, size, 90, 250) == content[90:250]
+    assert reads[1:] == [(100, 200), (200, 300)]
+    assert cache.read_range(read_range, key, size, 950) == content[950:]
+    assert reads[-1] == (1000, 1024)
+    assert cache.read_range(read_range, key, size, 2000) == b''
+
+    # Tests cache is persistent and shared between instances
+    del reads[:]
+    other_cache = DiskCache(path, chunk_size=100)
+    assert other_cache.read_range(
+        read_range, key, size, 0, 300) == content[:300]
+    assert not reads
+
+    # Tests other object version is not read from cache
+    other_key = ('storage', 'path', size, 'other_etag')
+    assert cache.read_range(
+        read_range, other_key, size, 0, 10) == content[:10]
+    assert reads == [(0, 100)]
+
+    # Tests missing chunk is read again
+    del reads[:]
+    cache.clear()
+    assert not tuple(cache._list_chunks())
+    assert cache.read_range(read_range, key, size, 0, 10) == content[:10]
+    assert reads == [(0, 100)]
+
+    # Tests least recently used eviction
+    cache = DiskCache(path, max_size=250, chunk_size=100)
+    cache.clear()
+    for index, start in enumerate((0, 100, 200)):
+        cache.read_range(read_range, key, size, start, start + 1)
+        chunk_path = cache._chunk_path(key, index)
+        os.utime(chunk_path, (index, index))
+    cache.evict()
+    assert [chunk_size for _, chunk_size, _ in cache._list_chunks()] == [
+        100, 100]
+    assert not os.path.isfile(cache._chunk_path(key, 0))
+
+    # Tests raw IO with disk cache
+    del reads[:]
+
+    class DummySystem:
+        """Dummy system"""
+
+        storage = 'dummy'
+        _retry_policy = RetryPolicy()
+
+        def __init__(self, **_):
+            """Do nothing"""
+
+        @staticmethod
+        def getsize(*_, **__):
+            """Returns fake result"""
+            return size
+
+        @staticmethod
+        def head(*_, **__):
+            """Returns fake result"""
+            return {'ETag': 'etag'}
+
+        @staticmethod
+        def relpath(path):
+            """Returns fake result"""
+            return path
+
+        @staticmethod
+        def get_client_kwargs(*_, **__):
+            """Returns fake result"""
+            return {}
+
+        @staticmethod
+        def invalidate_header(*_, **__):
+            """Do nothing"""
+
+        @staticmethod
+        def _getversion_from_header(header):
+            """Returns fake result"""
+            return header['ETag']
+
+    class DummyRawIO(ObjectRawIOBase):
+        """Dummy IO"""
+        _SYSTEM_CLASS = DummySystem
+
+        def _flush(self, *_):
+            """Do nothing"""
+
+        def _read_range(self, start, end=0):
+            """Read content"""
+            return read_range(start, end)
+
+    cache = DiskCache(path, chunk_size=100)
+    cache.clear()
+    for _ in range(2):
+        with DummyRawIO('name', disk_cache=cache) as raw:
+            assert raw.read(10) == content[:10]
+            raw.seek(150)
+            buffer = bytearray(100)
+            assert raw.readinto(buffer) == 100
+            assert buffer == content[150:250]
+            raw.seek(0)
+            assert raw.readall() == content
+    assert len(reads) == 11
+
+    # Tests raw IO with disk cache path
+    with DummyRawIO('name', disk_cache=path) as raw:
+        assert raw.read() == content
@@ -7,7 +7,8 @@ import pytest
 def test_handle_os_exceptions():
     """Tests pycosio._core.exceptions.handle_os_exceptions"""
     from pycosio._core.exceptions import (
-        handle_os_exceptions, ObjectNotFoundError, ObjectPermissionError)
+        handle_os_exceptions, ObjectNotFoundError, ObjectPermissionError,
+        ObjectIntegrityError)
     from pycosio._core.compat import (
         file_not_found_error, permission_error)
 
@@ -18,3 +19,7 @@ def test_handle_os_exceptions():
     with pytest.raises(permission_error):
         with handle_os_exceptions():
             raise ObjectPermissionError('error')
+
+    with pytest.raises(OSError):
+        with handle_os_exceptions():
+            raise ObjectIntegrityError('error')
@@ -357,12 +357,13 @@ def test_cos_open(tmpdir):
     pycosio._core.functions_shutil.copy
     """
     from pycosio import copy, copyfile
-    from pycosio._core.functions_io import cos_open
+    from pycosio._core.functions_io import cos_open, cos_mmap
     from pycosio._core.storage_manager import MOUNTED
     from pycosio._core.compat import same_file_error
     from pycosio._core.io_base_system import SystemBase
     from io import TextIOWrapper, UnsupportedOperation
     from os.path import isdir
+    import gzip
     import pycosio._core.functions_shutil as pycosio_shutil
 
     root = 'dummy_read://'
@@ -499,6 +500,35 @@ def test_cos_open(tmpdir):
         with cos_open(str(local_file), 'rb') as file:
             assert file.read() == content
 
+        # open: Compressed local file
+        local_gz = tmpdir.join('file.txt.gz')
+        with cos_open(str(local_gz), 'wb', compression='gzip') as file:
+            assert file.write(content) == len(content)
+        assert gzip.decompress(local_gz.read_binary()) == content
+        with cos_open(str(local_gz), 'rb', compression='gzip') as file:
+            assert file.read() == content
+        with cos_open(str(local_gz), 'rt', compression='gzip') as file:
+            assert isinstance(file, TextIOWrapper)
+            assert file.read() == content.decode()
+
+        # open: Compressed stream
+        with cos_open(BytesIO(gzip.compress(content)), 'rb',
+                      compression='gzip') as file:
+            assert file.read() == content
+
+        # open: Compression errors
+        with pytest.raises(ValueError):
+            with cos_open(str(local_gz), 'r+b', compression='gzip'):
+                pass
+        with pytest.raises(ValueError):
+            with cos_open(str(local_gz), 'rb', compression='unsupported'):
+                pass
+
+        # mmap: Local file
+        memory_map = cos_mmap(str(local_file))
+        assert memory_map[:] == content
+        memory_map.close()
+
         # copy: Local file to local file
         local_dst = tmpdir.join('file_dst.txt')
         assert not local_dst.check()
@@ -0,0 +1,149 @@
+# coding=utf-8
+"""Test pycosio._core.functions_aio"""
+from asyncio import gather, new_event_loop
+from io import BytesIO
+
+import pytest
+
+
+def test_cos_open_aio(tmpdir):
+    """Tests pycosio._core.functions_aio.cos_open"""
+    from pycosio._core.functions_aio import (
+        cos_open, set_max_workers, _EXECUTOR, _POOL)
+    from pycosio._core.storage_manager import MOUNTED
+    from pycosio._core.workers import SHARED_POOL
+
+    root = 'dummy_aio://'
+    content = b'dummy_content'
+    opened = []
+
+    # Mock storage
+    class DummyRawIO(BytesIO):
+        """Dummy raw IO"""
+
+        def __init__(self, name, mode='r', **kwargs):
+            # Parallel transfers would run on the shared pool
+            assert _POOL.in_worker_thread()
+            assert SHARED_POOL.get_pool() is SHARED_POOL
+            BytesIO.__init__(self, content if 'r' in mode else b'')
+            self.name = name
+            self.kwargs = kwargs
+            self.written = None
+            opened.append(self)
+
+        def close(self):
+            """Keep written content"""
+            self.written = self.getvalue()
+            BytesIO.close(self)
+
+    MOUNTED[root] = dict(
+        raw=DummyRawIO, system_cached=None, storage_parameters={})
+
+    async def read_objects():
+        """Read objects concurrently"""
+
+        async def read_object(index):
+            """Read an object"""
+            async with cos_open('%sfile%d' % (root, index), 'rb') as file:
+                assert not file.closed
+                assert file.mode == 'r'
+                assert file.name == '%sfile%d' % (root, index)
+                assert await file.read(5) == content[:5]
+                assert file.tell() == 5
+                buffer = bytearray(3)
+                assert await file.readinto(buffer) == 3
+                assert bytes(buffer) == content[5:8]
+                assert file.seek(0) == 0
+                return await file.read()
+
+        return await gather(*(read_object(index) for index in range(100)))
+
+    async def write_object():
+        """Write an object"""
+        async with cos_open(root + 'file', 'wb') as file:
+            assert isinstance(file.raw, DummyRawIO)
+            assert await file.write(content) == len(content)
+            await file.flush()
+        assert file.closed
+        await file.close()
+
+    async def write_local(path):
+        """Write a local file"""
+        async with cos_open(path, 'wb') as file:
+            assert await file.write(content) == len(content)
+
+    async def read_local(path):
+        """Read a local file"""
+        async with cos_open(path, 'rb') as file:
+            return await file.read()
+
+    async def not_opened():
+        """Use a not opened file"""
+        file = cos_open(root + 'file')
+        assert file.closed
+        await file.read()
+
+    loop = new_event_loop()
+    try:
+        # Tests: Concurrent reads, with concurrency limit
+        set_max_workers(4)
+        assert _EXECUTOR.max_workers == 4
+        assert _POOL.max_workers == 4
+        assert loop.run_until_complete(read_objects()) == [content] * 100
+        set_max_workers(None)
+
+        # Tests: Write
+        del opened[:]
+        loop.run_until_complete(write_object())
+        assert opened[0].written == content
+
+        # Tests: Local file
+        local_file = str(tmpdir.join('file.dat'))
+        loop.run_until_complete(write_local(local_file))
+        assert loop.run_until_complete(read_local(local_file)) == content
+
+        # Tests: Errors
+        with pytest.raises(ValueError):
+            cos_open(local_file, 'rt')
+        with pytest.raises(ValueError):
+            loop.run_until_complete(not_opened())
+
+    finally:
+        del MOUNTED[root]
+        loop.close()
+
+
+def test_listing_aio(tmpdir):
+    """Tests pycosio._core.functions_aio listing functions"""
+    from pycosio._core.functions_aio import (
+        listdir, scandir, stat, AsyncScandirIterator)
+
+    names = sorted('file%d' % index for index in range(25))
+    for name in names:
+        tmpdir.join(name).write(name)
+    path = str(tmpdir)
+
+    async def scan():
+        """Scan directory"""
+        entries = []
+        async for entry in scandir(path):
+            entries.append(entry.name)
+        return entries
+
+    loop = new_event_loop()
+    batch_size = AsyncScandirIterator.BATCH_SIZE
+    try:
+        # Tests: listdir
+        assert sorted(loop.run_until_complete(listdir(path))) == names
+
+        # Tests: scandir, in many batches
+        AsyncScandirIterator.BATCH_SIZE = 10
+        assert sorted(loop.run_until_complete(scan())) == names
+
+        # Tests: stat
+        assert loop.run_until_complete(
+            stat(str(tmpdir.join('file1')))).st_size == len('file1')
+
+    finally:
+        AsyncScandirIterator.BATCH_SIZE = batch_size
+        loop.close()
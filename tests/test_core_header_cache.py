@@ -0,0 +1,64 @@
+# coding=utf-8
+"""Test pycosio._core.header_cache"""
+import time
+
+
+def test_header_cache():
+    """Tests pycosio._core.header_cache.HeaderCache"""
+    from pycosio._core.header_cache import HeaderCache
+
+    # Tests default values
+    cache = HeaderCache()
+    assert cache.ttl == HeaderCache.DEFAULT_TTL
+    assert cache.max_entries == HeaderCache.DEFAULT_MAX_ENTRIES
+
+    # Tests get and set
+    kwargs = dict(Bucket='bucket', Key='key')
+    header = dict(ContentLength=10)
+    assert cache.get(kwargs) is None
+    cache.set(kwargs, header)
+    assert cache.get(dict(Key='key', Bucket='bucket')) == header
+
+    # Tests cached headers are copies
+    cache.get(kwargs).pop('ContentLength')
+    header['ContentLength'] = 20
+    assert cache.get(kwargs) == dict(ContentLength=10)
+
+    # Tests invalidation
+    cache.invalidate(kwargs)
+    assert cache.get(kwargs) is None
+    cache.invalidate(kwargs)
+    cache.set(kwargs, header)
+    cache.clear()
+    assert not len(cache)
+
+    # Tests partial headers
+    cache.set(kwargs, header, partial=True)
+    assert cache.get(kwargs) == header
+    assert cache.get(kwargs, partial=False) is None
+    cache.set(kwargs, header)
+    assert cache.get(kwargs, partial=False) == header
+
+    # Tests unhashable client arguments are not cached
+    unhashable = dict(Bucket='bucket', Key=['key'])
+    cache.set(unhashable, header)
+    assert cache.get(unhashable) is None
+    cache.invalidate(unhashable)
+
+    # Tests least recently used entries are evicted
+    cache = HeaderCache(max_entries=2)
+    for index in range(3):
+        cache.set(dict(Key=index), header)
+        cache.get(dict(Key=0))
+    assert len(cache) == 2
+    assert cache.get(dict(Key=0)) == header
+    assert cache.get(dict(Key=1)) is None
+    assert cache.get(dict(Key=2)) == header
+
+    # Tests expiration
+    cache = HeaderCache(ttl=0.05)
+    cache.set(kwargs, header)
+    assert cache.get(kwargs) == header
+    time.sleep(0.1)
+    assert cache.get(kwargs) is None
+    assert not len(cache)
@@ -1,5 +1,7 @@
 # coding=utf-8
 """Test pycosio._core.io_base"""
+from threading import Event
+
 import pytest
 
 
@@ -34,6 +36,49 @@ def test_object_base_io():
         ObjectIOBase(name, mode='z')
 
 
+def test_memory_view_io():
+    """Tests pycosio._core.io_base.MemoryViewIO"""
+    from io import IOBase
+    from os import SEEK_CUR, SEEK_END
+    from pycosio._core.io_base import MemoryViewIO
+
+    content = bytearray(b'0123456789')
+    body = MemoryViewIO(memoryview(content)[2:])
+    assert isinstance(body, IOBase)
+    assert body.readable()
+    assert body.seekable()
+    assert len(body) == 8
+
+    # Tests read
+    assert body.read(3) == b'234'
+    assert body.tell() == 3
+    assert body.read() == b'56789'
+    assert body.read(2) == b''
+
+    # Tests seek
+    assert body.seek(-2, SEEK_END) == 6
+    assert body.read(10) == b'89'
+    assert body.seek(0) == 0
+    assert body.seek(1, SEEK_CUR) == 1
+    with pytest.raises(ValueError):
+        body.seek(-1)
+    with pytest.raises(ValueError):
+        body.seek(0, 10)
+
+    # Tests readinto
+    buffer = bytearray(4)
+    assert body.readinto(buffer) == 4
+    assert buffer == b'3456'
+    body.seek(6)
+    assert body.readinto(buffer) == 2
+    assert buffer[:2] == b'89'
+
+    # Tests content is not copied
+    body.seek(0)
+    content[2:4] = b'ab'
+    assert body.read(2) == b'ab'
+
+
 def test_memoizedmethod():
     """Tests pycosio._core.utilities.memoizedmethod"""
     from pycosio._core.io_base import memoizedmethod
@@ -55,3 +100,60 @@ def test_memoizedmethod():
     assert dummy.to_memoize(value) == value
     assert dummy._cache == {'to_memoize': value}
     assert dummy.to_memoize(value) == value
+
+
+def test_worker_pool_base_generate_pages():
+    """Tests pycosio._core.io_base.WorkerPoolBase._generate_pages"""
+    from pycosio._core.io_base import WorkerPoolBase
+
+    class Dummy(WorkerPoolBase):
+        """Dummy class"""
+        def __init__(self):
+            WorkerPoolBase.__init__(self)
+            self._cache = {}
+
+    pool = Dummy()
+    requested = []
+    second_requested = Event()
+
+    def request_page(marker):
+        """Returns fake page"""
+        marker = marker or 0
+        requested.append(marker)
+        if marker == 1:
+            second_requested.set()
+        return 'page%d' % marker, (marker + 1) if marker < 3 else None
+
+    # Tests all pages with prefetch
+    assert list(pool._generate_pages(request_page)) == [
+        'page0', 'page1', 'page2', 'page3']
+    assert requested == [0, 1, 2, 3]
+
+    # Tests next page requested in background while current page is processed
+    del requested[:]
+    second_requested.clear()
+    pages = pool._generate_pages(request_page)
+    assert next(pages) == 'page0'
+    assert second_requested.wait(5)
+    assert requested == [0, 1]
+    pages.close()
+
+    # Tests without prefetch
+    del requested[:]
+    pages = pool._generate_pages(request_page, prefetch=False)
+    assert next(pages) == 'page0'
+    assert next(pages) == 'page1'
+    assert requested == [0, 1]
+    assert list(pages) == ['page2', 'page3']
+
+    # Tests errors
+    def request_page_error(marker):
+        """Raises on second page"""
+        if marker:
+            raise ValueError
+        return 'page0', 1
+
+    pages = pool._generate_pages(request_page_error)
+    assert next(pages) == 'page0'
+    with pytest.raises(ValueError):
+        next(pages)
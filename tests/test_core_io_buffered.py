@@ -3,6 +3,8 @@
 import os
 import time
 
+import pytest
+
 
 def test_object_buffered_base_io():
     """Tests pycosio._core.io_buffered.ObjectBufferedIOBase"""
@@ -10,6 +12,8 @@ def test_object_buffered_base_io():
     from pycosio._core.io_base_buffered import ObjectBufferedIOBase
     from pycosio._core.io_random_write import (
         ObjectRawIORandomWriteBase, ObjectBufferedIORandomWriteBase)
+    from pycosio._core.memory import BufferPool
+    from pycosio._core.retry import RetryPolicy
 
     # Mock sub class
     name = 'name'
@@ -18,6 +22,7 @@ def test_object_buffered_base_io():
     raw_flushed = bytearray()
     buffer_size = 100
     flush_sleep = 0
+    version = ['1']
 
     def flush(data):
         """Dummy flush"""
@@ -28,6 +33,7 @@ def test_object_buffered_base_io():
         """Dummy system"""
 
         client = None
+        _retry_policy = RetryPolicy()
 
         def __init__(self, **_):
             """Do nothing"""
@@ -52,6 +58,15 @@ def test_object_buffered_base_io():
             """Returns fake result"""
             return {}
 
+        @staticmethod
+        def invalidate_header(*_, **__):
+            """Do nothing"""
+
+        @staticmethod
+        def _getversion_from_header(*_, **__):
+            """Returns fake result"""
+            return version[0]
+
     class DummyRawIO(ObjectRawIOBase):
         """Dummy IO"""
         _SYSTEM_CLASS = DummySystem
@@ -89,7 +104,7 @@ def test_object_buffered_base_io():
 
         def _flush(self):
             """Flush"""
-            self._write_futures.append(self._workers.submit(
+            self._write_futures.append(self._submit_flush(
                 flush, self._write_buffer[:self._buffer_seek]))
 
     class DummyRawIOPartFlush(DummyRawIO, ObjectRawIORandomWriteBase):
@@ -116,20 +131,37 @@ def test_object_buffered_base_io():
 
     # Tests: Read, max buffer
     object_io = DummyBufferedIO(name)
-    assert object_io._max_buffers == size // buffer_size
+    assert object_io._max_buffers == min(
+        size // buffer_size, object_io.MAXIMUM_READ_AHEAD)
+
+    # Tests: Read sequentially, read-ahead window bounded by default
+    class DummyBufferedIOReadAhead(DummyBufferedIO):
+        """Dummy buffered IO with small maximum read-ahead"""
+        MAXIMUM_READ_AHEAD = 8
+
+    object_io = DummyBufferedIOReadAhead(name)
+    assert object_io._max_buffers == 8
+    in_flight = 0
+    while object_io.read(buffer_size):
+        in_flight = max(in_flight, len(object_io._read_queue))
+    assert in_flight == object_io._read_ahead == 8
 
     object_io = DummyBufferedIO(name, max_buffers=5)
+    assert object_io._read_ahead == object_io.MINIMUM_READ_AHEAD == 2
     assert object_io.read(100) == 100 * b'0'
 
-    # Tests: Read by parts
+    # Tests: Read by parts, read-ahead window grows while reading sequentially
+    assert object_io._read_ahead == 4
     assert sorted(object_io._read_queue) == list(range(
-        100, 100 + buffer_size * 5, buffer_size))
+        100, 100 + buffer_size * 4, buffer_size))
     assert object_io._seek == 100
     assert object_io.read(150) == 150 * b'0'
+    assert object_io._read_ahead == 5
     assert sorted(object_io._read_queue) == list(range(
         200, 200 + buffer_size * 5, buffer_size))
     assert object_io._seek == 250
     assert object_io.read(50) == 50 * b'0'
+    assert object_io._read_ahead == 5
     assert sorted(object_io._read_queue) == list(range(
         300, 300 + buffer_size * 5, buffer_size))
     assert object_io._seek == 300
@@ -143,14 +175,29 @@ def test_object_buffered_base_io():
         assert object_io.read(part) == part * b'0'
         assert object_io._seek == part * index
 
-    # Tests: Read, change seek
+    # Tests: Read, change seek resets the read-ahead window
     object_io.seek(450)
+    assert object_io._read_ahead == 2
     assert sorted(object_io._read_queue) == list(range(
-        450, 450 + buffer_size * 5, buffer_size))
+        400, 400 + buffer_size * 2, buffer_size))
 
     object_io.seek(700)
+    assert object_io._read_ahead == 2
     assert sorted(object_io._read_queue) == list(range(
-        700, 700 + buffer_size * 5, buffer_size))
+        700, 700 + buffer_size * 2, buffer_size))
+
+    # Tests: Read, not aligned seek
+    object_io.seek(450)
+    assert object_io.read(100) == 100 * b'0'
+    assert object_io.tell() == 550
+    assert object_io.read() == (size - 550) * b'0'
+
+    # Tests: Seek on current position keeps the read-ahead window
+    object_io.seek(0)
+    object_io.read(250)
+    assert object_io._read_ahead == 5
+    object_io.seek(250)
+    assert object_io._read_ahead == 5
 
     # Tests: Read buffer size (No copy mode)
     object_io.seek(0)
@@ -213,9 +260,26 @@ def test_object_buffered_base_io():
 
     # Test max buffer
     object_io = DummyBufferedIO(name, mode='w', max_buffers=2)
-    flush_sleep = object_io._FLUSH_WAIT
+    flush_sleep = 0.01
     assert object_io.write(1000 * b'0') == 1000
+    assert object_io._flush_pending <= 2
     flush_sleep = 0
+    object_io.close()
+
+    # Test write buffers are recycled
+    object_io = DummyBufferedIO(name, mode='w')
+    object_io._BUFFER_POOL = BufferPool()
+    assert object_io.write(1000 * b'0') == 1000
+    object_io.close()
+    assert object_io._write_buffer is None
+    for _ in range(100):
+        # Buffers are recycled in flush futures callbacks
+        if object_io._BUFFER_POOL.free_size:
+            break
+        time.sleep(0.01)
+    assert object_io._BUFFER_POOL.free_size
+    with DummyBufferedIO(name, mode='w') as object_io:
+        assert object_io._write_buffer is not None
 
     # Test default implementation with part flush support
     raw_flushed[:] = b''
@@ -223,3 +287,359 @@ def test_object_buffered_base_io():
     with DummyBufferedIOPartFlush(name, mode='w', buffer_size=10) as object_io:
         object_io.write(content)
     assert raw_flushed == content
+
+    # Tests: Read into, buffers covered by the read buffer are read directly
+    object_io = DummyBufferedIO(name, max_buffers=2)
+    direct_reads = []
+    read_range_into = object_io._read_range_into
+
+    def counted_read_range_into(start, buffer):
+        """Count direct reads"""
+        direct_reads.append(start)
+        return read_range_into(start, buffer)
+
+    object_io._read_range_into = counted_read_range_into
+    object_io.seek(50)
+    buffer = bytearray(1000)
+    assert object_io.readinto(buffer) == 1000
+    assert buffer == 1000 * b'0'
+    assert sorted(direct_reads) == list(range(200, 1000, buffer_size))
+    assert object_io.tell() == 1050
+    assert not object_io._direct_queue
+    assert 1000 in object_io._read_queue
+
+    # Tests: Read into, direct reads until end of file
+    direct_reads[:] = []
+    object_io.seek(size - 250)
+    buffer = bytearray(1000)
+    assert object_io.readinto(buffer) == 250
+    assert direct_reads == [size - 100]
+    assert object_io.tell() == size
+
+    # Tests: Read with cache, buffers are reused after backward seek
+    object_io = DummyBufferedIO(name, max_buffers=2, cache_size=1000)
+    object_io._read_range_into = counted_read_range_into
+    read_range = object_io._read_range
+    read_ranges = []
+
+    def counted_read_range(start, end=0):
+        """Count reads"""
+        read_ranges.append(start)
+        return read_range(start, end)
+
+    object_io._read_range = counted_read_range
+    assert object_io.read(250) == 250 * b'0'
+    loaded = len(read_ranges)
+    object_io.seek(0)
+    direct_reads[:] = []
+    assert object_io.read(250) == 250 * b'0'
+    assert len(read_ranges) == loaded
+    assert not direct_reads
+    assert object_io._block_cache.size <= 1000
+    object_io.close()
+
+    # Tests: Shared cache
+    from pycosio.io import BlockCache
+    cache = BlockCache(1000)
+    with DummyBufferedIO(name, cache=cache) as object_io:
+        assert object_io._block_cache is cache
+        object_io.read(100)
+    assert len(cache)
+
+    # Tests: Shared cache, buffers of a previous object version are not used
+    cached_keys = set(cache._blocks)
+    version[0] = '2'
+    with DummyBufferedIO(name, cache=cache) as object_io:
+        object_io.read(100)
+    assert set(cache._blocks) - cached_keys
+    version[0] = '1'
+
+    # Tests: Read ranges, nearby ranges are merged
+    object_io = DummyBufferedIO(name, cache=BlockCache(1000))
+    raw_reads = []
+    raw_read_range_into = object_io.raw._read_range_into
+
+    def counted_raw_read_range_into(start, buffer):
+        """Count reads"""
+        raw_reads.append((start, len(buffer)))
+        return raw_read_range_into(start, buffer)
+
+    object_io.raw._read_range_into = counted_raw_read_range_into
+    ranges = [(5000, 10), (10, 20), (40, 10), (5020, 10), (size - 10, 50)]
+    assert [bytes(data) for data in object_io.read_ranges(
+        ranges, max_gap=20)] == [
+            10 * b'0', 20 * b'0', 10 * b'0', 10 * b'0', 10 * b'0']
+    assert sorted(raw_reads) == [(10, 40), (5000, 30), (size - 10, 50)]
+    assert object_io.tell() == 0
+
+    # Tests: Read ranges, merged requests size is limited
+    raw_reads[:] = []
+    object_io.raw.RANGES_MAX_SIZE = 25
+    ranges = [(6000 + 10 * index, 10) for index in range(5)]
+    assert [bytes(data) for data in object_io.read_ranges(ranges)] == [
+        10 * b'0'] * 5
+    assert sorted(raw_reads) == [(6000, 20), (6020, 20), (6040, 10)]
+    del object_io.raw.RANGES_MAX_SIZE
+
+    # Tests: Read ranges, zero length ranges are not requested
+    raw_reads[:] = []
+    assert [bytes(data) for data in object_io.read_ranges(
+        [(7000, 0), (7100, 10), (7500, 0), (size + 10, 0)])] == [
+            b'', 10 * b'0', b'', b'']
+    assert raw_reads == [(7100, 10)]
+
+    # Tests: Read ranges, cached buffers are used
+    assert object_io.read(50) == 50 * b'0'
+    assert object_io.read(50) == 50 * b'0'
+    raw_reads[:] = []
+    assert [bytes(data) for data in object_io.read_ranges(
+        [(20, 10), (5000, 10)])] == [10 * b'0', 10 * b'0']
+    assert raw_reads == [(5000, 10)]
+
+    # Tests: Streaming read, sequential buffers are read from one request
+    from io import BytesIO
+    content = os.urandom(size)
+    streams = []
+
+    class DummyRawIOStream(DummyRawIO):
+        """Dummy IO with streaming requests support"""
+
+        def _read_range(self, start, end=0):
+            """Read content"""
+            return content[start:end or None]
+
+        def _open_range_stream(self, start, end=0):
+            """Open a stream on content"""
+            streams.append(start)
+            return BytesIO(content[start:end or None])
+
+    class DummyBufferedIOStream(DummyBufferedIO):
+        """Dummy buffered IO with streaming requests support"""
+        _RAW_CLASS = DummyRawIOStream
+
+    with DummyBufferedIOStream(
+            name, max_buffers=4, streaming=True) as object_io:
+        assert object_io.read() == content
+        assert streams == [object_io.MINIMUM_READ_AHEAD * buffer_size]
+
+        # Tests: Range requests are used after seek, then stream is reopened
+        object_io.seek(5050)
+        assert object_io.read(1000) == content[5050:6050]
+        assert len(streams) == 2
+        assert streams[1] > 5050
+        assert object_io.read(buffer_size) == content[6050:6150]
+
+        # Tests: Read buffer by buffer
+        object_io.seek(0)
+        for start in range(0, size, buffer_size):
+            assert object_io.read(buffer_size) == content[
+                start:start + buffer_size]
+        assert len(streams) == 3
+    assert object_io._stream is None
+
+    # Tests: Read, range reads are retried on transient errors
+    from pycosio._core.retry import TRANSIENT_ERRORS
+    failures = []
+
+    class DummyRawIOFailing(DummyRawIO):
+        """Dummy IO with failing reads"""
+
+        def _read_range(self, start, end=0):
+            """Fail once by range"""
+            if start not in failures:
+                failures.append(start)
+                raise TRANSIENT_ERRORS[0]()
+            return DummyRawIO._read_range(self, start, end)
+
+    class DummyBufferedIOFailing(DummyBufferedIO):
+        """Dummy buffered IO with failing reads"""
+        _RAW_CLASS = DummyRawIOFailing
+
+    with DummyBufferedIOFailing(
+            name, retry=RetryPolicy(backoff=0.001)) as object_io:
+        assert object_io.read() == size * b'0'
+        assert len(failures) == size // buffer_size
+
+    # Tests: Streaming read, unsupported by storage
+    with DummyBufferedIO(name, streaming=True) as object_io:
+        for _ in range(5):
+            assert object_io.read(buffer_size) == buffer_size * b'0'
+        assert not object_io._streaming
+
+    # Tests: Read lines from preloaded buffers
+    from io import TextIOWrapper
+    content = b''.join(
+        ('line %d%s\n' % (index, index % 7 * 40 * '-')).encode()
+        for index in range(size))[:size]
+    lines = content.splitlines(True)
+    raw_reads = []
+
+    class DummyRawIOLines(DummyRawIO):
+        """Dummy IO with lines"""
+
+        def _read_range(self, start, end=0):
+            """Read content"""
+            raw_reads.append(start)
+            return content[start:end or None]
+
+    class DummyBufferedIOLines(DummyBufferedIO):
+        """Dummy buffered IO with lines"""
+        _RAW_CLASS = DummyRawIOLines
+
+    with DummyBufferedIOLines(name) as object_io:
+        assert list(object_io) == lines
+        assert object_io.tell() == size
+        assert object_io.readline() == b''
+        assert len(raw_reads) == size // buffer_size
+
+        # Tests: Read line with size limit and from not aligned position
+        line_start = lines[1].find(b'-')
+        object_io.seek(len(lines[0]) + line_start)
+        assert object_io.readline(2) == b'--'
+        assert object_io.readline() == lines[1][line_start + 2:]
+        assert object_io.readlines(1) == [lines[2]]
+
+        # Tests: Read1 and peek, don't read over one buffer
+        object_io.seek(buffer_size - 10)
+        assert object_io.peek(5) == content[buffer_size - 10:buffer_size - 5]
+        assert object_io.read1() == content[buffer_size - 10:buffer_size]
+        assert object_io.read1(5) == content[buffer_size:buffer_size + 5]
+        buffer = bytearray(buffer_size)
+        assert object_io.readinto1(buffer) == buffer_size - 5
+        assert bytes(buffer[:buffer_size - 5]) == content[
+            buffer_size + 5:2 * buffer_size]
+
+    # Tests: Text mode, each buffer is read once
+    raw_reads[:] = []
+    with TextIOWrapper(DummyBufferedIOLines(name)) as text_io:
+        assert list(text_io) == content.decode().splitlines(True)
+    assert sorted(raw_reads) == list(range(0, size, buffer_size))
+
+    # Tests: Read, object checksum is verified
+    from hashlib import md5
+    checksums = [md5(content).hexdigest()]
+
+    class DummySystemChecksum(DummySystem):
+        """Dummy system with checksum"""
+
+        @staticmethod
+        def _getmd5_from_header(*_, **__):
+            """Returns fake checksum"""
+            return checksums[0]
+
+    class DummyRawIOChecksum(DummyRawIOLines):
+        """Dummy IO with checksum"""
+        _SYSTEM_CLASS = DummySystemChecksum
+
+    class DummyBufferedIOChecksum(DummyBufferedIO):
+        """Dummy buffered IO with checksum"""
+        _RAW_CLASS = DummyRawIOChecksum
+
+    with DummyBufferedIOChecksum(name, checksum=True) as object_io:
+        assert object_io.read() == content
+        assert not object_io._read_md5.active
+    with DummyBufferedIOChecksum(name, checksum=True) as object_io:
+        assert list(object_io) == lines
+
+    # Tests: Read, checksum mismatch raises
+    checksums[0] = md5(b'').hexdigest()
+    with DummyBufferedIOChecksum(name, checksum=True) as object_io:
+        with pytest.raises(OSError):
+            object_io.read()
+
+    # Tests: Read, checksum is not verified on random access
+    with DummyBufferedIOChecksum(name, checksum=True) as object_io:
+        object_io.seek(buffer_size)
+        assert object_io.read() == content[buffer_size:]
+        assert not object_io._read_md5.active
+
+    # Tests: Read, checksum is not verified if not enabled
+    with DummyBufferedIOChecksum(name) as object_io:
+        assert object_io.read() == content
+        assert object_io._read_md5 is None
+
+    # Tests auto-tuning
+    from pycosio._core.tuning import AutoTuner
+    tuner = AutoTuner()
+
+    # Tests: Default values used without measures
+    with DummyBufferedIO(name, tuner=tuner) as object_io:
+        assert object_io._buffer_size == buffer_size
+        assert object_io._workers_count == AutoTuner.INITIAL_WORKERS
+        assert object_io.read() == size * b'0'
+    assert tuner.to_dict()['moments'] is not None
+
+    # Tests: Tuned values are limited by storage and object size
+    tuner.update(dict(latency=0.01, bandwidth=100000000, workers=2))
+    with DummyBufferedIO(name, tuner=tuner, max_workers=3) as object_io:
+        assert object_io._buffer_size == DummyBufferedIO.MAXIMUM_BUFFER_SIZE
+        assert object_io._workers_count == 3
+    size = 50
+    with DummyBufferedIO(name, tuner=tuner) as object_io:
+        assert object_io._buffer_size == 50
+        assert object_io._workers.max_workers == 2
+        assert object_io.read() == size * b'0'
+    size = 10000
+
+    # Tests: Flushes are measured
+    flushed = bytearray()
+    with DummyBufferedIO(name, mode='w', tuner=True) as object_io:
+        tuner = object_io._tuner
+        assert object_io.write(1000 * b'0') == 1000
+    assert bytes(flushed) == 1000 * b'0'
+    assert tuner.to_dict()['moments'] is not None
+
+    # Tests memory budget
+    from pycosio._core.memory import MemoryBudget
+
+    class DummyBufferedIOBudget(DummyBufferedIO):
+        """Dummy buffered IO with memory budget"""
+        _MEMORY_BUDGET = MemoryBudget(size=3 * buffer_size)
+
+    budget = DummyBufferedIOBudget._MEMORY_BUDGET
+
+    # Tests: Read, preload window is limited by the budget
+    object_io = DummyBufferedIOBudget(name, max_buffers=10)
+    assert object_io.read(450) == 450 * b'0'
+    assert len(object_io._read_queue) <= 3
+    assert budget.used == len(object_io._read_queue) * buffer_size
+
+    # Tests: Read, at least one buffer is preloaded with exhausted budget
+    other_io = DummyBufferedIOBudget(name, max_buffers=10)
+    assert other_io.read(150) == 150 * b'0'
+    assert len(other_io._read_queue) >= 1
+    other_io.close()
+    object_io.close()
+    assert budget.used == 0
+
+    # Tests: Write, memory is released once flushed
+    flushed = bytearray()
+    with DummyBufferedIOBudget(name, mode='w') as object_io:
+        assert object_io.write(1000 * b'0') == 1000
+    assert bytes(flushed) == 1000 * b'0'
+    for _ in range(100):
+        # Memory is released by future callback after task completion
+        if not budget.used:
+            break
+        time.sleep(0.01)
+    assert budget.used == 0
+
+    # Tests: Write, memory is released if the flush can't be submitted
+    class FailingExecutor:
+        """Executor that can't run tasks"""
+
+        @staticmethod
+        def submit(*_, **__):
+            """Raise error"""
+            raise RuntimeError('cannot schedule new futures after shutdown')
+
+    flushed = bytearray()
+    object_io = DummyBufferedIOBudget(name, mode='w')
+    object_io._cache['_workers'] = FailingExecutor()
+    with pytest.raises(OSError):
+        object_io.write((buffer_size + 1) * b'0')
+    assert budget.used == 0
+    assert not object_io._flush_pending
+    del object_io._cache['_workers']
+    object_io.close()
+    assert bytes(flushed) == buffer_size * b'0'
@@ -0,0 +1,116 @@
+# coding=utf-8
+"""Test pycosio._core.io_compression"""
+from io import BytesIO, UnsupportedOperation
+
+import pytest
+
+
+def test_compressed_raw_io():
+    """Tests pycosio._core.io_compression.CompressedRawIO"""
+    from pycosio._core.io_compression import CompressedRawIO, COMPRESSIONS
+
+    content = b''.join(
+        ('line %d\n' % index).encode() for index in range(100000))
+
+    for compression in COMPRESSIONS:
+        # Tests: Write
+        stream = BytesIO()
+        compressed_io = CompressedRawIO(stream, 'w', compression)
+        assert compressed_io.compression == compression
+        assert compressed_io.writable()
+        assert not compressed_io.readable()
+        assert not compressed_io.seekable()
+        for start in range(0, len(content), 100000):
+            assert compressed_io.write(
+                content[start:start + 100000]) == len(
+                    content[start:start + 100000])
+        assert compressed_io.tell() == len(content)
+        with pytest.raises(UnsupportedOperation):
+            compressed_io.read(1)
+        with pytest.raises(UnsupportedOperation):
+            compressed_io.seek(0)
+        compressed_io.close()
+        compressed_io.close()
+        compressed = stream.getvalue()
+        assert 0 < len(compressed) < len(content)
+
+        # Tests: Read
+        compressed_io = CompressedRawIO(BytesIO(compressed), 'r', compression)
+        assert compressed_io.readable()
+        assert not compressed_io.writable()
+        assert compressed_io.readall() == content
+        assert compressed_io.tell() == len(content)
+        assert compressed_io.read(10) == b''
+        with pytest.raises(UnsupportedOperation):
+            compressed_io.write(b'0')
+        compressed_io.close()
+
+        # Tests: Read concatenated compressed streams
+        compressed_io = CompressedRawIO(
+            BytesIO(compressed * 2), 'r', compression)
+        assert compressed_io.readall() == content * 2
+        compressed_io.close()
+
+        # Tests: Read concatenated compressed streams split on chunk boundary
+        class ChunkBoundaryIO(CompressedRawIO):
+            """Compressed stream with chunks of one compressed stream"""
+            CHUNK_SIZE = len(compressed)
+
+        compressed_io = ChunkBoundaryIO(
+            BytesIO(compressed * 2), 'r', compression)
+        assert compressed_io.readall() == content * 2
+        compressed_io.close()
+
+        # Tests: Decompressed chunks size is limited
+        class SmallChunksIO(CompressedRawIO):
+            """Compressed stream with small chunks"""
+            CHUNK_SIZE = 1024
+            chunk_sizes = []
+
+            def _put(self, chunk):
+                """Keep chunks sizes"""
+                self.chunk_sizes.append(len(chunk))
+                CompressedRawIO._put(self, chunk)
+
+        compressed_io = SmallChunksIO(BytesIO(compressed), 'r', compression)
+        assert compressed_io.readall() == content
+        compressed_io.close()
+        if compression != 'zstd':
+            assert max(SmallChunksIO.chunk_sizes) <= SmallChunksIO.CHUNK_SIZE
+
+        # Tests: Close before end of read
+        compressed_io = CompressedRawIO(
+            BytesIO(compressed * 20), 'r', compression)
+        assert compressed_io.read(10) == content[:10]
+        compressed_io.close()
+        assert compressed_io.closed
+
+        # Tests: Truncated stream
+        compressed_io = CompressedRawIO(
+            BytesIO(compressed[:-20]), 'r', compression)
+        with pytest.raises(EOFError):
+            compressed_io.readall()
+        compressed_io.close()
+
+    # Tests: Invalid compressed stream
+    compressed_io = CompressedRawIO(BytesIO(content), 'r', 'gzip')
+    with pytest.raises(Exception):
+        compressed_io.readall()
+    compressed_io.close()
+
+    # Tests: Error on write is raised
+    class FailingIO(BytesIO):
+        """Failing stream"""
+
+        def write(self, *_):
+            """Raise error"""
+            raise OSError()
+
+    compressed_io = CompressedRawIO(FailingIO(), 'w', 'gzip')
+    compressed_io.write(content)
+    with pytest.raises(OSError):
+        compressed_io.close()
+
+    # Tests: Unsupported compression
+    with pytest.raises(ValueError):
+        CompressedRawIO(BytesIO(), 'r', 'unsupported')
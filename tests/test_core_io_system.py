@@ -2,6 +2,7 @@
 """Test pycosio._core.io_system"""
 import time
 import re
+from threading import Lock
 from wsgiref.handlers import format_date_time
 
 import pytest
@@ -104,6 +105,12 @@ def test_system_base():
     assert system.getmtime('path') == m_time
     object_header['Last-Modified'] = format_date_time(m_time)
 
+    # Tests version
+    assert system._getversion_from_header(object_header) == '123456'
+    assert system._getversion_from_header(
+        {'Last-Modified': m_time}) == repr(m_time)
+    assert system._getversion_from_header({}) is None
+
     # Tests relpath
     assert system.relpath('scheme://path') == 'path'
     assert system.relpath('path') == 'path'
@@ -227,3 +234,253 @@ def test_system_base():
         [('dir2/', dict())])
     assert list(system.list_objects(
         path='root://locator/dir1', first_level=True)) == excepted
+
+
+def test_system_base_header_cache():
+    """Tests pycosio._core.io_system.SystemBase headers cache"""
+    from pycosio._core.io_base_system import SystemBase
+    from pycosio._core.header_cache import HeaderCache
+
+    heads = []
+    object_header = {'Content-Length': '100', 'Last-Modified': 0.0}
+
+    class DummySystem(SystemBase):
+        """Dummy System"""
+
+        def get_client_kwargs(self, path):
+            """Returns fake result"""
+            return dict(path=self.relpath(path))
+
+        def _get_client(self):
+            """Returns fake result"""
+
+        def _get_roots(self):
+            """Returns fake result"""
+            return 'root://',
+
+        def _head(self, client_kwargs):
+            """Returns fake result"""
+            heads.append(client_kwargs['path'])
+            return object_header.copy()
+
+        def _header_from_listing(self, header):
+            """Returns fake result"""
+            header['Content-Length'] = header.pop('size')
+            return header
+
+        def _list_objects(self, client_kwargs, *_, **__):
+            """Returns fake result"""
+            for index in range(3):
+                yield 'dir/object%d' % index, dict(size='10')
+            yield 'dir/sub_dir/', dict()
+
+        def _remove(self, client_kwargs):
+            """Do nothing"""
+
+    # Tests no cache by default
+    system = DummySystem()
+    assert system.header_cache is None
+    system.getsize('root://locator/object')
+    system.getsize('root://locator/object')
+    assert len(heads) == 2
+    system.invalidate_header('root://locator/object')
+
+    # Tests cached head
+    del heads[:]
+    system = DummySystem(header_cache=60)
+    assert isinstance(system.header_cache, HeaderCache)
+    assert system.header_cache.ttl == 60
+    assert system.exists('root://locator/object')
+    assert system.getsize('root://locator/object') == 100
+    assert system.getmtime('root://locator/object') == 0.0
+    assert system.isfile('root://locator/object')
+    assert system.stat('root://locator/object').st_size == 100
+    assert heads == ['locator/object']
+
+    # Tests invalidation on remove
+    system.remove('root://locator/object')
+    assert system.getsize('root://locator/object') == 100
+    assert len(heads) == 2
+
+    # Tests invalidation
+    system.invalidate_header('root://locator/object')
+    assert system.getsize('root://locator/object') == 100
+    assert len(heads) == 3
+
+    # Tests cache populated from listing
+    del heads[:]
+    assert len(list(system.list_objects('root://locator/dir/'))) == 4
+    assert system.getsize('root://locator/dir/object1') == 10
+    assert system.getsize('root://locator/dir/object2') == 10
+    assert not heads
+
+    # Tests partial headers from listing are not used by streams and stat
+    assert system.head(
+        'root://locator/dir/object1', partial=False) == object_header
+    assert system.stat('root://locator/dir/object2').st_size == 100
+    assert heads == ['locator/dir/object1', 'locator/dir/object2']
+    assert system.getsize('root://locator/dir/object1') == 100
+    assert len(heads) == 2
+
+    # Tests existing cache
+    header_cache = HeaderCache()
+    system = DummySystem(header_cache=header_cache)
+    assert system.header_cache is header_cache
+
+
+def test_system_base_list_first_level():
+    """Tests pycosio._core.io_system.SystemBase first level listing with
+    storage delimiter"""
+    from pycosio._core.io_base_system import SystemBase
+
+    calls = []
+    object_header = {'Content-Length': '100'}
+
+    class DummySystem(SystemBase):
+        """Dummy System"""
+        _LIST_FIRST_LEVEL = True
+
+        def get_client_kwargs(self, path):
+            """Returns fake result"""
+            return dict(path=path)
+
+        def _get_client(self):
+            """Returns fake result"""
+
+        def _get_roots(self):
+            """Returns fake result"""
+            return 'root://',
+
+        def _head(self, client_kwargs):
+            """Returns fake result"""
+            return object_header.copy()
+
+        def _list_objects(self, client_kwargs, path, max_request_entries,
+                          first_level=False):
+            """Returns fake result"""
+            calls.append((path, first_level))
+            if first_level:
+                yield path, object_header.copy()
+                yield path + 'object1', object_header.copy()
+                yield path + 'object2', object_header.copy()
+                yield path + 'dir2/', dict()
+            else:
+                for obj in ('object1', 'object2', 'dir2/object3'):
+                    yield path + '/' + obj, object_header.copy()
+
+    system = DummySystem()
+    excepted = [('object1', object_header), ('object2', object_header),
+                ('dir2/', dict())]
+
+    # Tests first level listing with delimiter
+    assert list(system.list_objects(
+        'root://locator/dir1', first_level=True)) == excepted
+    assert calls == [('dir1/', True)]
+
+    # Tests full listing
+    del calls[:]
+    assert list(system.list_objects('root://locator/dir1')) == [
+        ('object1', object_header), ('object2', object_header),
+        ('dir2/object3', object_header)]
+    assert calls == [('dir1', False)]
+
+
+def test_system_base_list_parallel():
+    """Tests pycosio._core.io_system.SystemBase parallel listing"""
+    from pycosio._core.io_base_system import SystemBase
+
+    objects = sorted((
+        'dir1/', 'dir1/object1', 'dir1/dir2/object2', 'dir1/dir2/object3',
+        'dir1/dir2/dir3/object4', 'dir1/dir4/object5', 'dir1/object6',
+        'dir1-object7', 'dir10/object8', 'object9'))
+    listed = []
+    listing = []
+    max_listing = [0]
+    lock = Lock()
+
+    class DummySystem(SystemBase):
+        """Dummy System"""
+        _LIST_FIRST_LEVEL = True
+
+        def get_client_kwargs(self, path):
+            """Returns fake result"""
+            return dict(path=path)
+
+        def _get_client(self):
+            """Returns fake result"""
+
+        def _get_roots(self):
+            """Returns fake result"""
+            return 'root://',
+
+        def _head(self, client_kwargs):
+            """Returns fake result"""
+            return dict()
+
+        def _list_objects(self, client_kwargs, path, max_request_entries,
+                          first_level=False):
+            """Returns fake result"""
+            listed.append(path)
+            entries = []
+            for obj in objects:
+                if not obj.startswith(path):
+                    continue
+                elif first_level and '/' in obj[len(path):]:
+                    prefix = path + obj[len(path):].split('/', 1)[0] + '/'
+                    if (prefix, dict()) not in entries:
+                        entries.append((prefix, dict()))
+                else:
+                    entries.append((obj, dict(name=obj)))
+
+            with lock:
+                listing.append(path)
+                max_listing[0] = max(max_listing[0], len(listing))
+            for entry in sorted(entries, key=lambda entry: entry[0]):
+                yield entry
+            with lock:
+                listing.remove(path)
+
+    system = DummySystem()
+
+    # Tests ordered
+    for path in ('', 'dir1', 'dir1/'):
+        del listed[:]
+        excepted = list(system.list_objects('root://locator/' + path))
+        assert listed == [path]
+
+        del listed[:]
+        assert list(system.list_objects(
+            'root://locator/' + path, parallel=True)) == excepted
+        assert len(listed) > 1
+
+    assert [name for name, _ in system.list_objects(
+        'root://locator', parallel=True)] == objects
+
+    # Tests unordered
+    assert sorted(system.list_objects(
+        'root://locator', parallel=True, ordered=False)) == sorted(
+            (obj, dict(name=obj)) for obj in objects)
+
+    # Tests directories listed by batches, with limited concurrency
+    system.LIST_PARALLEL_BATCH_SIZE = 2
+    system.LIST_PARALLEL_MAX_SHARDS = 1
+    max_listing[0] = 0
+    assert sorted(system.list_objects(
+        'root://locator', parallel=True, ordered=False)) == sorted(
+            (obj, dict(name=obj)) for obj in objects)
+    assert max_listing[0] == 1
+    assert [name for name, _ in system.list_objects(
+        'root://locator', parallel=True)] == objects
+    del system.LIST_PARALLEL_BATCH_SIZE
+    del system.LIST_PARALLEL_MAX_SHARDS
+
+    # Tests early stop
+    assert len(list(system.list_objects(
+        'root://locator', parallel=True, max_request_entries=3))) == 3
+
+    # Tests ignored without delimiter support
+    DummySystem._LIST_FIRST_LEVEL = False
+    del listed[:]
+    assert [name for name, _ in system.list_objects(
+        'root://locator', parallel=True)] == objects
+    assert listed == ['']
@@ -0,0 +1,105 @@
+# coding=utf-8
+"""Test pycosio._core.memory"""
+
+
+def test_memory_budget():
+    """Tests pycosio._core.memory.MemoryBudget"""
+    from os import environ
+    from threading import Thread
+    import time
+    from pycosio._core.memory import MemoryBudget, ENV_MEMORY_BUDGET
+
+    # Tests size
+    assert MemoryBudget(10).size == 10
+
+    environ[ENV_MEMORY_BUDGET] = '20'
+    try:
+        assert MemoryBudget().size == 20
+    finally:
+        del environ[ENV_MEMORY_BUDGET]
+    assert MemoryBudget().size == 0
+
+    # Tests no limit
+    budget = MemoryBudget(0)
+    assert budget.acquire(1000, blocking=False)
+    assert budget.used == 1000
+    budget.release(1000)
+    assert budget.used == 0
+
+    # Tests non-blocking acquire
+    budget = MemoryBudget(10)
+    assert budget.acquire(6, blocking=False)
+    assert not budget.acquire(6, blocking=False)
+    assert budget.acquire(4, blocking=False)
+    assert budget.used == 10
+
+    # Tests reserve over budget
+    budget.reserve(5)
+    assert budget.used == 15
+    budget.release(9)
+    assert budget.used == 6
+
+    # Tests blocking acquire waiting for release
+    def release():
+        """Release memory later"""
+        time.sleep(0.05)
+        budget.release(6)
+
+    thread = Thread(target=release)
+    thread.start()
+    assert budget.acquire(8)
+    thread.join()
+    assert budget.used == 8
+
+    # Tests blocking acquire stop waiting
+    assert budget.acquire(8, wait_while=lambda: False)
+    assert budget.used == 16
+
+    # Tests resize
+    budget.set_size(100)
+    assert budget.acquire(8, blocking=False)
+
+
+def test_buffer_pool():
+    """Tests pycosio._core.memory.BufferPool"""
+    from os import environ
+    from pycosio._core.memory import BufferPool, ENV_BUFFER_POOL_SIZE
+
+    # Tests size
+    assert BufferPool(10).size == 10
+    assert BufferPool().size == BufferPool.DEFAULT_SIZE
+
+    environ[ENV_BUFFER_POOL_SIZE] = '20'
+    try:
+        assert BufferPool().size == 20
+    finally:
+        del environ[ENV_BUFFER_POOL_SIZE]
+
+    # Tests new buffer if pool is empty
+    pool = BufferPool(25)
+    buffer = pool.get(10)
+    assert buffer == bytearray(10)
+
+    # Tests buffer reuse
+    buffer[:] = 10 * b'1'
+    pool.put(buffer)
+    assert pool.free_size == 10
+    assert pool.get(10) is buffer
+    assert pool.free_size == 0
+
+    # Tests buffer reuse only with same size
+    pool.put(buffer)
+    assert pool.get(5) is not buffer
+    assert pool.free_size == 10
+
+    # Tests buffer discarded if pool is full
+    pool.put(bytearray(10))
+    pool.put(bytearray(10))
+    assert pool.free_size == 20
+
+    # Tests resize
+    pool.set_size(10)
+    assert pool.free_size == 0
+    pool.set_size(0)
+    pool.put(buffer)
+    assert pool.free_size == 0
@@ -0,0 +1,113 @@
+# coding=utf-8
+"""Test pycosio._core.retry"""
+import time
+
+import pytest
+
+
+def test_retry_policy():
+    """Tests pycosio._core.retry.RetryPolicy"""
+    from threading import Event
+    from pycosio._core.exceptions import ObjectNotFoundError
+    from pycosio._core.retry import (
+        RetryPolicy, is_transient_error, TRANSIENT_ERRORS)
+
+    # Tests transient errors
+    transient_error = TRANSIENT_ERRORS[0]
+    for error in TRANSIENT_ERRORS:
+        assert is_transient_error(error())
+    assert not is_transient_error(ValueError())
+    assert not is_transient_error(ObjectNotFoundError())
+
+    # Tests retries on transient errors
+    calls = []
+
+    def function(value, errors=2, error=transient_error):
+        """Fail a number of times"""
+        calls.append(value)
+        if len(calls) <= errors:
+            raise error()
+        return value
+
+    policy = RetryPolicy(backoff=0.001)
+    assert policy.max_attempts == RetryPolicy.DEFAULT_MAX_ATTEMPTS
+    assert policy.hedge_percentile is None
+    assert policy.call(is_transient_error, function, 1) == 1
+    assert len(calls) == 3
+
+    # Tests maximum attempts
+    del calls[:]
+    policy = RetryPolicy(max_attempts=2, backoff=0.001)
+    with pytest.raises(transient_error):
+        policy.call(is_transient_error, function, 1)
+    assert len(calls) == 2
+
+    # Tests non transient errors are not retried
+    del calls[:]
+    with pytest.raises(ValueError):
+        policy.call(is_transient_error, function, 1, error=ValueError)
+    assert len(calls) == 1
+
+    # Tests backoff
+    policy = RetryPolicy(backoff=1, max_backoff=3)
+    for attempt in range(1, 10):
+        assert 0 <= policy._get_backoff(attempt) <= min(3, 2 ** (attempt - 1))
+
+    # Tests no hedging without enough measures
+    policy = RetryPolicy(hedge_percentile=90)
+    assert policy._get_hedge_threshold() is None
+    del calls[:]
+    assert policy.call_hedged(
+        is_transient_error, function, 1, errors=0) == 1
+    assert len(calls) == 1
+    for _ in range(RetryPolicy.HEDGE_MIN_SAMPLES):
+        policy.call(is_transient_error, lambda: None)
+    assert policy._get_hedge_threshold() is not None
+
+    # Tests slow read is hedged and first result is used
+    policy = RetryPolicy(hedge_percentile=50)
+    policy._latencies.extend([0.01] * RetryPolicy.HEDGE_MIN_SAMPLES)
+    assert policy._get_hedge_threshold() == 0.01
+    release = Event()
+    slow_calls = []
+
+    def slow_function():
+        """First call is slow"""
+        slow_calls.append(None)
+        if len(slow_calls) == 1:
+            release.wait(5)
+            return 'slow'
+        return 'fast'
+
+    start = time.time()
+    assert policy.call_hedged(is_transient_error, slow_function) == 'fast'
+    assert time.time() - start < 5
+    assert len(slow_calls) == 2
+    release.set()
+
+    # Tests hedged read error fallbacks to other request
+    release.clear()
+    del slow_calls[:]
+
+    def failing_function():
+        """First call is slow, second call fails"""
+        slow_calls.append(None)
+        if len(slow_calls) == 1:
+            release.wait(0.2)
+            return 'slow'
+        raise ValueError()
+
+    assert policy.call_hedged(is_transient_error, failing_function) == 'slow'
+
+    # Tests hedged read raises if all requests fail
+    del slow_calls[:]
+
+    def failing_all():
+        """All calls fail"""
+        slow_calls.append(None)
+        if len(slow_calls) == 1:
+            time.sleep(0.1)
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        policy.call_hedged(is_transient_error, failing_all)
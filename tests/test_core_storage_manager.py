@@ -5,7 +5,7 @@ import re
 import pytest
 
 
-def test_mount():
+def test_mount(tmpdir):
     """Tests pycosio._core.storage_manager.mount and get_instance"""
     from pycosio._core.storage_manager import (
         mount, MOUNTED, get_instance, _compare_root)
@@ -143,6 +143,49 @@ def test_mount():
         with pytest.raises(ValueError):
             mount(name='path')
 
+        # Tests process-wide memory budget
+        from pycosio._core.memory import MEMORY_BUDGET
+        mount(storage='http', memory_budget=1000)
+        assert MEMORY_BUDGET.size == 1000
+        MEMORY_BUDGET.set_size(None)
+        for root in roots:
+            del MOUNTED[root]
+
+        # Tests default disk cache
+        from pycosio._core.disk_cache import DiskCache
+        disk_cache = str(tmpdir.join('cache'))
+        mount(storage='http', disk_cache=disk_cache)
+        assert isinstance(MOUNTED[roots[0]]['disk_cache'], DiskCache)
+        assert MOUNTED[roots[0]]['disk_cache'].path == disk_cache
+        for root in roots:
+            del MOUNTED[root]
+
+        # Tests default tuner
+        from pycosio._core.tuning import AutoTuner
+        mount(storage='http', tuner=True)
+        tuner = MOUNTED[roots[0]]['tuner']
+        assert isinstance(tuner, AutoTuner)
+        assert tuner.path is None
+        with get_instance(roots[0] + 'path', cls='buffered') as buffered:
+            assert buffered._tuner is tuner
+        for root in roots:
+            del MOUNTED[root]
+
+        tuner_path = str(tmpdir.join('tuner.json'))
+        mount(storage='http', tuner=tuner_path)
+        assert MOUNTED[roots[0]]['tuner'].path == tuner_path
+        for root in roots:
+            del MOUNTED[root]
+
+        # Tests headers cache
+        from pycosio._core.header_cache import HeaderCache
+        mount(storage='http', header_cache=30)
+        header_cache = MOUNTED[roots[0]]['system_cached'].header_cache
+        assert isinstance(header_cache, HeaderCache)
+        assert header_cache.ttl == 30
+        for root in roots:
+            del MOUNTED[root]
+
     # Restore mocked functions
     finally:
         requests.Session = requests_session
@@ -0,0 +1,103 @@
+# coding=utf-8
+"""Test pycosio._core.tuning"""
+
+
+def test_auto_tuner(tmpdir):
+    """Tests pycosio._core.tuning.AutoTuner"""
+    from pycosio._core.tuning import AutoTuner
+
+    # Tests default values
+    tuner = AutoTuner(max_workers=16)
+    assert tuner.latency is None
+    assert tuner.bandwidth is None
+    assert tuner.max_workers == AutoTuner.INITIAL_WORKERS
+    assert tuner.buffer_size(default=1000) == 1000
+    assert tuner.buffer_size(minimum=10) == 10
+
+    # Tests latency and bandwidth estimation
+    # Requests with 0.05s latency and 100MB/s bandwidth
+    latency = 0.05
+    bandwidth = 100000000
+    start = 0.0
+    for index in range(100):
+        size = 1000000 * (1 + index % 4)
+        end = start + latency + size / bandwidth
+        tuner.record(size, start, end)
+        start = end
+    assert abs(tuner.latency - latency) < 1e-3
+    assert abs(tuner.bandwidth - bandwidth) / bandwidth < 0.01
+
+    # Tests buffer size: Latency is 20% of requests duration
+    assert tuner.buffer_size() == 33554432
+    assert tuner.buffer_size(maximum=5000000) == 5000000
+    assert tuner.buffer_size(minimum=50000000) == 50000000
+
+    # Tests similar requests sizes keep latency estimation
+    tuner = AutoTuner()
+    tuner.update(dict(latency=latency, bandwidth=bandwidth))
+    for _ in range(100):
+        end = start + latency + 2000000 / (bandwidth / 2)
+        tuner.record(2000000, start, end)
+        start = end
+    assert abs(tuner.latency - latency) < 1e-3
+    assert abs(tuner.bandwidth - bandwidth / 2) / bandwidth < 0.01
+
+    # Tests invalid measures are ignored
+    tuner.record(0, start, start + 1)
+    tuner.record(1000, start, start)
+
+    # Tests concurrency: Throughput increases up to 8 concurrent requests
+    tuner = AutoTuner(max_workers=64)
+
+    def run_window():
+        """Simulate concurrent requests during a window"""
+        workers = tuner.max_workers
+        window_start = run_window.time
+        duration = 1.0 * workers / min(workers, 8)
+        count = max(AutoTuner.WINDOW_SIZE, 2 * workers)
+        for index in range(count):
+            request_start = window_start + (index // workers) * duration
+            tuner.record(1000, request_start, request_start + duration)
+        run_window.time = window_start + (
+            count // workers + 1) * duration
+
+    run_window.time = 0.0
+    for _ in range(3):
+        run_window()
+    assert tuner.max_workers == 8
+    for _ in range(AutoTuner.STABLE_WINDOWS - 1):
+        run_window()
+        assert tuner.max_workers == 8
+
+    # Tests stable concurrency is periodically retried higher
+    run_window()
+    assert tuner.max_workers == 16
+    run_window()
+    assert tuner.max_workers == 8
+
+    # Tests concurrency limit
+    tuner = AutoTuner(max_workers=6)
+    run_window.time = 0.0
+    for _ in range(3):
+        run_window()
+    assert tuner.max_workers == 6
+
+    # Tests persistence
+    path = str(tmpdir.join('tuner.json'))
+    tuner = AutoTuner(path)
+    assert tuner.path == path
+    tuner.update(dict(latency=0.1, bandwidth=1000000, workers=12))
+    tuner.checkpoint()
+    assert not tmpdir.join('tuner.json').check()
+    tuner.save()
+
+    tuner = AutoTuner(path)
+    assert tuner.latency == 0.1
+    assert tuner.bandwidth == 1000000
+    assert tuner.max_workers == 12
+    assert tuner.to_dict()['workers'] == 12
+
+    # Tests invalid persisted state is ignored
+    tmpdir.join('tuner.json').write('invalid')
+    assert AutoTuner(path).latency is None
+    AutoTuner().save()
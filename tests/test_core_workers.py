@@ -0,0 +1,136 @@
+# coding=utf-8
+"""Test pycosio._core.workers"""
+import pytest
+
+
+def test_shared_pool_executor():
+    """Tests pycosio._core.workers.SharedPoolExecutor"""
+    from os import environ
+    from threading import Event, Lock, current_thread
+    from pycosio._core.workers import (
+        SharedWorkerPool, SharedPoolExecutor, ENV_MAX_WORKERS)
+
+    # Tests pool size
+    pool = SharedWorkerPool(max_workers=4)
+    assert pool.max_workers == 4
+
+    environ[ENV_MAX_WORKERS] = '3'
+    try:
+        assert SharedWorkerPool().max_workers == 3
+    finally:
+        del environ[ENV_MAX_WORKERS]
+    assert SharedWorkerPool().max_workers > 0
+
+    # Tests concurrency limit
+    lock = Lock()
+    running = [0]
+    max_running = [0]
+    release = Event()
+    above_limit = Event()
+
+    def task(value):
+        """Track concurrent tasks"""
+        with lock:
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+            if running[0] > 2:
+                above_limit.set()
+        release.wait(5)
+        with lock:
+            running[0] -= 1
+        return value
+
+    executor = SharedPoolExecutor(max_workers=2, pool=pool)
+    futures = [executor.submit(task, index) for index in range(10)]
+    release.set()
+    assert [future.result() for future in futures] == list(range(10))
+    assert max_running[0] <= 2
+    assert not executor._pending
+    assert not executor._futures
+
+    # Tests concurrency limit change
+    release.clear()
+    max_running[0] = 0
+    futures = [executor.submit(task, index) for index in range(6)]
+    assert executor.max_workers == 2
+    executor.set_max_workers(4)
+    assert executor.max_workers == 4
+    assert len(executor._pending) == 2
+
+    # Wait pending tasks start
+    assert above_limit.wait(5)
+    release.set()
+    assert [future.result() for future in futures] == list(range(6))
+    assert 2 < max_running[0] <= 4
+
+    # Tests threads are shared between executors
+    other_executor = SharedPoolExecutor(pool=pool)
+    assert other_executor.submit(task, 1).result() == 1
+    assert pool._executor._max_workers == 4
+
+    # Tests exceptions
+    def raise_error():
+        """Raise error"""
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        executor.submit(raise_error).result()
+
+    # Tests nested tasks run on nested pool, without waiting executor slots
+    def nested_task():
+        """Submit a task to an executor full of tasks"""
+        return executor.submit(task, 'nested').result(timeout=5)
+
+    executor = SharedPoolExecutor(max_workers=1, pool=pool)
+    assert executor.submit(nested_task).result() == 'nested'
+    assert pool._nested._executor is not None
+
+    # Tests nested tasks run in parallel
+    barrier_lock = Lock()
+    barrier_count = [0]
+    barrier = Event()
+
+    def wait_other():
+        """Wait until two tasks are running"""
+        with barrier_lock:
+            barrier_count[0] += 1
+            if barrier_count[0] == 2:
+                barrier.set()
+        return barrier.wait(5)
+
+    def parallel_nested_tasks():
+        """Submit nested tasks that wait each others"""
+        futures = [executor.submit(wait_other) for _ in range(2)]
+        return [future.result() for future in futures]
+
+    assert executor.submit(parallel_nested_tasks).result() == [True, True]
+
+    # Tests tasks nested in nested tasks run in caller thread
+    def thread_id():
+        """Returns current thread ID"""
+        return current_thread().ident
+
+    def nested_thread_ids():
+        """Returns current thread ID and nested task thread ID"""
+        return thread_id(), executor.submit(thread_id).result()
+
+    def nested_nested_thread_ids():
+        """Returns nested task thread IDs"""
+        return executor.submit(nested_thread_ids).result()
+
+    caller_id, nested_id = executor.submit(nested_nested_thread_ids).result()
+    assert caller_id == nested_id
+
+    # Tests pool resize
+    pool.set_max_workers(2)
+    assert pool._executor is None
+    assert executor.submit(task, 2).result() == 2
+    assert pool._executor._max_workers == 2
+
+    # Tests shutdown
+    executor.shutdown()
+    with pytest.raises(RuntimeError):
+        executor.submit(task, 3)
+
+    pool.shutdown()
+    assert pool._executor is None
@@ -0,0 +1,29 @@
+# coding=utf-8
+"""Test pycosio._core.write_spool"""
+
+
+def test_write_spool():
+    """Tests pycosio._core.write_spool.WriteSpool"""
+    from pycosio._core.write_spool import WriteSpool
+
+    # Tests empty spool
+    spool = WriteSpool()
+    assert not spool
+    assert len(spool) == 0
+    assert spool.getbuffer().tobytes() == b''
+
+    # Tests write with "bytearray" like slices
+    spool = WriteSpool(b'0123456789')
+    assert spool
+    assert len(spool) == 10
+    spool[2:4] = b'ab'
+    spool[10:15] = b'cdefg'
+    spool[20:22] = b'hi'
+    assert len(spool) == 17
+    assert spool.getbuffer().tobytes() == b'01ab456789cdefghi'
+
+    # Tests replace full content
+    spool[:] = b'jkl'
+    assert len(spool) == 3
+    assert spool.getbuffer().tobytes() == b'jkl'
+    spool.close()
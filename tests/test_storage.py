@@ -136,6 +136,7 @@ class StorageTester:
         """
         from os import SEEK_END, SEEK_CUR
         from pycosio._core.compat import file_exits_error
+        from pycosio.io import ObjectRawIOBase
 
         size = 100
         file_name = 'raw_file0.dat'
@@ -160,6 +161,10 @@ class StorageTester:
                 except AttributeError:
                     max_flush_size = 0
 
+                # Write buffer spooled on disk and uploaded by parts
+                file.WRITE_SPOOL_SIZE = 16
+                file.MULTIPART_UPLOAD_SIZE = 32
+
                 # Test: Write blocs of data
                 assert file.write(content[:10]) == 10, \
                     'Raw write, written size match'
@@ -171,6 +176,8 @@ class StorageTester:
                         'Raw write, written size match'
                 assert file.write(content[20:]) == 80, \
                     'Raw write, written size match'
+                assert len(file._write_buffer) == size and not isinstance(
+                    file._write_buffer, bytearray), 'Raw write, buffer spooled'
 
                 # Test: tell
                 if is_seekable:
@@ -285,6 +292,61 @@ class StorageTester:
             assert file.tell() == size,\
                 'Raw seek from end & read into, tell match'
 
+            # Test: read ranges
+            if isinstance(file, ObjectRawIOBase):
+                ranges = ((60, 10), (0, 10), (15, 5), (95, 20), (200, 10))
+                assert [bytes(data) for data in file.read_ranges(
+                    ranges, max_gap=10)] == [
+                        content[60:70], content[:10], content[15:20],
+                        content[95:], b''], 'Raw read ranges, content match'
+                assert file.tell() == size, 'Raw read ranges, tell match'
+
+                # Test: read all and read into by parts read in parallel
+                file.PARALLEL_READ_SIZE = 16
+                file.seek(10)
+                data = file.readall()
+                assert data == content[10:], \
+                    'Raw parallel read all, content match'
+                assert isinstance(data, bytes), \
+                    'Raw parallel read all, bytes returned'
+                assert file.tell() == size, 'Raw parallel read all, tell match'
+
+                file.seek(5)
+                buffer = bytearray(200)
+                assert file.readinto(buffer) == size - 5, \
+                    'Raw parallel read into, returned size match'
+                assert bytes(buffer[:size - 5]) == content[5:], \
+                    'Raw parallel read into, content match'
+                del file.PARALLEL_READ_SIZE
+
+                # Test: memory map
+                from pycosio._core.io_mmap import ObjectMemoryMap
+                with ObjectMemoryMap(file, page_size=16,
+                                     close_raw=False) as memory_map:
+                    assert len(memory_map) == size, 'Memory map, size match'
+                    assert memory_map[10:40] == content[10:40], \
+                        'Memory map, slice match'
+                    assert memory_map[-1] == content[-1], \
+                        'Memory map, index match'
+                    assert len(memory_map._cache) == 4, \
+                        'Memory map, only accessed pages read'
+                    assert memory_map[90:5:-3] == content[90:5:-3], \
+                        'Memory map, step slice match'
+                    memory_map.seek(-30, SEEK_END)
+                    assert memory_map.read() == content[-30:], \
+                        'Memory map, read from end match'
+                    assert memory_map.find(content[30:50], 0) == content.find(
+                        content[30:50]), 'Memory map, find match'
+                    assert memory_map.rfind(content[30:50], 0) == \
+                        content.rfind(content[30:50]), \
+                        'Memory map, rfind match'
+                assert not file.closed, 'Memory map, raw not closed'
+
+                # Test: memory map, pages keyed by object version
+                assert memory_map._cache_key(0)[1] == \
+                    file._system._getversion_from_header(file._head()), \
+                    'Memory map, version in page key'
+
         # Test: Append mode
         if self._is_supported('write'):
             # Test: Appending on existing file
@@ -454,6 +516,29 @@ class StorageTester:
             assert file.tell() == 10, \
                 'Buffered read, peek tell match'
 
+            # Test: read into buffer larger than buffer size
+            buffer = bytearray(3 * buffer_size)
+            assert file.readinto(buffer) == len(buffer), \
+                'Buffered read into, returned size match'
+            assert bytes(buffer) == content[10:10 + len(buffer)], \
+                'Buffered read into, content match'
+
+            # Test: read ranges
+            if isinstance(file, ObjectBufferedIOBase):
+                ranges = ((buffer_size + 10, 100), (5, 10), (size - 5, 10))
+                assert [bytes(data) for data in file.read_ranges(ranges)] == [
+                    content[buffer_size + 10:buffer_size + 110],
+                    content[5:15], content[size - 5:]], \
+                    'Buffered read ranges, content match'
+
+            # Test: read into buffer over EOF
+            file.seek(buffer_size - 10)
+            buffer = bytearray(5 * buffer_size)
+            assert file.readinto(buffer) == size - buffer_size + 10, \
+                'Buffered read into over EOF, returned size match'
+            assert bytes(buffer[:size - buffer_size + 10]) == content[
+                buffer_size - 10:], 'Buffered read into over EOF, content match'
+
             # Test: Cannot write in read mode
             with _pytest.raises(_UnsupportedOperation):
                 file.write(b'0')
@@ -464,6 +549,67 @@ class StorageTester:
             # Check if pycosio subclass
             is_pycosio_subclass = isinstance(file, ObjectBufferedIOBase)
 
+        # Test: Append mode
+        if self._is_supported('write') and is_pycosio_subclass:
+            file_name = 'buffered_file2.dat'
+            file_path = self.base_dir_path + file_name
+            self._to_clean(file_path)
+
+            # Test: Appending on not existing file
+            with self._buffered_io(file_path, 'ab', buffer_size=buffer_size,
+                                   **self._system_parameters) as file:
+                # Existing content large enough to be reused as parts
+                append_buffer_size = file._buffer_size
+                content = _urandom(int(2.5 * append_buffer_size))
+                file.write(content)
+
+            with self._buffered_io(file_path, 'rb', buffer_size=buffer_size,
+                                   **self._system_parameters) as file:
+                assert file.read() == content, \
+                    'Buffered append, file create content match'
+
+            # Test: Appending more than a buffer on existing file
+            appended = _urandom(append_buffer_size + 10)
+            with self._buffered_io(file_path, 'ab', buffer_size=buffer_size,
+                                   **self._system_parameters) as file:
+                file.write(appended)
+            content += appended
+
+            with self._buffered_io(file_path, 'rb', buffer_size=buffer_size,
+                                   **self._system_parameters) as file:
+                assert file.read() == content, \
+                    'Buffered append, large append content match'
+
+            # Test: Appending less than a buffer on existing file
+            with self._buffered_io(file_path, 'ab', buffer_size=buffer_size,
+                                   **self._system_parameters) as file:
+                file.write(b'end')
+            content += b'end'
+
+            # Test: Appending nothing on existing file
+            with self._buffered_io(file_path, 'ab', buffer_size=buffer_size,
+                                   **self._system_parameters):
+                pass
+
+            with self._buffered_io(file_path, 'rb', buffer_size=buffer_size,
+                                   **self._system_parameters) as file:
+                assert file.read() == content, \
+                    'Buffered append, small append content match'
+
+        # Test: Streaming read
+        if is_pycosio_subclass:
+            with self._buffered_io(file_path, 'rb', buffer_size=buffer_size,
+                                   streaming=True,
+                                   **self._system_parameters) as file:
+                assert file.read() == content, \
+                    'Buffered streaming read, content match'
+
+                file.seek(10)
+                for start in range(10, len(content), buffer_size):
+                    assert file.read(buffer_size) == content[
+                        start:start + buffer_size], \
+                        'Buffered streaming read, sequential content match'
+
         # Test: Buffer limits and default values
         if is_pycosio_subclass:
             with self._buffered_io(
@@ -606,6 +752,12 @@ class StorageTester:
                 assert len(tuple(system.list_objects(dir_path0))) == 0, \
                     'List objects, empty directory'
 
+                # Test: Listing first level only
+                assert {dir_name0, dir_name1 + '/'}.issubset(
+                    name for name, _ in system.list_objects(
+                        self.base_dir_path, first_level=True)), \
+                    'List objects, first level'
+
         # Write a sample file
         file_name = 'sample_1K.dat'
         file_path = self.base_dir_path + file_name
@@ -705,6 +857,15 @@ class StorageTester:
                 assert hasattr(header, '__getitem__'),\
                     'List objects, file header is mapping'
 
+            # Test: List objects in parallel
+            names = [name for name, _ in objects]
+            assert [name for name, _ in system.list_objects(
+                self.locator, parallel=True)] == names, \
+                'List objects in parallel, ordered names match'
+            assert sorted(name for name, _ in system.list_objects(
+                self.locator, parallel=True, ordered=False)) == sorted(
+                names), 'List objects in parallel, unordered names match'
+
             # Test: List objects, with limited output
             max_request_entries = 5
             entries = len(tuple(system.list_objects(
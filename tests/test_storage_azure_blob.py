@@ -14,7 +14,7 @@ def test_mocked_storage():
     """Tests pycosio.azure_file with a mock"""
     from azure.storage.blob.models import (
         BlobProperties, ContainerProperties, Blob, Container, BlobBlockList,
-        _BlobTypes)
+        BlobPrefix, _BlobTypes)
 
     import pycosio.storage.azure_blob as azure_blob
     from pycosio.storage.azure_blob import (
@@ -77,12 +77,14 @@ def test_mocked_storage():
             return containers
 
         @staticmethod
-        def list_blobs(container_name=None, prefix=None, num_results=None, **_):
+        def list_blobs(container_name=None, prefix=None, num_results=None,
+                       delimiter=None, **_):
             """azure.storage.blob.baseblobservice.BaseBlobService.list_blobs"""
             blobs = []
-            for blob_name in storage_mock.get_locator(
-                    container_name, prefix=prefix, limit=num_results,
-                    raise_404_if_empty=False):
+            blob_names, prefixes = storage_mock.get_locator_delimited(
+                container_name, prefix=prefix, limit=num_results,
+                delimiter=delimiter)
+            for blob_name in blob_names:
                 props = BlobProperties()
                 props.last_modified = storage_mock.get_object_mtime(
                     container_name, blob_name)
@@ -91,6 +93,13 @@ def test_mocked_storage():
                 props.blob_type = storage_mock.head_object(
                     container_name, blob_name)['blob_type']
                 blobs.append(Blob(props=props, name=blob_name))
+            for blob_prefix in prefixes:
+                sub_directory = BlobPrefix()
+                sub_directory.name = blob_prefix
+                blobs.append(sub_directory)
+
+            # Sub directories are listed in lexicographic order with blobs
+            blobs.sort(key=lambda blob: blob.name)
             return blobs
 
         @staticmethod
@@ -181,6 +190,8 @@ def test_mocked_storage():
                 container_name, blob_name, content=page,
                 data_range=(start_range, end_range))
 
+    committed_blocks = dict()
+
     class BlockBlobService(BlobService):
         """azure.storage.blob.blockblobservice.BlockBlobService"""
         BLOB_TYPE = _BlobTypes.BlockBlob
@@ -192,6 +203,7 @@ def test_mocked_storage():
             storage_mock.put_object(
                 container_name, blob_name, blob, headers=dict(
                     blob_type=self.BLOB_TYPE), new_file=True)
+            committed_blocks.pop((container_name, blob_name), None)
 
         @staticmethod
         def put_block(container_name=None, blob_name=None, block=None,
@@ -209,12 +221,18 @@ def test_mocked_storage():
             for block in block_list:
                 blocks.append('%s.%s' % (blob_name, block.id))
             storage_mock.concat_objects(container_name, blob_name, blocks)
+            committed_blocks[(container_name, blob_name)] = block_list
 
         @staticmethod
-        def get_block_list(**_):
+        def get_block_list(container_name=None, blob_name=None, **_):
             """azure.storage.blob.blockblobservice.BlockBlobService.
             get_block_list"""
-            return BlobBlockList()
+            block_list = BlobBlockList()
+            for block in committed_blocks.get((container_name, blob_name), ()):
+                block.size = storage_mock.get_object_size(
+                    container_name, '%s.%s' % (blob_name, block.id))
+                block_list.committed_blocks.append(block)
+            return block_list
 
     class AppendBlobService(BlobService):
         """azure.storage.blob.appendblobservice.AppendBlobService."""
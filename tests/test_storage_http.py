@@ -1,5 +1,7 @@
 # coding=utf-8
 """Test pycosio.storage.http"""
+from io import BytesIO
+
 import pytest
 
 UNSUPPORTED_OPERATIONS = (
@@ -53,6 +55,15 @@ def test_handle_http_errors():
     _handle_http_errors(response)
     assert response.raised
 
+    # Transient errors
+    from requests import ConnectionError, HTTPError
+    from pycosio.storage.http import HTTPRawIO
+    assert HTTPRawIO._is_transient_error(HTTPError(response=response))
+    response.status_code = 416
+    assert not HTTPRawIO._is_transient_error(HTTPError(response=response))
+    assert HTTPRawIO._is_transient_error(ConnectionError())
+    assert not HTTPRawIO._is_transient_error(ObjectNotFoundError())
+
 
 def test_mocked_storage():
     """Tests pycosio.http with a mock"""
@@ -103,6 +114,9 @@ def test_mocked_storage():
             if self.status_code >= 300:
                 raise HTTPError(self.reason, response=self)
 
+        def close(self):
+            """Do nothing"""
+
     class Session:
         """Fake Session"""
 
@@ -127,8 +141,9 @@ def test_mocked_storage():
                     return Response(
                         headers=storage_mock.head_object(locator, path))
                 elif method == 'GET':
-                    return Response(content=storage_mock.get_object(
-                        locator, path, header=headers))
+                    content = storage_mock.get_object(
+                        locator, path, header=headers)
+                    return Response(content=content, raw=BytesIO(content))
                 else:
                     raise ValueError('Unknown method: ' + method)
 
@@ -32,6 +32,12 @@ def test_handle_oss_error():
         with _handle_oss_error():
             raise OssError(403, **kwargs)
 
+    # Transient errors
+    from pycosio.storage.oss import OSSRawIO
+    assert not OSSRawIO._is_transient_error(OssError(416, **kwargs))
+    assert OSSRawIO._is_transient_error(OssError(503, **kwargs))
+    assert OSSRawIO._is_transient_error(OssError(-2, **kwargs))
+
 
 def test_mocked_storage():
     """Tests pycosio.oss with a mock"""
@@ -61,6 +67,9 @@ def test_mocked_storage():
         raise OssError(500, headers={}, body=None, details={'Message': ''})
 
     storage_mock = ObjectStorageMock(raise_404, raise_416, raise_500)
+    upload_errors = []
+    aborted = []
+    contents_md5 = []
 
     class Auth:
         """oss2.Auth/oss2.StsAuth/oss2.AnonymousAuth"""
@@ -106,8 +115,10 @@ def test_mocked_storage():
             return HeadObjectResult(Response(
                 headers=storage_mock.head_object(self._bucket_name, key)))
 
-        def put_object(self, key=None, data=None, **_):
+        def put_object(self, key=None, data=None, headers=None, **_):
             """oss2.Bucket.put_object"""
+            if headers and 'Content-MD5' in headers:
+                contents_md5.append(headers['Content-MD5'])
             storage_mock.put_object(self._bucket_name, key, data, new_file=True)
 
         def delete_object(self, key=None, **_):
@@ -134,18 +145,25 @@ def test_mocked_storage():
             """oss2.Bucket.delete_bucket"""
             storage_mock.delete_locator(self._bucket_name)
 
-        def list_objects(self, prefix=None, max_keys=None, **_):
+        def list_objects(self, prefix=None, max_keys=None, delimiter=None,
+                         **_):
             """oss2.Bucket.list_objects"""
-            response = storage_mock.get_locator(
+            response, prefix_list = storage_mock.get_locator_delimited(
                 self._bucket_name, prefix=prefix, limit=max_keys,
-                raise_404_if_empty=False)
+                delimiter=delimiter)
             object_list = []
             for key, headers in response.items():
                 obj = HeadObjectResult(Response(headers=headers))
                 obj.key = key
                 object_list.append(obj)
 
-            return ListResult(object_list=object_list)
+            return ListResult(
+                object_list=object_list, prefix_list=prefix_list)
+
+        @staticmethod
+        def abort_multipart_upload(key=None, upload_id=None, **_):
+            """oss2.Bucket.abort_multipart_upload"""
+            aborted.append(upload_id)
 
         @staticmethod
         def init_multipart_upload(*_, **__):
@@ -160,10 +178,26 @@ def test_mocked_storage():
                 key + str(part.part_number) for part in parts
             ])
 
+        def upload_part_copy(
+                self, source_bucket_name=None, source_key=None,
+                byte_range=None, target_key=None, target_upload_id=None,
+                target_part_number=None, **_):
+            """oss2.Bucket.upload_part_copy"""
+            assert target_upload_id == '123'
+            return HeadObjectResult(Response(headers=storage_mock.put_object(
+                self._bucket_name, target_key + str(target_part_number),
+                storage_mock.get_object(
+                    source_bucket_name, source_key, header=dict(
+                        Range='bytes=%d-%d' % byte_range)))))
+
         def upload_part(self, key=None, upload_id=None,
-                        part_number=None, data=None, **_):
+                        part_number=None, data=None, headers=None, **_):
             """oss2.Bucket.upload_part"""
             assert upload_id == '123'
+            if upload_errors:
+                raise upload_errors.pop()
+            if headers and 'Content-MD5' in headers:
+                contents_md5.append(headers['Content-MD5'])
             return HeadObjectResult(Response(headers=storage_mock.put_object(
                 self._bucket_name, key + str(part_number), data)))
 
@@ -212,6 +246,35 @@ def test_mocked_storage():
             # Common tests
             tester.test_common()
 
+            # Test: Multipart upload aborted on any error
+            file = OSSRawIO(tester.base_dir_path + 'file_abort.dat', 'wb',
+                            **system_parameters)
+            file.MULTIPART_UPLOAD_SIZE = 32
+            file.write(b'0' * 100)
+            upload_errors.append(ValueError())
+            with pytest.raises(OSError):
+                file.flush()
+            assert aborted == ['123']
+            file.close()
+
+            # Test: Raw uploads are uploaded with checksums
+            from pycosio._core.checksum import content_md5
+            del contents_md5[:]
+            file_path = tester.base_dir_path + 'file_checksum.dat'
+            with OSSRawIO(file_path, 'wb', checksum=True,
+                          **system_parameters) as file:
+                file.write(b'0' * 10)
+            assert contents_md5 == [content_md5(b''), content_md5(b'0' * 10)]
+
+            del contents_md5[:]
+            with OSSRawIO(file_path, 'wb', checksum=True,
+                          **system_parameters) as file:
+                file.MULTIPART_UPLOAD_SIZE = 32
+                file.write(b'0' * 40)
+            assert sorted(contents_md5) == sorted([
+                content_md5(b''), content_md5(b'0' * 32),
+                content_md5(b'0' * 8)])
+
             # Test: Missing endpoint
             with pytest.raises(ValueError):
                 _OSSSystem()
@@ -236,3 +299,45 @@ def test_mocked_storage():
         oss2.AnonymousAuth = oss2_anonymousauth
         oss2.Bucket = oss2_bucket
         oss2.Service = oss2_service
+
+
+def test_list_objects_pages():
+    """Tests pycosio.oss._OSSSystem._list_objects pagination"""
+    from pycosio.storage.oss import _OSSSystem
+
+    markers = []
+
+    class Object:
+        """oss2.models.SimplifiedObjectInfo"""
+
+        def __init__(self, key):
+            self.key = key
+
+    class ListResult:
+        """oss2.models.ListObjectsResult"""
+
+        def __init__(self, page):
+            self.object_list = [
+                Object('object%d%d' % (page, index)) for index in range(2)]
+            self.prefix_list = []
+            self.next_marker = str(page + 1) if page < 2 else ''
+
+    class Bucket:
+        """oss2.Bucket"""
+
+        @staticmethod
+        def list_objects(prefix=None, marker='', **_):
+            """oss2.Bucket.list_objects"""
+            assert prefix == 'dir/'
+            markers.append(marker)
+            return ListResult(int(marker or 0))
+
+    system = _OSSSystem(storage_parameters=dict(
+        endpoint='https://oss-region.aliyuncs.com'))
+    system._get_bucket = lambda _: Bucket()
+
+    assert [name for name, _ in system._list_objects(
+        dict(bucket_name='bucket'), 'dir/', None)] == [
+        'object00', 'object01', 'object10', 'object11', 'object20',
+        'object21']
+    assert markers == ['', '1', '2']
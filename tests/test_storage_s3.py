@@ -36,10 +36,24 @@ def test_handle_client_error():
         with _handle_client_error():
             raise ClientError(response, 'testing')
 
+    # Transient errors
+    from botocore.exceptions import EndpointConnectionError
+    from pycosio.storage.s3 import S3RawIO
+    assert not S3RawIO._is_transient_error(ClientError(response, 'testing'))
+    response['Error']['Code'] = 'SlowDown'
+    assert S3RawIO._is_transient_error(ClientError(response, 'testing'))
+    response['Error']['Code'] = 'ErrorCode'
+    response['ResponseMetadata'] = {'HTTPStatusCode': 503}
+    assert S3RawIO._is_transient_error(ClientError(response, 'testing'))
+    assert S3RawIO._is_transient_error(
+        EndpointConnectionError(endpoint_url='url'))
+    assert not S3RawIO._is_transient_error(ObjectNotFoundError())
+
 
 def test_mocked_storage():
     """Tests pycosio.s3 with a mock"""
     from datetime import datetime
+    from hashlib import md5
     from io import BytesIO, UnsupportedOperation
 
     from pycosio.storage.s3 import S3RawIO, _S3System, S3BufferedIO
@@ -51,6 +65,7 @@ def test_mocked_storage():
     from tests.storage_mock import ObjectStorageMock
 
     # Mocks client
+    contents_md5 = []
 
     def raise_404():
         """Raise 404 error"""
@@ -71,6 +86,8 @@ def test_mocked_storage():
         raise_404, raise_416, raise_500, format_date=datetime.fromtimestamp)
 
     no_head = False
+    upload_errors = []
+    aborted = []
 
     class Client:
         """boto3.client"""
@@ -93,8 +110,11 @@ def test_mocked_storage():
             return storage_mock.head_object(Bucket, Key)
 
         @staticmethod
-        def put_object(Bucket=None, Key=None, Body=None, **_):
+        def put_object(Bucket=None, Key=None, Body=None, ContentMD5=None,
+                       **_):
             """boto3.client.put_object"""
+            if ContentMD5 is not None:
+                contents_md5.append(ContentMD5)
             storage_mock.put_object(Bucket, Key, Body, new_file=True)
 
         @staticmethod
@@ -125,20 +145,24 @@ def test_mocked_storage():
             storage_mock.delete_locator(Bucket)
 
         @staticmethod
-        def list_objects_v2(Bucket=None, Prefix=None, MaxKeys=None, **_):
+        def list_objects_v2(Bucket=None, Prefix=None, MaxKeys=None,
+                            Delimiter=None, **_):
             """boto3.client.list_objects_v2"""
             objects = []
+            headers, prefixes = storage_mock.get_locator_delimited(
+                Bucket, prefix=Prefix, limit=MaxKeys, delimiter=Delimiter)
 
-            for name, header in storage_mock.get_locator(
-                    Bucket, prefix=Prefix, limit=MaxKeys,
-                    raise_404_if_empty=False).items():
-
+            for name, header in headers.items():
                 header['Key'] = name
                 objects.append(header)
 
-            if not objects:
-                return dict()
-            return dict(Contents=objects)
+            response = dict()
+            if objects:
+                response['Contents'] = objects
+            if prefixes:
+                response['CommonPrefixes'] = [
+                    dict(Prefix=prefix) for prefix in prefixes]
+            return response
 
         @staticmethod
         def list_buckets():
@@ -155,6 +179,11 @@ def test_mocked_storage():
             """boto3.client.create_multipart_upload"""
             return dict(UploadId=123)
 
+        @staticmethod
+        def abort_multipart_upload(UploadId=None, **_):
+            """boto3.client.abort_multipart_upload"""
+            aborted.append(UploadId)
+
         @staticmethod
         def complete_multipart_upload(
                 Bucket=None, Key=None, MultipartUpload=None,
@@ -170,11 +199,26 @@ def test_mocked_storage():
 
             storage_mock.concat_objects(Bucket, Key, parts)
 
+        @staticmethod
+        def upload_part_copy(Bucket=None, Key=None, PartNumber=None,
+                             CopySource=None, CopySourceRange=None,
+                             UploadId=None, **_):
+            """boto3.client.upload_part_copy"""
+            assert UploadId == 123
+            return dict(CopyPartResult=storage_mock.put_object(
+                Bucket, Key + str(PartNumber), storage_mock.get_object(
+                    CopySource['Bucket'], CopySource['Key'],
+                    header=dict(Range=CopySourceRange))))
+
         @staticmethod
         def upload_part(Bucket=None, Key=None, PartNumber=None,
-                        Body=None, UploadId=None, **_):
+                        Body=None, UploadId=None, ContentMD5=None, **_):
             """boto3.client.upload_part"""
             assert UploadId == 123
+            if upload_errors:
+                raise upload_errors.pop()
+            if ContentMD5 is not None:
+                contents_md5.append(ContentMD5)
             return storage_mock.put_object(
                 Bucket, Key + str(PartNumber), Body)
 
@@ -194,7 +238,7 @@ def test_mocked_storage():
     # Tests
     try:
         # Init mocked system
-        system = _S3System()
+        system = _S3System(header_cache=60)
         storage_mock.attach_io_system(system)
 
         # Tests
@@ -220,7 +264,95 @@ def test_mocked_storage():
                 system.getsize(file_path)
             no_head = False
 
+            # Test: Parts are uploaded with checksums
+            from pycosio._core.checksum import content_md5
+            del contents_md5[:]
+            file_path = tester.base_dir_path + 'file_checksum.dat'
+            with S3BufferedIO(file_path, 'wb', checksum=True,
+                              buffer_size=S3BufferedIO.MINIMUM_BUFFER_SIZE
+                              ) as file:
+                file.write(b'0' * (S3BufferedIO.MINIMUM_BUFFER_SIZE + 10))
+            assert sorted(contents_md5) == sorted([
+                content_md5(b''),
+                content_md5(b'0' * S3BufferedIO.MINIMUM_BUFFER_SIZE),
+                content_md5(b'0' * 10)])
+
+            # Test: Objects smaller than buffer are uploaded with checksum
+            del contents_md5[:]
+            with S3BufferedIO(file_path, 'wb', checksum=True) as file:
+                file.write(b'0' * 10)
+            assert contents_md5 == [content_md5(b''), content_md5(b'0' * 10)]
+
+            # Test: Raw multipart uploads are uploaded with checksums
+            del contents_md5[:]
+            with S3RawIO(file_path, 'wb', checksum=True) as file:
+                file.MULTIPART_UPLOAD_SIZE = 32
+                file.write(b'0' * 40)
+            assert sorted(contents_md5) == sorted([
+                content_md5(b''), content_md5(b'0' * 32),
+                content_md5(b'0' * 8)])
+
+            # Test: Multipart upload aborted on any error
+            file_path = tester.base_dir_path + 'file_abort.dat'
+            file = S3RawIO(file_path, 'wb')
+            file.MULTIPART_UPLOAD_SIZE = 32
+            file.write(b'0' * 100)
+            upload_errors.append(ValueError())
+            with pytest.raises(OSError):
+                file.flush()
+            assert aborted == [123]
+            file.close()
+
+            # Test: MD5 from ETag
+            etag = '"%s"' % md5(b'').hexdigest()
+            assert system._getmd5_from_header(
+                dict(ETag=etag)) == md5(b'').hexdigest()
+            assert system._getmd5_from_header(
+                dict(ETag=etag, ServerSideEncryption='aws:kms')) is None
+            assert system._getmd5_from_header(
+                dict(ETag=etag, SSECustomerAlgorithm='AES256')) is None
+            assert system._getmd5_from_header(dict(ETag='"abc-2"')) is None
+            assert system._getmd5_from_header(dict()) is None
+
     # Restore mocked functions
     finally:
         boto3.client = boto3_client
         boto3.session.Session = boto3_session_session
+
+
+def test_list_objects_pages():
+    """Tests pycosio.s3._S3System._list_objects pagination"""
+    from pycosio.storage.s3 import _S3System
+
+    requests = []
+
+    class Client:
+        """boto3.client"""
+
+        @staticmethod
+        def list_objects_v2(ContinuationToken=None, **kwargs):
+            """boto3.client.list_objects_v2"""
+            requests.append((ContinuationToken, kwargs))
+            page = int(ContinuationToken or 0)
+            response = dict(Contents=[
+                dict(Key='object%d%d' % (page, index)) for index in range(2)])
+            if page < 2:
+                response['NextContinuationToken'] = str(page + 1)
+            return response
+
+    system = _S3System()
+    system._client = Client()
+
+    assert [name for name, _ in system._list_objects(
+        dict(Bucket='bucket'), 'dir/', None)] == [
+        'object00', 'object01', 'object10', 'object11', 'object20',
+        'object21']
+    assert [token for token, _ in requests] == [None, '1', '2']
+    for _, kwargs in requests:
+        assert kwargs == dict(Bucket='bucket', Prefix='dir/')
+
+    # Tests no prefetch when number of entries is limited
+    del requests[:]
+    assert next(system._list_objects(
+        dict(Bucket='bucket'), 'dir/', 2))[0] == 'object00'
+    assert [token for token, _ in requests] == [None]
@@ -1,5 +1,7 @@
 # coding=utf-8
 """Test pycosio.storage.swift"""
+from io import BytesIO
+
 import pytest
 
 UNSUPPORTED_OPERATIONS = (
@@ -36,6 +38,14 @@ def test_handle_client_exception():
         with _handle_client_exception():
             raise ClientException('error', http_status=500)
 
+    # Transient errors
+    from pycosio.storage.swift import SwiftRawIO
+    assert SwiftRawIO._is_transient_error(
+        ClientException('error', http_status=500))
+    assert not SwiftRawIO._is_transient_error(
+        ClientException('error', http_status=416))
+    assert not SwiftRawIO._is_transient_error(ClientException('error'))
+
 
 def test_mocked_storage():
     """Tests pycosio.swift with a mock"""
@@ -74,10 +84,14 @@ def test_mocked_storage():
             return '###',
 
         @staticmethod
-        def get_object(container, obj, headers=None, **_):
+        def get_object(container, obj, headers=None, resp_chunk_size=None,
+                       **_):
             """swiftclient.client.Connection.get_object"""
-            return (storage_mock.head_object(container, obj),
-                    storage_mock.get_object(container, obj, header=headers))
+            content = storage_mock.get_object(container, obj, header=headers)
+            if resp_chunk_size:
+                # Streamed response
+                content = BytesIO(content)
+            return storage_mock.head_object(container, obj), content
 
         @staticmethod
         def head_object(container, obj, **_):
@@ -135,14 +149,22 @@ def test_mocked_storage():
             storage_mock.copy_object(obj, destination, src_locator=container)
 
         @staticmethod
-        def get_container(container, limit=None, prefix=None, **_):
+        def get_container(container, limit=None, prefix=None, delimiter=None,
+                          **_):
             """swiftclient.client.Connection.get_container"""
             objects = []
+            headers, prefixes = storage_mock.get_locator_delimited(
+                container, prefix=prefix, limit=limit, delimiter=delimiter,
+                raise_404_if_empty=True)
 
-            for name, header in storage_mock.get_locator(
-                    container, prefix=prefix, limit=limit).items():
+            for name, header in headers.items():
                 header['name'] = name
                 objects.append(header)
+            for prefix in prefixes:
+                objects.append(dict(subdir=prefix))
+
+            # Sub directories are listed in lexicographic order with objects
+            objects.sort(key=lambda obj: obj.get('name', obj.get('subdir')))
 
             return storage_mock.head_locator(container), objects
 